@@ -0,0 +1,44 @@
+"""add transcription jobs
+
+Revision ID: 3f1c9a7e2b40
+Revises: e6fd101d9bd0
+Create Date: 2026-10-18 10:12:31.482113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a7e2b40'
+down_revision: Union[str, Sequence[str], None] = 'e6fd101d9bd0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('transcription_jobs',
+    sa.Column('id', sa.String(length=32), nullable=False),
+    sa.Column('question_id', sa.Integer(), nullable=False),
+    sa.Column('language', sa.String(length=10), nullable=False),
+    sa.Column('audio_path', sa.String(length=255), nullable=False),
+    sa.Column('status', sa.String(length=10), nullable=False),
+    sa.Column('answer_id', sa.Integer(), nullable=True),
+    sa.Column('result', sa.Text(), nullable=False),
+    sa.Column('error', sa.Text(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['answer_id'], ['answers.id'], ondelete='SET NULL'),
+    sa.ForeignKeyConstraint(['question_id'], ['questions.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_transcription_jobs_status'), 'transcription_jobs', ['status'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_transcription_jobs_status'), table_name='transcription_jobs')
+    op.drop_table('transcription_jobs')
@@ -0,0 +1,35 @@
+"""add lookup indexes
+
+Revision ID: 9b2d4e6f1a73
+Revises: 3f1c9a7e2b40
+Create Date: 2026-10-18 11:02:44.913204
+
+analytics.answer_id / reports.session_id 는 UNIQUE 제약이 이미 인덱스를 만들므로 추가하지 않음
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b2d4e6f1a73'
+down_revision: Union[str, Sequence[str], None] = '3f1c9a7e2b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_questions_session_id', 'questions', ['session_id'], unique=False)
+    op.create_index('ix_answers_question_id_id', 'answers', ['question_id', 'id'], unique=False)
+    op.create_index('ix_sessions_user_created', 'sessions', ['user_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_sessions_user_company_created', 'sessions', ['user_id', 'company', 'created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_sessions_user_company_created', table_name='sessions')
+    op.drop_index('ix_sessions_user_created', table_name='sessions')
+    op.drop_index('ix_answers_question_id_id', table_name='answers')
+    op.drop_index('ix_questions_session_id', table_name='questions')
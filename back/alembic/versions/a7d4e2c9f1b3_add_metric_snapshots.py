@@ -0,0 +1,46 @@
+"""add metric snapshots
+
+Revision ID: a7d4e2c9f1b3
+Revises: f3c81a6d9e27
+Create Date: 2026-10-18 18:21:47.903512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d4e2c9f1b3'
+down_revision: Union[str, Sequence[str], None] = 'f3c81a6d9e27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('metric_snapshots',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('session_id', sa.Integer(), nullable=False),
+    sa.Column('question_id', sa.Integer(), nullable=False),
+    sa.Column('elapsed_sec', sa.Float(), nullable=False),
+    sa.Column('filler_ratio', sa.Float(), nullable=False),
+    sa.Column('wpm', sa.Float(), nullable=False),
+    sa.Column('sentiment', sa.String(length=20), nullable=False),
+    sa.Column('keyword_hit_rate', sa.Float(), nullable=False),
+    sa.Column('clarity_score', sa.Float(), nullable=False),
+    sa.Column('coherence_score', sa.Float(), nullable=False),
+    sa.Column('source', sa.String(length=10), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['question_id'], ['questions.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['session_id'], ['sessions.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_metric_snapshots_session_question_elapsed', 'metric_snapshots', ['session_id', 'question_id', 'elapsed_sec'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_metric_snapshots_session_question_elapsed', table_name='metric_snapshots')
+    op.drop_table('metric_snapshots')
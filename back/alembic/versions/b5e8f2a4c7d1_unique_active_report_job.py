@@ -0,0 +1,40 @@
+"""unique active report job per session
+
+Revision ID: b5e8f2a4c7d1
+Revises: a7d4e2c9f1b3
+Create Date: 2026-10-18 21:40:12.318274
+
+이미 한 세션에 진행 중 작업이 여럿이면 가장 최근 것만 남기고 나머지는 failed 로 돌린 뒤 인덱스 생성
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e8f2a4c7d1'
+down_revision: Union[str, Sequence[str], None] = 'a7d4e2c9f1b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE = sa.text("status IN ('queued', 'running')")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "UPDATE report_jobs SET status = 'failed', error = 'superseded' "
+        "WHERE status IN ('queued', 'running') AND EXISTS ("
+        "SELECT 1 FROM report_jobs AS newer WHERE newer.session_id = report_jobs.session_id "
+        "AND newer.status IN ('queued', 'running') "
+        "AND (newer.created_at > report_jobs.created_at "
+        "OR (newer.created_at = report_jobs.created_at AND newer.id > report_jobs.id)))"
+    )
+    op.create_index('uq_report_jobs_active_session', 'report_jobs', ['session_id'], unique=True,
+                    sqlite_where=ACTIVE, postgresql_where=ACTIVE)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('uq_report_jobs_active_session', table_name='report_jobs')
@@ -0,0 +1,42 @@
+"""add question bank
+
+Revision ID: d81b3f6c2e95
+Revises: c47e2a9d5b18
+Create Date: 2026-10-18 14:05:52.208317
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd81b3f6c2e95'
+down_revision: Union[str, Sequence[str], None] = 'c47e2a9d5b18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('question_bank',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('text', sa.Text(), nullable=False),
+    sa.Column('text_hash', sa.String(length=64), nullable=False),
+    sa.Column('role', sa.String(length=50), nullable=False),
+    sa.Column('level', sa.String(length=50), nullable=False),
+    sa.Column('difficulty', sa.String(length=20), nullable=False),
+    sa.Column('company', sa.String(length=255), nullable=False),
+    sa.Column('stack', sa.String(length=255), nullable=False),
+    sa.Column('rubric_keywords', sa.String(length=255), nullable=False),
+    sa.Column('source', sa.String(length=10), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('text_hash')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('question_bank')
@@ -0,0 +1,30 @@
+"""add transcription job model size
+
+Revision ID: e5a92c7b4f36
+Revises: d81b3f6c2e95
+Create Date: 2026-10-18 15:11:40.730294
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a92c7b4f36'
+down_revision: Union[str, Sequence[str], None] = 'd81b3f6c2e95'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('transcription_jobs') as batch_op:
+        batch_op.add_column(sa.Column('model_size', sa.String(length=20), nullable=False, server_default=''))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('transcription_jobs') as batch_op:
+        batch_op.drop_column('model_size')
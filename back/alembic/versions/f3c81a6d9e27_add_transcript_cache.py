@@ -0,0 +1,44 @@
+"""add transcript cache
+
+Revision ID: f3c81a6d9e27
+Revises: e5a92c7b4f36
+Create Date: 2026-10-18 17:02:13.418655
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c81a6d9e27'
+down_revision: Union[str, Sequence[str], None] = 'e5a92c7b4f36'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('transcript_cache',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('audio_hash', sa.String(length=64), nullable=False),
+    sa.Column('model_size', sa.String(length=20), nullable=False),
+    sa.Column('language', sa.String(length=10), nullable=False),
+    sa.Column('transcript', sa.Text(), nullable=False),
+    sa.Column('duration_sec', sa.Float(), nullable=False),
+    sa.Column('stt_sec', sa.Float(), nullable=False),
+    sa.Column('hits', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('audio_hash', 'model_size', 'language', name='uq_transcript_cache_key')
+    )
+    with op.batch_alter_table('transcription_jobs') as batch_op:
+        batch_op.add_column(sa.Column('audio_hash', sa.String(length=64), nullable=False, server_default=''))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('transcription_jobs') as batch_op:
+        batch_op.drop_column('audio_hash')
+    op.drop_table('transcript_cache')
@@ -1,11 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
-from typing import Optional
-from sqlalchemy.orm import Session as OrmSession
+from typing import List, Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import SessionLocal
+from app.db.session import get_db, get_write_db
 from app.db import models as m
-from app.services.analyze import analyze
+from app.db.bulk import upsert_analytics, analytics_rows
+from app.services.analyze import analyze, analyze_batch, batch_results
+from app.services.rubric_cache import rubric_cache
 
 router = APIRouter()
 
@@ -15,29 +18,21 @@ class AnswerCreate(BaseModel):
     transcript: str
     duration_sec: Optional[float] = 0.0
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 @router.post("", summary="Submit an answer (text/audio) and run basic analysis")
-def create_answer(payload: AnswerCreate, db: OrmSession = Depends(get_db)):
-    q = db.get(m.Question, payload.question_id)
-    if not q:
+async def create_answer(payload: AnswerCreate, db: AsyncSession = Depends(get_write_db)):
+    rub = await rubric_cache.get(payload.question_id)  # 보통 캐시 적중(질문 조회 왕복 없음)
+    if not rub:
         raise HTTPException(404, "Question not found")
 
     a = m.Answer(
-        question_id=q.id,
+        question_id=rub.question_id,
         type=payload.type,
         transcript=payload.transcript,
         duration_sec=payload.duration_sec or 0.0,
     )
-    db.add(a); db.commit(); db.refresh(a)
+    db.add(a); await db.flush()
 
-    rubric_keywords = [s.strip() for s in (q.rubric_keywords or "").split(",") if s.strip()]
-    result = analyze(a.transcript, rubric_keywords, a.duration_sec)
+    result = analyze(a.transcript, rub.keywords, a.duration_sec)
 
     an = m.Analytics(
         answer_id=a.id,
@@ -48,12 +43,37 @@ def create_answer(payload: AnswerCreate, db: OrmSession = Depends(get_db)):
         clarity_score=result["clarity_score"],
         coherence_score=result["coherence_score"],
     )
-    db.add(an); db.commit(); db.refresh(an)
+    db.add(an); await db.commit()
     return {"answer_id": a.id, "analytics": result}
 
+@router.post("/batch", summary="Submit many answers at once (single transaction, vectorized analysis)")
+async def create_answers_batch(payload: List[AnswerCreate], db: AsyncSession = Depends(get_write_db)):
+    if not payload:
+        return []
+    qids = {p.question_id for p in payload}
+    rubrics = {qid: rub.keywords for qid, rub in (await rubric_cache.get_many(qids)).items()}
+    missing = sorted(qids - rubrics.keys())
+    if missing:
+        raise HTTPException(404, f"Question not found: {missing}")
+
+    answers = [
+        m.Answer(question_id=p.question_id, type=p.type, transcript=p.transcript, duration_sec=p.duration_sec or 0.0)
+        for p in payload
+    ]
+    db.add_all(answers); await db.flush()  # id 확보(커밋은 한 번)
+
+    results = batch_results(analyze_batch(
+        [a.transcript for a in answers],
+        [rubrics[a.question_id] for a in answers],
+        [a.duration_sec for a in answers],
+    ))
+    await upsert_analytics(db, analytics_rows([a.id for a in answers], results))
+    await db.commit()
+    return [{"answer_id": a.id, "analytics": r} for a, r in zip(answers, results)]
+
 @router.get("/{answer_id}/analytics", summary="Get analytics for an answer")
-def get_analytics(answer_id: int, db: OrmSession = Depends(get_db)):
-    an = db.query(m.Analytics).filter(m.Analytics.answer_id == answer_id).first()
+async def get_analytics(answer_id: int, db: AsyncSession = Depends(get_db)):
+    an = await db.scalar(select(m.Analytics).where(m.Analytics.answer_id == answer_id))
     if not an:
         raise HTTPException(404, "Analytics not found")
     return {
@@ -66,3 +86,7 @@ def get_analytics(answer_id: int, db: OrmSession = Depends(get_db)):
         "coherence_score": an.coherence_score,
         "created_at": an.created_at.isoformat(),
     }
+
+@router.get("/rubric-cache/stats", summary="Question rubric cache size / hit ratio")
+def rubric_cache_stats():
+    return rubric_cache.stats()
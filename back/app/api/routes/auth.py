@@ -1,34 +1,32 @@
 from fastapi import APIRouter, HTTPException, Depends, Request
 from fastapi.responses import JSONResponse
-from sqlalchemy.orm import Session as OrmSession
-from app.db.session import SessionLocal
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from app.db.session import get_db, get_write_db
 from app.db import models as m
 from app.core.auth import hash_pw, verify_pw, make_tokens, set_auth_cookies, clear_auth, current_user_id
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try: yield db
-    finally: db.close()
-
 @router.post("/auth/signup")
-def signup(payload: dict, db: OrmSession = Depends(get_db)):
+async def signup(payload: dict, db: AsyncSession = Depends(get_write_db)):
     email = (payload.get("email") or "").strip().lower()
     pw = payload.get("password") or ""
     if not email or not pw: raise HTTPException(400, "email/password required")
-    if db.query(m.User).filter(m.User.email == email).first():
+    password_hash = await run_in_threadpool(hash_pw, pw)  # bcrypt 는 CPU 를 오래 쓰므로 threadpool 에서, 쓰기 연결을 잡기 전에
+    if await db.scalar(select(m.User.id).where(m.User.email == email)):
         raise HTTPException(409, "email already exists")
-    u = m.User(email=email, password_hash=hash_pw(pw))
-    db.add(u); db.commit(); db.refresh(u)
+    u = m.User(email=email, password_hash=password_hash)
+    db.add(u); await db.commit()
     return {"ok": True}
 
 @router.post("/auth/login")
-def login(payload: dict, db: OrmSession = Depends(get_db)):
+async def login(payload: dict, db: AsyncSession = Depends(get_db)):
     email = (payload.get("email") or "").strip().lower()
     pw = payload.get("password") or ""
-    u = db.query(m.User).filter(m.User.email == email).first()
-    if not u or not verify_pw(pw, u.password_hash):
+    u = await db.scalar(select(m.User).where(m.User.email == email))
+    if not u or not await run_in_threadpool(verify_pw, pw, u.password_hash):  # bcrypt 검증도 threadpool 에서
         raise HTTPException(401, "이메일 또는 비밀번호가 올바르지 않습니다")
     access, refresh = make_tokens(u.id)
     resp = JSONResponse({"ok": True})
@@ -42,8 +40,8 @@ def logout():
     return resp
 
 @router.get("/me")
-def me(request: Request, db: OrmSession = Depends(get_db)):
+async def me(request: Request, db: AsyncSession = Depends(get_db)):
     uid = current_user_id(request)
     if not uid: raise HTTPException(401, "unauthorized")
-    u = db.get(m.User, uid)
+    u = await db.get(m.User, uid)
     return {"id": u.id, "email": u.email}
@@ -1,16 +1,33 @@
  # app/api/routes/realtime.py
+import asyncio
 import json
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from sqlalchemy.orm import Session as OrmSession
+import logging
+from typing import Optional
 
-from app.db.session import SessionLocal
+from fastapi import APIRouter, Depends, Query, WebSocket, WebSocketDisconnect, status
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.auth import current_user_id
+from app.db.session import AsyncSessionLocal, get_db
 from app.db import models as m
-from app.services.analyze import analyze
+from app.services import metric_buffer
+from app.services.analyze import AnalyzerState
+from app.services.metric_buffer import MetricBuffer
+from app.services.realtime_bus import broker, session_channel
+from app.services.rubric_cache import rubric_cache
+from app.services.stt_live import LiveTranscriber
 
 router = APIRouter()
+log = logging.getLogger("realtime")
 
-def get_db() -> OrmSession:
-    return SessionLocal()
+async def _rubric_keywords(session_id: int, qid: int):
+    """
+    질문 루브릭 키워드(질문이 없거나 다른 세션 질문이면 None). 프로세스 공용 캐시라 연결이 바뀌어도 다시 읽지 않음
+    세션 확인을 여기서 해야 다른 세션 타임라인에 지표 스냅샷이 섞이지 않음(FK 실패로 묶음째 버려지지도 않음)
+    """
+    rub = await rubric_cache.get(qid)
+    return rub.keywords if rub and rub.session_id == session_id else None
 
 def make_tip(result: dict) -> str:
     tips = []
@@ -28,39 +45,199 @@ def make_tip(result: dict) -> str:
 
 @router.websocket("/realtime/{session_id}")
 async def realtime_feedback(websocket: WebSocket, session_id: int):
+    """
+    텍스트 메시지(JSON): 전사/타이핑 텍스트를 직접 보내거나, 음성 스트림 제어
+      { "question_id": 123, "text": "현재까지 전사/타이핑 누적본", "elapsed_sec": 17.2 }
+      { "question_id": 123, "delta": "새로 덧붙은 부분만", "elapsed_sec": 18.0 }
+      { "type": "audio_start", "question_id": 123, "format": "pcm_s16le|pcm_f32le|opus", "sample_rate": 16000, "language": "ko" }
+      { "type": "audio_end" }
+    바이너리 메시지: audio_start 이후의 오디오 프레임 → 서버에서 실시간 전사(확정된 텍스트만 분석에 반영)
+    """
     await websocket.accept()
-    db = get_db()
-    q_cache: dict[int, list[str]] = {}  # question_id -> rubric keywords
+    states: dict[int, AnalyzerState] = {}  # question_id -> 증분 분석 상태(루브릭 키워드 포함)
+    send_lock = asyncio.Lock()  # 수신 루프와 전사 태스크가 동시에 보냄
+    live: Optional[LiveTranscriber] = None
+    snapshots = MetricBuffer(session_id).start()  # 지표 타임라인(모아서 일괄 저장)
+
+    async def send(payload: dict) -> None:
+        async with send_lock:
+            await websocket.send_text(json.dumps(payload, ensure_ascii=False))
+
+    async def state_for(qid: int) -> Optional[AnalyzerState]:
+        if qid not in states:
+            kws = await _rubric_keywords(session_id, qid)
+            if kws is None:
+                await send({"error": "Question not found"})
+                return None
+            states[qid] = AnalyzerState(kws)
+        return states[qid]
+
+    async def send_feedback(qid: int, st: AnalyzerState, elapsed_sec: float, **extra) -> None:
+        result = st.result(elapsed_sec)
+        snapshots.add(qid, elapsed_sec, result, source=extra.get("source", "text"))
+        payload = {
+            "question_id": qid,
+            "elapsed_sec": elapsed_sec,
+            "metrics": result,
+            "tip": make_tip(result),
+            **extra,
+        }
+        await send(payload)
+        try:  # 같은 세션을 보는 관찰자(다른 워커 포함)에게 — 기다리지 않음(느린 redis 가 피드백을 막지 않게)
+            broker.publish_nowait(session_channel(session_id), {"session_id": session_id, **payload})
+        except Exception:
+            log.exception("realtime publish failed (session %s)", session_id)
+
+    async def start_audio(data: dict) -> Optional[LiveTranscriber]:
+        qid = int(data["question_id"])
+        st = await state_for(qid)
+        if st is None:
+            return None
+
+        async def on_text(committed: str, partial: str, audio_sec: float) -> None:
+            st.feed(committed)
+            await send_feedback(qid, st, audio_sec, source="audio", committed=committed, partial=partial)
+
+        async def on_error(detail: str) -> None:
+            await send({"error": detail, "question_id": qid})  # 프레임 하나가 깨져도 스트림은 계속
+
+        try:
+            return LiveTranscriber(
+                on_text,
+                fmt=str(data.get("format") or "pcm_s16le"),
+                sample_rate=int(data.get("sample_rate") or 16000),
+                language=str(data.get("language") or "ko"),
+                model_size=data.get("model_size") or None,
+                on_error=on_error,
+            ).start()
+        except (ValueError, ImportError) as e:
+            await send({"error": f"audio_start failed: {e}"})
+            return None
 
     try:
         while True:
-            raw = await websocket.receive_text()
-            data = json.loads(raw)
+            msg = await websocket.receive()
+            if msg["type"] == "websocket.disconnect":
+                break
+
+            if msg.get("bytes") is not None:
+                if live is None:
+                    await send({"error": "audio_start required before audio frames"})
+                elif await live.push(msg["bytes"]):
+                    await send({"type": "backpressure"})  # 전사가 밀려 수신을 잠시 멈췄음
+                continue
+
+            data = json.loads(msg.get("text") or "{}")
+            kind = data.get("type")
+            if kind == "audio_start":
+                if live is not None:
+                    await live.finish()
+                live = await start_audio(data)
+                continue
+            if kind == "audio_end":
+                if live is not None:
+                    await live.finish()  # 남은 가설 확정 + 마지막 피드백
+                    live = None
+                    await send({"type": "audio_end"})
+                continue
 
-            # 기대 형식:
-            # { "question_id": 123, "text": "현재까지 전사/타이핑 누적본", "elapsed_sec": 17.2 }
             qid = int(data["question_id"])
-            text = str(data.get("text", "") or "")
             elapsed_sec = float(data.get("elapsed_sec") or 0.0)
-
-            if qid not in q_cache:
-                q = db.get(m.Question, qid)
-                if not q:
-                    await websocket.send_text(json.dumps({"error": "Question not found"}))
-                    continue
-                kws = [s.strip() for s in (q.rubric_keywords or "").split(",") if s.strip()]
-                q_cache[qid] = kws
-
-            result = analyze(text, q_cache[qid], elapsed_sec)
-            payload = {
-                "question_id": qid,
-                "elapsed_sec": elapsed_sec,
-                "metrics": result,
-                "tip": make_tip(result),
-            }
-            await websocket.send_text(json.dumps(payload, ensure_ascii=False))
+            st = await state_for(qid)
+            if st is None:
+                continue
+            if "delta" in data:
+                st.feed(str(data.get("delta") or ""))
+            else:
+                st.update(str(data.get("text", "") or ""))
+            await send_feedback(qid, st, elapsed_sec)
 
     except WebSocketDisconnect:
         pass
     finally:
-        db.close()
+        if live is not None:
+            await live.close()
+        await snapshots.close()  # 남은 스냅샷 저장
+
+@router.websocket("/realtime/{session_id}/watch")
+async def realtime_watch(websocket: WebSocket, session_id: int):
+    """
+    관찰자(면접관 화면 등): 지원자 연결이 어느 워커에 있든 그 세션의 실시간 지표를 받음
+    구독이 준비되면 {"type": "subscribed"} 를 먼저 보냄. 느리면 중간 지표는 건너뛰고 최신 것부터
+    로그인 필요 + 본인 세션만(GET /sessions/{id} 와 같은 규칙). 아니면 핸드셰이크를 1008 로 거절
+    """
+    uid = current_user_id(websocket)
+    async with AsyncSessionLocal() as db:
+        s = await db.get(m.Session, session_id) if uid else None
+    if s is None or (s.user_id and s.user_id != uid):
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+    await websocket.accept()
+    async with broker.subscribe(session_channel(session_id)) as sub:
+        await websocket.send_text(json.dumps({"type": "subscribed", "session_id": session_id}))
+
+        async def pump():
+            async for msg in sub:
+                await websocket.send_text(json.dumps(msg, ensure_ascii=False))
+
+        task = asyncio.create_task(pump())
+        try:
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass  # 관찰자 메시지는 무시, 연결 종료만 감지
+        except WebSocketDisconnect:
+            pass
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+@router.get("/realtime/bus/stats", summary="Realtime pub/sub channels / subscribers / dropped messages")
+def realtime_bus_stats():
+    return broker.stats()
+
+@router.get("/sessions/{session_id}/metrics/timeline", summary="Replay realtime metric timeline (downsampled)")
+async def metrics_timeline(
+    session_id: int,
+    question_id: Optional[int] = Query(None),
+    max_points: int = Query(200, ge=10, le=5000, description="질문별 최대 점 수"),
+    db: AsyncSession = Depends(get_db),
+):
+    """
+    질문별 지표 타임라인(elapsed_sec 순). 점이 max_points 보다 많으면 구간을 나눠 구간마다 마지막 스냅샷만
+    (지표는 그 시점까지의 누적값이라 구간의 마지막 값이 그 구간을 대표)
+    """
+    S = m.MetricSnapshot
+    where = [S.session_id == session_id]
+    if question_id is not None:
+        where.append(S.question_id == question_id)
+    spans = (await db.execute(
+        select(S.question_id, func.min(S.elapsed_sec), func.max(S.elapsed_sec), func.count())
+        .where(*where).group_by(S.question_id).order_by(S.question_id)
+    )).all()
+
+    questions = []
+    for qid, lo, hi, n in spans:
+        stmt = select(S).where(S.session_id == session_id, S.question_id == qid)
+        if n > max_points and hi > lo:
+            width = (hi - lo) / (max_points - 1)
+            bucket = func.floor((S.elapsed_sec - lo) / width)  # 0 … max_points-1 (CAST 는 PostgreSQL 에서 반올림)
+            last_ids = (
+                select(func.max(S.id))
+                .where(S.session_id == session_id, S.question_id == qid)
+                .group_by(bucket)
+            )
+            stmt = stmt.where(S.id.in_(last_ids))
+        rows = (await db.scalars(stmt.order_by(S.elapsed_sec, S.id))).all()
+        questions.append({
+            "question_id": qid,
+            "points": n,
+            "returned": len(rows),
+            "timeline": [
+                {"elapsed_sec": r.elapsed_sec, "source": r.source, **{f: getattr(r, f) for f in metric_buffer.FIELDS}}
+                for r in rows
+            ],
+        })
+    return {"session_id": session_id, "questions": questions}
+
+@router.get("/realtime/metrics/stats", summary="Metric snapshot write-behind counters")
+def metrics_buffer_stats():
+    return metric_buffer.stats()
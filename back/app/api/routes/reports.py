@@ -1,95 +1,82 @@
 from fastapi import APIRouter, HTTPException, Depends
-from sqlalchemy.orm import Session as OrmSession
-from typing import List, Dict, Any
+from fastapi.responses import JSONResponse, StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Dict, Any
+import json
 
-from app.db.session import SessionLocal
+from app.db.session import AsyncWriteSessionLocal, get_db, get_write_db
 from app.db import models as m
-from app.services.report_llm import generate_report
+from app.services.report_cache import report_cache
+from app.services.report_jobs import collect_session_payload, create_job, get_job, save_report
+from app.services.report_llm import stream_report
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+async def _collect_session_payload(db: AsyncSession, session_id: int) -> Dict[str, Any]:
+    payload = await collect_session_payload(db, session_id)
+    if payload is None:
+        raise HTTPException(404, "Session not found")
+    return payload
 
-def _collect_session_payload(db: OrmSession, session_id: int) -> Dict[str, Any]:
-    s = db.get(m.Session, session_id)
-    if not s:
+async def _ensure_answers(db: AsyncSession, session_id: int) -> None:
+    if not await db.get(m.Session, session_id):
         raise HTTPException(404, "Session not found")
+    has_answer = await db.scalar(
+        select(m.Answer.id)
+        .join(m.Question, m.Question.id == m.Answer.question_id)
+        .where(m.Question.session_id == session_id)
+        .limit(1)
+    )
+    if not has_answer:
+        raise HTTPException(400, "No answers found for this session")
 
-    # Q/A + Analytics 모으기
-    q_rows: List[m.Question] = db.query(m.Question).filter(m.Question.session_id == s.id).all()
-    qids = [q.id for q in q_rows]
-    # answers 중 가장 최신(질문당 1개 가정이 아니므로 우선 전체 수집)
-    a_rows = db.query(m.Answer).filter(m.Answer.question_id.in_(qids)).all()
-    a_map = {}
-    for a in a_rows:
-        # 질문당 마지막 답변으로 갱신
-        a_map[a.question_id] = a
-    payload_qas = []
-    for q in q_rows:
-        a = a_map.get(q.id)
-        if not a:
-            continue
-        an = db.query(m.Analytics).filter(m.Analytics.answer_id == a.id).first()
-        payload_qas.append({
-            "question": q.text,
-            "rubric_keywords": q.rubric_keywords,
-            "answer": a.transcript,
-            "analytics": {
-                "filler_ratio": getattr(an, "filler_ratio", 0.0),
-                "wpm": getattr(an, "wpm", 0.0),
-                "sentiment": getattr(an, "sentiment", "neu"),
-                "keyword_hit_rate": getattr(an, "keyword_hit_rate", 0.0),
-                "clarity_score": getattr(an, "clarity_score", 2.5),
-                "coherence_score": getattr(an, "coherence_score", 2.5),
-            }
-        })
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
 
-    return {
-        "session": {
-            "id": s.id,
-            "role": s.role,
-            "job_title": s.job_title,
-            "level": s.level,
-            "difficulty": s.difficulty,
-            "created_at": s.created_at.isoformat(),
-        },
-        "qas": payload_qas,
-    }
+@router.post("/sessions/{session_id}/report", summary="Queue final report generation (202 + job id)")
+async def create_report(session_id: int, db: AsyncSession = Depends(get_write_db)):
+    """LLM 호출은 백그라운드 작업에서. 진행 상황은 GET /reports/jobs/{job_id}"""
+    await _ensure_answers(db, session_id)
+    job = await create_job(db, session_id)
+    return JSONResponse({"session_id": session_id, "job_id": job.id, "status": job.status}, status_code=202)
 
-@router.post("/sessions/{session_id}/report", summary="Generate & save final report")
-def create_report(session_id: int, db: OrmSession = Depends(get_db)):
-    payload = _collect_session_payload(db, session_id)
-    if not payload["qas"]:
-        raise HTTPException(400, "No answers found for this session")
+@router.get("/sessions/{session_id}/report/stream", summary="Generate final report, streaming Markdown (SSE)")
+async def stream_session_report(session_id: int, db: AsyncSession = Depends(get_db)):
+    """
+    event: delta → {"field": "summary_md"|"suggestions_md", "text": 조각} (도착하는 대로)
+    event: done  → 저장된 리포트 {"report_id","total_score","summary_md","suggestions_md","source"}
+    """
+    await _ensure_answers(db, session_id)
+    payload = await _collect_session_payload(db, session_id)
 
-    data = generate_report(payload)
-    rep = m.Report(
-        session_id=session_id,
-        total_score=data.get("total_score", 0.0),
-        summary_md=data.get("summary_md", "## 요약\n- 데이터 부족"),
-        suggestions_md=data.get("suggestions_md", "## 다음 연습 질문\n- 데이터 부족"),
-    )
-    # upsert 형태(세션당 1개)
-    old = db.query(m.Report).filter(m.Report.session_id == session_id).first()
-    if old:
-        old.total_score = rep.total_score
-        old.summary_md = rep.summary_md
-        old.suggestions_md = rep.suggestions_md
-        db.commit()
-        db.refresh(old)
-        return {"session_id": session_id, "report_id": old.id, "total_score": old.total_score}
+    async def gen():
+        async for event, data in stream_report(payload):
+            if event == "delta":
+                yield _sse("delta", data)
+                continue
+            report = {k: v for k, v in data.items() if k != "source"}
+            # 스트리밍 응답은 요청 의존성(db)이 정리된 뒤에도 이어질 수 있어 별도 세션 사용
+            async with AsyncWriteSessionLocal() as wdb:
+                rep = await save_report(wdb, session_id, report)
+            yield _sse("done", {"session_id": session_id, "report_id": rep.id, **data})
+
+    return StreamingResponse(gen(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+@router.get("/reports/jobs/{job_id}", summary="Get report generation job status")
+async def get_report_job(job_id: str):
+    job = await get_job(job_id)
+    if not job:
+        raise HTTPException(404, "Job not found")
+    return job
 
-    db.add(rep); db.commit(); db.refresh(rep)
-    return {"session_id": session_id, "report_id": rep.id, "total_score": rep.total_score}
+@router.get("/reports/cache/stats", summary="Report cache hit/miss counters")
+def report_cache_stats():
+    return report_cache.stats()
 
 @router.get("/sessions/{session_id}/report", summary="Get final report")
-def get_report(session_id: int, db: OrmSession = Depends(get_db)):
-    rep = db.query(m.Report).filter(m.Report.session_id == session_id).first()
+async def get_report(session_id: int, db: AsyncSession = Depends(get_db)):
+    rep = await db.scalar(select(m.Report).where(m.Report.session_id == session_id))
     if not rep:
         raise HTTPException(404, "Report not found")
     return {
@@ -2,12 +2,18 @@
 from fastapi import APIRouter, Depends, HTTPException, Request, Query
 from pydantic import BaseModel, Field
 from typing import List, Optional
-from sqlalchemy.orm import Session as OrmSession
+from datetime import datetime
+import base64
+from sqlalchemy import select, func, distinct, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.services.llm import generate_questions
-from app.db.session import SessionLocal
+from app.services.rubric_cache import rubric_cache
+from app.db.session import get_db, get_write_db
+from app.db.bulk import insert_questions
 from app.db import models as m
 from app.core.auth import current_user_id  # ✅ 로그인 사용자 확인
+from app.core.config import settings
 
 router = APIRouter()
 
@@ -20,84 +26,116 @@ class SessionCreate(BaseModel):
     difficulty: str = Field("medium", examples=["easy", "medium", "hard"])
     company: str = Field("", examples=["Acme Corp", "Naver", "Kakao"])
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
 # --------------------------------------------
 # 1) 세션 생성 + 예상 질문 생성 (로그인 필요)
 # POST /api/sessions
 # --------------------------------------------
 @router.post("", summary="Create a session & generate interview questions")
-def create_session(
+async def create_session(
     payload: SessionCreate,
     request: Request,
-    db: OrmSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
+    wdb: AsyncSession = Depends(get_write_db),
 ):
     # ✅ 로그인 사용자 확인
     uid = current_user_id(request)
     if not uid:
         raise HTTPException(status_code=401, detail="unauthorized")
 
-    # 1) 세션 저장 (회사명 + user_id 포함)
-    s = m.Session(
+    # 1) 질문 선택 (질문 은행 색인, 최근 세션에서 받은 질문은 제외 — 이력 전체를 훑지 않도록 상한)
+    #    조회/선택은 읽기 세션에서: 쓰기 연결(하나뿐)은 아래 INSERT 때만 잡음
+    recent = (
+        select(m.Session.id)
+        .where(m.Session.user_id == uid)
+        .order_by(m.Session.created_at.desc(), m.Session.id.desc())
+        .limit(settings.QUESTION_SEEN_SESSIONS)
+    )
+    seen = (await db.scalars(  # 오래된 것부터(남은 질문이 모자라면 이 순서로 다시 냄)
+        select(m.Question.text)
+        .where(m.Question.session_id.in_(recent))
+        .group_by(m.Question.text)
+        .order_by(func.min(m.Question.id))
+    )).all()
+    company = (payload.company or "").strip()
+    questions = generate_questions(
         role=payload.role,
         job_title=payload.job_title,
         level=payload.level,
+        stack=payload.stack,
         difficulty=payload.difficulty,
-        user_id=uid,                # ✅ 소유자
-        company=(payload.company or "").strip(),  # ✅ 회사명
-        # 선택: 스키마에 stack 컬럼이 있다면 아래 같이 저장
-        # stack=",".join(payload.stack),
+        company=company,
+        seen=seen,
     )
-    db.add(s)
-    db.commit()
-    db.refresh(s)
 
-    # 2) 질문 생성
-    questions = generate_questions(
+    # 2) 세션 저장 (회사명 + user_id 포함)
+    s = m.Session(
         role=payload.role,
         job_title=payload.job_title,
         level=payload.level,
-        stack=payload.stack,
         difficulty=payload.difficulty,
+        user_id=uid,                # ✅ 소유자
+        company=company,            # ✅ 회사명
+        # 선택: 스키마에 stack 컬럼이 있다면 아래 같이 저장
+        # stack=",".join(payload.stack),
     )
+    wdb.add(s)
+    await wdb.flush()  # id 확보(커밋은 질문까지 넣고 한 번)
 
-    # 3) 질문 저장
-    for q in questions:
-        db.add(m.Question(
-            session_id=s.id,
-            text=q["text"],
-            rubric_keywords=",".join(q["rubric_keywords"]),
-            difficulty=q["difficulty"],
-        ))
-    db.commit()
+    # 3) 질문 저장 (INSERT … RETURNING 한 번) + 세션과 같은 트랜잭션으로 커밋
+    ids = await insert_questions(wdb, s.id, questions)
+    await wdb.commit()
+    rubric_cache.prime(s.id, ((qid, q["rubric_keywords"]) for qid, q in zip(ids, questions)))
+    questions = [{"id": qid, **q} for qid, q in zip(ids, questions)]
 
     return {"session_id": s.id, "questions": questions}
 
 # --------------------------------------------
-# 2) 내 세션 목록 조회(회사 필터 가능)
-# GET /api/sessions/mine?company=Kakao
+# 2) 내 세션 목록 조회(회사 필터 가능, 키셋 페이지네이션)
+# GET /api/sessions/mine?company=Kakao&limit=20&cursor=...
+#  - 응답: {"items": [...], "next_cursor": "..."|null}
+#  - 다음 페이지는 next_cursor 를 그대로 cursor 로 넘김(OFFSET 스캔 없음)
 # --------------------------------------------
+def _encode_cursor(created_at: datetime, sid: int) -> str:
+    return base64.urlsafe_b64encode(f"{created_at.isoformat()}|{sid}".encode()).decode()
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    try:
+        at, sid = base64.urlsafe_b64decode(cursor.encode()).decode().rsplit("|", 1)
+        return datetime.fromisoformat(at), int(sid)
+    except Exception:
+        raise HTTPException(400, "invalid cursor")
+
 @router.get("/mine", summary="List my sessions (optionally filter by company)")
-def list_my_sessions(
+async def list_my_sessions(
     request: Request,
     company: Optional[str] = Query(None, description="회사명 필터"),
-    db: OrmSession = Depends(get_db),
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    with_counts: bool = Query(False, description="세션별 질문 수/답변한 질문 수 포함"),
+    db: AsyncSession = Depends(get_db),
 ):
     uid = current_user_id(request)
     if not uid:
         raise HTTPException(status_code=401, detail="unauthorized")
 
-    q = db.query(m.Session).filter(m.Session.user_id == uid).order_by(m.Session.created_at.desc())
+    S = m.Session
+    stmt = (
+        select(S.id, S.company, S.role, S.job_title, S.level, S.difficulty, S.created_at)
+        .where(S.user_id == uid)
+        .order_by(S.created_at.desc(), S.id.desc())
+        .limit(limit + 1)  # 다음 페이지 존재 여부 확인용 1개 더
+    )
     if company:
-        q = q.filter(m.Session.company == company)
+        stmt = stmt.where(S.company == company)
+    if cursor:
+        at, sid = _decode_cursor(cursor)
+        stmt = stmt.where(or_(S.created_at < at, and_(S.created_at == at, S.id < sid)))
+
+    rows = (await db.execute(stmt)).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
 
-    rows = q.all()
-    return [
+    items = [
         {
             "id": r.id,
             "company": r.company,
@@ -109,6 +147,25 @@ def list_my_sessions(
         }
         for r in rows
     ]
+    if with_counts and items:
+        counts = {
+            sid: (nq, na)
+            for sid, nq, na in await db.execute(
+                select(
+                    m.Question.session_id,
+                    func.count(distinct(m.Question.id)),
+                    func.count(distinct(m.Answer.question_id)),
+                )
+                .outerjoin(m.Answer, m.Answer.question_id == m.Question.id)
+                .where(m.Question.session_id.in_([it["id"] for it in items]))
+                .group_by(m.Question.session_id)
+            )
+        }
+        for it in items:
+            it["question_count"], it["answered_count"] = counts.get(it["id"], (0, 0))
+
+    next_cursor = _encode_cursor(rows[-1].created_at, rows[-1].id) if has_more else None
+    return {"items": items, "next_cursor": next_cursor}
 
 # --------------------------------------------
 # 3) 세션 상세 조회(기존 있으면 유지)
@@ -116,23 +173,23 @@ def list_my_sessions(
 #  - 본인 세션만 접근 가능하게 보호
 # --------------------------------------------
 @router.get("/{session_id}", summary="Get a session with its questions")
-def get_session(
+async def get_session(
     session_id: int,
     request: Request,
-    db: OrmSession = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     uid = current_user_id(request)
     if not uid:
         raise HTTPException(status_code=401, detail="unauthorized")
 
-    s = db.get(m.Session, session_id)
+    s = await db.get(m.Session, session_id)
     if not s:
         raise HTTPException(404, "Session not found")
     if s.user_id and s.user_id != uid:
         raise HTTPException(403, "forbidden")
 
     # 질문 포함해서 반환
-    qs = db.query(m.Question).filter(m.Question.session_id == session_id).all()
+    qs = (await db.scalars(select(m.Question).where(m.Question.session_id == session_id))).all()
     return {
         "id": s.id,
         "company": s.company,
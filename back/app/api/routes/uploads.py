@@ -1,79 +1,329 @@
-from fastapi import APIRouter, File, UploadFile, Form, Depends, HTTPException
-from sqlalchemy.orm import Session as OrmSession
-import os, uuid, shutil
+from fastapi import APIRouter, File, UploadFile, Form, HTTPException, Query, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from dataclasses import dataclass
+from typing import Optional
+import asyncio, hashlib, json, os, time, uuid
 
-from app.db.session import SessionLocal
-from app.db import models as m
-from app.services.stt import transcribe_audio
-from app.services.analyze import analyze
+from app.core.config import settings
+from app.db.session import AsyncWriteSessionLocal
+from app.services import audio_prep
+from app.services.stt import AudioSource, transcribe_segments
+from app.services.stt_pool import stt_pool, SttQueueFull
+from app.services import transcript_cache
+from app.services.rubric_cache import Rubric, rubric_cache
+from app.services.transcript_cache import transcribe_cached
+from app.services.transcription_jobs import (
+    TERMINAL, create_job, enqueue, get_job, job_event, save_answer, watching,
+)
 
 router = APIRouter()
 UPLOAD_DIR = "uploads/audio"
 os.makedirs(UPLOAD_DIR, exist_ok=True)
 
-def get_db():
-    db = SessionLocal()
+AUDIO_EXT = {
+    "audio/wav": ".wav", "audio/x-wav": ".wav", "audio/mpeg": ".mp3", "audio/mp4": ".m4a",
+    "audio/aac": ".aac", "audio/flac": ".flac", "audio/ogg": ".ogg", "audio/webm": ".webm",
+}
+
+def _model_size(size: Optional[str]) -> str:
+    try:
+        return stt_pool.registry.resolve(size or None)
+    except ValueError as e:
+        raise HTTPException(400, str(e))
+
+def _busy() -> HTTPException:
+    return HTTPException(503, "STT queue is full, retry later", headers={"Retry-After": "5"})
+
+def _too_large() -> HTTPException:
+    return HTTPException(413, f"Audio file exceeds {settings.UPLOAD_MAX_MB}MB")
+
+@dataclass
+class StoredAudio:
+    fname: str
+    path: str
+    audio_hash: str                # sha256(전사 캐시 키이자 파일 이름)
+    created: bool                  # False 면 같은 내용의 파일이 이미 있어 그걸 재사용
+    data: Optional[bytes] = None   # 짧은 업로드는 메모리 사본(디코딩 때 파일을 다시 읽지 않음)
+
+def _finalize(tmp_path: str, audio_hash: str, ext: str) -> tuple[str, str, bool]:
+    """
+    임시 이름으로 받은 파일을 내용 해시 이름으로(같은 내용이 이미 있으면 새 파일은 버림)
+    hard link 는 대상이 있으면 실패하므로, 같은 내용이 동시에 올라와도 새로 만든(created) 요청은 하나뿐
+    """
+    fname = f"{audio_hash}{ext}"
+    path = os.path.join(UPLOAD_DIR, fname)
     try:
-        yield db
-    finally:
-        db.close()
+        os.link(tmp_path, path)  # 같은 파일시스템 안이라 추가 I/O 없음
+        created = True
+    except FileExistsError:
+        created = False
+    os.remove(tmp_path)
+    return fname, path, created
+
+def _discard(stored: StoredAudio) -> None:
+    if stored.created:  # 다른 답변이 함께 쓰는 파일은 지우지 않음
+        os.remove(stored.path)
+        if os.path.exists(audio_prep.pcm_path(stored.path)):
+            os.remove(audio_prep.pcm_path(stored.path))
+
+def _save_upload(file: UploadFile, path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "wb") as f:
+        while chunk := file.file.read(settings.UPLOAD_CHUNK_KB * 1024):
+            h.update(chunk)
+            f.write(chunk)
+    return h.hexdigest()
+
+async def _store_upload(file: UploadFile) -> StoredAudio:
+    if file.size is not None and file.size > settings.UPLOAD_MAX_MB * 1024 * 1024:
+        raise _too_large()
+    ext = os.path.splitext(file.filename or "")[1].lower()
+    if ext not in (".wav", ".mp3", ".m4a", ".aac", ".flac", ".ogg", ".webm"):
+        # Whisper는 ffmpeg 경유로 대부분 지원하지만, 확장자 체크는 간단히
+        pass
+    tmp = os.path.join(UPLOAD_DIR, f"{uuid.uuid4().hex}.part")
+    audio_hash = await run_in_threadpool(_save_upload, file, tmp)
+    fname, path, created = await run_in_threadpool(_finalize, tmp, audio_hash, ext or ".wav")
+    return StoredAudio(fname, path, audio_hash, created)
+
+async def _stream_body(request: Request, ext: str) -> StoredAudio:
+    """
+    요청 바디를 임시 스풀 없이 최종 경로에 바로 기록(UPLOAD_CHUNK_KB 단위로 모아 쓰기)
+    크기 상한은 받는 도중에 검사. UPLOAD_INMEMORY_MAX_MB 이하면 내용도 돌려줘 디코딩 때 다시 읽지 않게 함
+    """
+    max_bytes = settings.UPLOAD_MAX_MB * 1024 * 1024
+    if int(request.headers.get("content-length") or 0) > max_bytes:
+        raise _too_large()
+    keep_limit = settings.UPLOAD_INMEMORY_MAX_MB * 1024 * 1024
+    chunk_size = settings.UPLOAD_CHUNK_KB * 1024
+
+    path = os.path.join(UPLOAD_DIR, f"{uuid.uuid4().hex}.part")
+    f = await run_in_threadpool(open, path, "wb")
+    h = hashlib.sha256()
+    kept: Optional[list] = []
+    buf, total = bytearray(), 0
+    try:
+        async for part in request.stream():
+            total += len(part)
+            if total > max_bytes:
+                raise _too_large()
+            buf += part
+            h.update(part)
+            if len(buf) >= chunk_size:
+                await run_in_threadpool(f.write, buf)
+                if kept is not None:
+                    kept.append(bytes(buf))
+                buf = bytearray()
+            if total > keep_limit:
+                kept = None
+        if buf:
+            await run_in_threadpool(f.write, buf)
+            if kept is not None:
+                kept.append(bytes(buf))
+    except BaseException:
+        f.close()
+        os.remove(path)
+        raise
+    f.close()
+    if not total:
+        os.remove(path)
+        raise HTTPException(400, "Empty audio body")
+    audio_hash = h.hexdigest()
+    fname, path, created = await run_in_threadpool(_finalize, path, audio_hash, ext)
+    return StoredAudio(fname, path, audio_hash, created, b"".join(kept) if kept is not None else None)
+
+async def _save_detached(q: Rubric, transcript: str, duration_sec: float, path: str) -> dict:
+    # 저장할 때만 쓰기 세션을 연다(스트리밍 응답은 요청 의존성 db 가 정리된 뒤에도 이어질 수 있음)
+    async with AsyncWriteSessionLocal() as db:
+        return await save_answer(db, q, transcript, duration_sec, path)
+
+def _stream_segments(path: AudioSource, language: str, model=None):
+    t0 = time.perf_counter()
+    segments, duration = transcribe_segments(path, language=language, model=model)
+    yield {"type": "start", "duration_sec": duration}
+    for seg in segments:
+        yield {"type": "segment", **seg}
+    yield {"type": "end", "stt_sec": time.perf_counter() - t0}  # 워커 실행 시간(캐시 지표용, 클라이언트에는 안 보냄)
 
 @router.post("/audio", summary="Upload audio file → STT → save Answer → return analytics")
 async def upload_audio(
     question_id: int = Form(...),
     language: str = Form("ko"),
+    mode: str = Form("sync", pattern="^(sync|async)$"),
+    model_size: Optional[str] = Form(None),
+    chunked: Optional[bool] = Form(None),
     file: UploadFile = File(...),
-    db: OrmSession = Depends(get_db),
 ):
-    q = db.get(m.Question, question_id)
+    """
+    mode=async 이면 전사를 백그라운드 작업으로 돌리고 job id 를 바로 반환(202)
+    model_size: tiny/base/small/medium 중 선택(기본 WHISPER_MODEL_SIZE). 빠른 초안은 tiny, 최종본은 medium 등
+    chunked: 긴 오디오 청크 병렬 전사 강제(true)/해제(false). 생략하면 길이(STT_LONG_AUDIO_SEC)로 자동
+    """
+    size = _model_size(model_size)
+    q = await rubric_cache.get(question_id)  # 질문 존재 확인 + 루브릭(캐시)
     if not q:
         raise HTTPException(404, "Question not found")
+    if mode == "sync" and stt_pool.full():
+        raise _busy()  # 저장 전에 미리 거절
 
-    # 1) 파일 저장
-    ext = os.path.splitext(file.filename or "")[1].lower()
-    if ext not in (".wav", ".mp3", ".m4a", ".aac", ".flac", ".ogg", ".webm"):
-        # Whisper는 ffmpeg 경유로 대부분 지원하지만, 확장자 체크는 간단히
-        pass
-    fname = f"{uuid.uuid4().hex}{ext or '.wav'}"
-    path = os.path.join(UPLOAD_DIR, fname)
-    with open(path, "wb") as f:
-        shutil.copyfileobj(file.file, f)
+    # 1) 파일 저장(내용 해시 계산 + 같은 파일이면 재사용)
+    stored = await _store_upload(file)
+    return await _transcribe_and_save(q, stored, language, mode, size, chunked)
+
+@router.post("/audio/raw", summary="Stream raw audio body to disk → STT → save Answer → return analytics")
+async def upload_audio_raw(
+    request: Request,
+    question_id: int = Query(...),
+    language: str = Query("ko"),
+    mode: str = Query("sync", pattern="^(sync|async)$"),
+    model_size: Optional[str] = Query(None),
+    chunked: Optional[bool] = Query(None),
+    filename: Optional[str] = Query(None),
+):
+    """
+    multipart 대신 바디 자체가 오디오(Content-Type: audio/webm 등). 옵션은 쿼리 파라미터로(/audio 와 같음)
+    바디를 최종 경로에 한 번만 쓰고, 짧은 파일은 다시 읽지 않고 메모리에서 바로 디코딩
+    """
+    size = _model_size(model_size)
+    q = await rubric_cache.get(question_id)  # 질문 존재 확인 + 루브릭(캐시)
+    if not q:
+        raise HTTPException(404, "Question not found")
+    if mode == "sync" and stt_pool.full():
+        raise _busy()
+
+    ext = os.path.splitext(filename or "")[1].lower()
+    if not ext:
+        ext = AUDIO_EXT.get(request.headers.get("content-type", "").split(";")[0].strip(), ".wav")
+    stored = await _stream_body(request, ext)
+    return await _transcribe_and_save(q, stored, language, mode, size, chunked)
 
-    # 2) 전사
+async def _transcribe_and_save(
+    q: Rubric,
+    stored: StoredAudio,
+    language: str,
+    mode: str,
+    size: str,
+    chunked: Optional[bool],
+):
+    """저장된 업로드 → (async) 작업 등록 / (sync) 전사 + 답변 저장. 같은 오디오를 전사한 적 있으면 캐시 재사용"""
+    if mode == "async":
+        async with AsyncWriteSessionLocal() as wdb:
+            job = await create_job(wdb, q.question_id, stored.path, language, model_size=size, audio_hash=stored.audio_hash)
+        enqueue(job.id)
+        return JSONResponse({"job_id": job.id, "status": job.status, "file": stored.fname}, status_code=202)
+
+    # 2) 전사 (STT 워커 풀에서 실행, 긴 오디오는 청크 병렬). 짧은 업로드는 메모리 사본을 바로 디코딩
+    source = stored.data if stored.data is not None else stored.path
     try:
-        transcript, duration_sec = transcribe_audio(path, language=language)
+        transcript, duration_sec = await transcribe_cached(
+            source, stored.audio_hash, language, size, chunked=chunked, audio_path=stored.path
+        )
+    except SttQueueFull:
+        _discard(stored)
+        raise _busy()
     except Exception as e:
         raise HTTPException(500, f"STT failed: {e}")
 
-    # 3) 답변 저장
-    a = m.Answer(
-        question_id=q.id,
-        type="audio",
-        transcript=transcript,
-        audio_url=path,
-        duration_sec=duration_sec,
-    )
-    db.add(a); db.commit(); db.refresh(a)
-
-    # 4) 분석
-    rubric_keywords = [s.strip() for s in (q.rubric_keywords or "").split(",") if s.strip()]
-    result = analyze(transcript, rubric_keywords, duration_sec)
-
-    an = m.Analytics(
-        answer_id=a.id,
-        filler_ratio=result["filler_ratio"],
-        wpm=result["wpm"],
-        sentiment=result["sentiment"],
-        keyword_hit_rate=result["keyword_hit_rate"],
-        clarity_score=result["clarity_score"],
-        coherence_score=result["coherence_score"],
-    )
-    db.add(an); db.commit(); db.refresh(an)
-
-    return {
-        "answer_id": a.id,
-        "duration_sec": duration_sec,
-        "transcript": transcript,
-        "analytics": result,
-        "file": fname,
-    }
+    # 3) 답변 저장 + 4) 분석 — 전사 동안 쓰기 연결을 잡지 않도록 저장 때만 쓰기 세션
+    out = await _save_detached(q, transcript, duration_sec, stored.path)
+    return {**out, "file": stored.fname}
+
+@router.post("/audio/stream", summary="Upload audio file → stream STT segments (NDJSON) → save Answer")
+async def upload_audio_stream(
+    question_id: int = Form(...),
+    language: str = Form("ko"),
+    model_size: Optional[str] = Form(None),
+    file: UploadFile = File(...),
+):
+    """
+    한 줄에 JSON 하나(NDJSON):
+      {"type":"start","duration_sec":..} → {"type":"segment","text","start","end","avg_logprob"} ...
+      → {"type":"done","answer_id",..,"analytics"} 또는 {"type":"error","detail"}
+    """
+    size = _model_size(model_size)
+    q = await rubric_cache.get(question_id)  # 질문 존재 확인 + 루브릭(캐시)
+    if not q:
+        raise HTTPException(404, "Question not found")
+    if stt_pool.full():
+        raise _busy()
+    stored = await _store_upload(file)
+    fname, path = stored.fname, stored.path
+
+    async def gen():
+        hit = await transcript_cache.lookup(stored.audio_hash, size, language) if settings.TRANSCRIPT_CACHE_ENABLED else None
+        if hit is not None:  # 전사한 적 있는 오디오: 결과 전체를 한 세그먼트로
+            transcript, duration_sec = hit
+            yield json.dumps({"type": "start", "duration_sec": duration_sec, "cached": True}) + "\n"
+            if transcript:
+                seg = {"type": "segment", "text": transcript, "start": 0.0, "end": round(duration_sec, 2), "avg_logprob": None}
+                yield json.dumps(seg, ensure_ascii=False) + "\n"
+            out = await _save_detached(q, transcript, duration_sec, path)
+            yield json.dumps({"type": "done", **out, "file": fname}, ensure_ascii=False) + "\n"
+            return
+
+        texts, duration_sec, stt_sec = [], 0.0, 0.0
+        source = await audio_prep.prepare(path, stored.data)  # 16kHz PCM(사이드카) 로 한 번만 디코딩
+        try:
+            async for item in stt_pool.stream(_stream_segments, source, language, model_size=size):
+                if item["type"] == "end":
+                    stt_sec = item["stt_sec"]
+                    continue
+                if item["type"] == "start":
+                    duration_sec = item["duration_sec"]
+                else:
+                    texts.append(item["text"])
+                yield json.dumps(item, ensure_ascii=False) + "\n"
+        except SttQueueFull:
+            yield json.dumps({"type": "error", "detail": "STT queue is full, retry later"}) + "\n"
+            return
+        except Exception as e:
+            yield json.dumps({"type": "error", "detail": f"STT failed: {e}"}, ensure_ascii=False) + "\n"
+            return
+        transcript = " ".join(texts).strip()
+        if settings.TRANSCRIPT_CACHE_ENABLED:
+            await transcript_cache.store(stored.audio_hash, size, language, transcript, duration_sec, stt_sec)
+        out = await _save_detached(q, transcript, duration_sec, path)
+        yield json.dumps({"type": "done", **out, "file": fname}, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(gen(), media_type="application/x-ndjson")
+
+@router.get("/jobs/{job_id}", summary="Get transcription job status")
+async def get_transcription_job(job_id: str):
+    job = await get_job(job_id)
+    if not job:
+        raise HTTPException(404, "Job not found")
+    return job
+
+@router.get("/jobs/{job_id}/events", summary="Stream transcription job status (SSE)")
+async def transcription_job_events(job_id: str):
+    if not await get_job(job_id):
+        raise HTTPException(404, "Job not found")
+
+    async def gen():
+        last = None
+        with watching(job_id):
+            while True:
+                ev = job_event(job_id)  # 조회 전에 등록해야 그 사이 변경을 놓치지 않음
+                job = await get_job(job_id)
+                if not job:
+                    return
+                if job["status"] != last:
+                    last = job["status"]
+                    yield f"event: status\ndata: {json.dumps(job, ensure_ascii=False)}\n\n"
+                if last in TERMINAL:
+                    return
+                try:
+                    await asyncio.wait_for(ev.wait(), timeout=15)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+
+    return StreamingResponse(gen(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+@router.get("/stt/stats", summary="STT worker pool queue depth / wait / run time")
+def stt_stats():
+    return stt_pool.stats()
+
+@router.get("/stt/cache/stats", summary="Transcript cache hit ratio / STT seconds saved")
+def stt_cache_stats():
+    return transcript_cache.stats()
@@ -4,15 +4,62 @@ class Settings(BaseSettings):
     APP_NAME: str = "AI Interview Service"
     DEBUG: bool = True
     DATABASE_URL: str = "sqlite:///./app.db"
+    DB_POOL_SIZE: int = 10        # 비동기 엔진 커넥션 풀
+    DB_MAX_OVERFLOW: int = 20
+    SQLITE_PROFILE: str = "wal"         # wal(WAL+PRAGMA 튜닝) | default(SQLite 기본값)
+    SQLITE_SINGLE_WRITER: bool = True   # SQLite 파일 DB 의 쓰기를 연결 하나로 모아 순서대로
+    SQLITE_WRITE_TIMEOUT_SEC: float = 30.0  # 쓰기 연결 차례를 기다리는 최대 시간
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_KB: int = 65536        # 연결당 페이지 캐시
+    SQLITE_MMAP_MB: int = 256
 
      # STT
     WHISPER_MODEL_SIZE: str = "small"
     WHISPER_DEVICE: str = "auto"
+    WHISPER_ALLOWED_SIZES: str = "tiny,base,small,medium"  # 요청별 model_size 로 고를 수 있는 크기
+    WHISPER_PRELOAD: str = "small"  # 시작 시 로드+워밍업할 크기(콤마 구분, 빈 값이면 지연 로드)
+    STT_MODEL_MEMORY_MB: int = 2048  # 로드된 모델 예상 메모리 합 상한(초과 시 LRU 로 내림)
+    STT_WORKERS: int = 2          # 전사 워커(스레드) 수 = 동시 전사 수. 모델은 레지스트리에서 워커끼리 공유
+    STT_QUEUE_SIZE: int = 8       # 대기열 상한(초과 시 503)
+    STT_LONG_AUDIO_SEC: float = 120.0   # 이 길이 이상이면 VAD 청크 병렬 전사
+    STT_CHUNK_SEC: float = 30.0
+    STT_CHUNK_OVERLAP_SEC: float = 1.0  # 무음 없이 긴 구간을 강제로 나눌 때 겹침
+    STT_LIVE_MODEL_SIZE: str = "base"   # websocket 실시간 전사 모델(WHISPER_ALLOWED_SIZES 중)
+    STT_LIVE_STEP_SEC: float = 1.0      # 새 오디오가 이만큼 쌓일 때마다 재전사
+    STT_LIVE_BUFFER_SEC: float = 20.0   # 미확정 롤링 버퍼 최대 길이
+    STT_LIVE_MAX_PENDING_FRAMES: int = 50  # 연결별 프레임 대기열 상한(초과 시 수신 대기)
+    UPLOAD_MAX_MB: int = 50          # 오디오 업로드 크기 상한(초과 시 413)
+    UPLOAD_CHUNK_KB: int = 1024      # 원본 바디 스트리밍 업로드의 디스크 쓰기 단위
+    UPLOAD_INMEMORY_MAX_MB: int = 8  # 이하 크기는 저장한 파일을 다시 읽지 않고 메모리에서 바로 디코딩
+    TRANSCRIPT_CACHE_ENABLED: bool = True  # 같은 오디오(내용 해시)+모델+언어는 전사 결과 재사용
+    AUDIO_PCM_CACHE: bool = True     # 업로드를 16kHz PCM 사이드카(.pcm16.npy)로 한 번만 디코딩해 재전사 때 재사용
+    METRICS_FLUSH_ROWS: int = 50          # 실시간 지표 스냅샷을 이만큼 모아 일괄 INSERT
+    METRICS_FLUSH_SEC: float = 5.0        # 또는 이 시간마다
+    METRICS_BUFFER_MAX_ROWS: int = 2000   # 연결별 버퍼 상한(넘치면 오래된 것부터 버림)
+    REALTIME_BROKER: str = "memory"       # memory(단일 프로세스) | redis(여러 워커/노드가 실시간 지표 공유, REDIS_URL)
+    REALTIME_SUB_QUEUE: int = 16          # 관찰자별 대기열 상한(느리면 최신 지표만 남김)
+    REALTIME_PUBLISH_QUEUE: int = 256     # redis 발행 대기열 상한(넘치면 오래된 것부터 버림)
+    REALTIME_PUBLISH_TIMEOUT_SEC: float = 0.5  # redis PUBLISH 한 번의 최대 대기
+    RUBRIC_CACHE_MAX_ITEMS: int = 10000   # 질문 루브릭 LRU 캐시 항목 수
+    QUESTION_SEEN_SESSIONS: int = 20      # 세션 생성 시 이 개수의 최근 세션에서 받은 질문만 제외
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8")
 
     LLM_PROVIDER: str = "none"
     OPENAI_API_KEY: str | None = None
     LLM_MODEL: str = "gpt-4o-mini"
+    OPENAI_BASE_URL: str = "https://api.openai.com/v1"
+    LLM_TIMEOUT_SEC: float = 60.0
+    LLM_MAX_CONNECTIONS: int = 10     # 공용 AsyncClient 동시 연결 상한
+    LLM_MAX_RETRIES: int = 3          # 429/5xx/네트워크 오류 재시도 횟수
+    LLM_BREAKER_FAILURES: int = 5     # 연속 실패 n 회 → 서킷 open
+    LLM_BREAKER_RESET_SEC: float = 30.0
+
+    # 리포트 캐시(LLM 결과)
+    REPORT_CACHE_BACKEND: str = "memory"        # memory | sqlite | redis | none
+    REPORT_CACHE_TTL_SEC: float = 7 * 24 * 3600
+    REPORT_CACHE_MAX_ITEMS: int = 256           # memory 백엔드 LRU 상한
+    REPORT_CACHE_PATH: str = "./report_cache.db"  # sqlite 백엔드 파일
+    REDIS_URL: str = "redis://localhost:6379/0"
 
 settings = Settings()
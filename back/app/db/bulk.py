@@ -0,0 +1,71 @@
+# app/db/bulk.py
+"""여러 행을 한 번에 쓰는 헬퍼(행마다 add/commit 하지 않도록)"""
+from typing import Any, Dict, List
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db import models as m
+
+ANALYTICS_FIELDS = ("filler_ratio", "wpm", "sentiment", "keyword_hit_rate", "clarity_score", "coherence_score")
+
+def _dialect_insert(db: AsyncSession):
+    name = db.bind.dialect.name
+    if name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        raise NotImplementedError(f"bulk upsert not supported on {name}")
+    return dialect_insert
+
+async def upsert_analytics(db: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+    """answer_id 기준 Analytics upsert (executemany 한 번). 커밋은 호출 측에서"""
+    if not rows:
+        return
+    dialect_insert = _dialect_insert(db)
+    stmt = dialect_insert(m.Analytics)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[m.Analytics.answer_id],
+        set_={f: getattr(stmt.excluded, f) for f in ANALYTICS_FIELDS},
+    )
+    await db.execute(stmt, rows)
+
+def analytics_rows(answer_ids: List[int], results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    return [{"answer_id": aid, **{f: r[f] for f in ANALYTICS_FIELDS}} for aid, r in zip(answer_ids, results)]
+
+async def insert_bank_questions(db: AsyncSession, rows: List[Dict[str, Any]]) -> List[m.BankQuestion]:
+    """질문 은행에 여러 행 삽입, text_hash 가 이미 있으면 건너뜀. 새로 들어간 행만 반환(커밋은 호출 측에서)"""
+    if not rows:
+        return []
+    dialect_insert = _dialect_insert(db)
+    stmt = dialect_insert(m.BankQuestion).values(rows).on_conflict_do_nothing(index_elements=[m.BankQuestion.text_hash])
+    return list((await db.scalars(stmt.returning(m.BankQuestion))).all())
+
+async def insert_questions(db: AsyncSession, session_id: int, questions: List[Dict[str, Any]]) -> List[int]:
+    """세션 질문 일괄 INSERT … RETURNING id (입력 순서 유지, 행별 flush 없음). 커밋은 호출 측에서"""
+    if not questions:
+        return []
+    rows = [
+        {
+            "session_id": session_id,
+            "text": q["text"],
+            "rubric_keywords": ",".join(q["rubric_keywords"]),
+            "difficulty": q["difficulty"],
+        }
+        for q in questions
+    ]
+    stmt = insert(m.Question).returning(m.Question.id, sort_by_parameter_order=True)
+    return list((await db.scalars(stmt, rows)).all())
+
+async def insert_transcript_cache(db: AsyncSession, row: Dict[str, Any]) -> None:
+    """전사 캐시 한 행 INSERT, 같은 (audio_hash, model_size, language) 가 이미 있으면 건너뜀. 커밋은 호출 측에서"""
+    stmt = _dialect_insert(db)(m.TranscriptCache).values(**row).on_conflict_do_nothing(
+        index_elements=[m.TranscriptCache.audio_hash, m.TranscriptCache.model_size, m.TranscriptCache.language]
+    )
+    await db.execute(stmt)
+
+async def insert_metric_snapshots(db: AsyncSession, rows: List[Dict[str, Any]]) -> None:
+    """실시간 지표 스냅샷 일괄 INSERT (executemany 한 번). 커밋은 호출 측에서"""
+    if rows:
+        await db.execute(insert(m.MetricSnapshot), rows)
@@ -1,5 +1,5 @@
 # app/db/models.py
-from sqlalchemy import String, Integer, DateTime, ForeignKey, Text, Float
+from sqlalchemy import String, Integer, DateTime, ForeignKey, Text, Float, Index, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
 from typing import Optional
@@ -18,6 +18,12 @@ class Session(Base):
 
     questions: Mapped[list["Question"]] = relationship(back_populates="session", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        # 내 세션 목록: user_id 필터 + created_at 최신순(+ 선택적 company 필터)
+        Index("ix_sessions_user_created", "user_id", "created_at", "id"),
+        Index("ix_sessions_user_company_created", "user_id", "company", "created_at", "id"),
+    )
+
 class Question(Base):
     __tablename__ = "questions"
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -28,6 +34,8 @@ class Question(Base):
 
     session: Mapped["Session"] = relationship(back_populates="questions")
 
+    __table_args__ = (Index("ix_questions_session_id", "session_id"),)
+
 class Answer(Base):
     __tablename__ = "answers"
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -41,6 +49,9 @@ class Answer(Base):
     question: Mapped["Question"] = relationship()
     analytics: Mapped["Analytics"] = relationship(back_populates="answer", cascade="all, delete-orphan", uselist=False)
 
+    # 질문별 답변 조회 + 질문별 최신 답변(max id)
+    __table_args__ = (Index("ix_answers_question_id_id", "question_id", "id"),)
+
 class Analytics(Base):
     __tablename__ = "analytics"
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
@@ -64,6 +75,84 @@ class Report(Base):
     suggestions_md: Mapped[str] = mapped_column(Text)   # 다음 연습 질문 등
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
+class TranscriptionJob(Base):
+    __tablename__ = "transcription_jobs"
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)  # uuid hex
+    question_id: Mapped[int] = mapped_column(ForeignKey("questions.id", ondelete="CASCADE"))
+    language: Mapped[str] = mapped_column(String(10), default="ko")
+    model_size: Mapped[str] = mapped_column(String(20), default="")  # "" = 기본 크기
+    audio_hash: Mapped[str] = mapped_column(String(64), default="")  # 오디오 sha256(전사 캐시 키)
+    audio_path: Mapped[str] = mapped_column(String(255))
+    status: Mapped[str] = mapped_column(String(10), default="queued", index=True)  # queued|running|done|failed
+    answer_id: Mapped[Optional[int]] = mapped_column(ForeignKey("answers.id", ondelete="SET NULL"), nullable=True)
+    result: Mapped[str] = mapped_column(Text, default="")  # 완료 시 응답 JSON
+    error: Mapped[str] = mapped_column(Text, default="")
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+_REPORT_JOB_ACTIVE = text("status IN ('queued', 'running')")
+
+class ReportJob(Base):
+    __tablename__ = "report_jobs"
+    __table_args__ = (
+        # 세션당 진행 중(queued|running) 작업은 하나만: 동시 POST 가 둘 다 만들지 못하게
+        Index("uq_report_jobs_active_session", "session_id", unique=True,
+              sqlite_where=_REPORT_JOB_ACTIVE, postgresql_where=_REPORT_JOB_ACTIVE),
+    )
+    id: Mapped[str] = mapped_column(String(32), primary_key=True)  # uuid hex
+    session_id: Mapped[int] = mapped_column(ForeignKey("sessions.id", ondelete="CASCADE"), index=True)
+    status: Mapped[str] = mapped_column(String(10), default="queued", index=True)  # queued|running|done|failed
+    report_id: Mapped[Optional[int]] = mapped_column(ForeignKey("reports.id", ondelete="SET NULL"), nullable=True)
+    error: Mapped[str] = mapped_column(Text, default="")
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class BankQuestion(Base):
+    """질문 은행: 세션 생성 시 태그로 골라 쓰는 미리 만들어 둔 질문"""
+    __tablename__ = "question_bank"
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    text: Mapped[str] = mapped_column(Text)
+    text_hash: Mapped[str] = mapped_column(String(64), unique=True)  # 정규화 텍스트 sha256(중복 방지)
+    role: Mapped[str] = mapped_column(String(50), default="")         # "" = 직무 공통
+    level: Mapped[str] = mapped_column(String(50), default="")
+    difficulty: Mapped[str] = mapped_column(String(20), default="")
+    company: Mapped[str] = mapped_column(String(255), default="")
+    stack: Mapped[str] = mapped_column(String(255), default="")       # 콤마 구분 태그(소문자)
+    rubric_keywords: Mapped[str] = mapped_column(String(255), default="")
+    source: Mapped[str] = mapped_column(String(10), default="seed")   # seed|llm
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+class TranscriptCache(Base):
+    """같은 오디오(내용 해시) + 모델 크기 + 언어의 전사 결과 재사용"""
+    __tablename__ = "transcript_cache"
+    __table_args__ = (UniqueConstraint("audio_hash", "model_size", "language", name="uq_transcript_cache_key"),)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    audio_hash: Mapped[str] = mapped_column(String(64))
+    model_size: Mapped[str] = mapped_column(String(20))
+    language: Mapped[str] = mapped_column(String(10))
+    transcript: Mapped[str] = mapped_column(Text, default="")
+    duration_sec: Mapped[float] = mapped_column(Float, default=0.0)
+    stt_sec: Mapped[float] = mapped_column(Float, default=0.0)  # 처음 전사에 든 시간(적중 시 절약분)
+    hits: Mapped[int] = mapped_column(Integer, default=0)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+class MetricSnapshot(Base):
+    """실시간 피드백 지표 타임라인(websocket 메시지마다 한 행, 묶어서 일괄 INSERT)"""
+    __tablename__ = "metric_snapshots"
+    __table_args__ = (Index("ix_metric_snapshots_session_question_elapsed", "session_id", "question_id", "elapsed_sec"),)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    session_id: Mapped[int] = mapped_column(ForeignKey("sessions.id", ondelete="CASCADE"))
+    question_id: Mapped[int] = mapped_column(ForeignKey("questions.id", ondelete="CASCADE"))
+    elapsed_sec: Mapped[float] = mapped_column(Float)
+    filler_ratio: Mapped[float] = mapped_column(Float)
+    wpm: Mapped[float] = mapped_column(Float)
+    sentiment: Mapped[str] = mapped_column(String(20))
+    keyword_hit_rate: Mapped[float] = mapped_column(Float)
+    clarity_score: Mapped[float] = mapped_column(Float)
+    coherence_score: Mapped[float] = mapped_column(Float)
+    source: Mapped[str] = mapped_column(String(10), default="text")  # text|audio
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
 class User(Base):
     __tablename__ = "users"
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
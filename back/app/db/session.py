@@ -1,6 +1,84 @@
-from sqlalchemy import create_engine
+from typing import AsyncIterator
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
+def async_url(url: str) -> str:
+    """동기 드라이버 URL → 비동기 드라이버 URL (sqlite → aiosqlite, postgresql → asyncpg)"""
+    scheme, rest = url.split("://", 1)
+    if scheme == "sqlite":
+        return f"sqlite+aiosqlite://{rest}"
+    if scheme in ("postgresql", "postgres", "postgresql+psycopg2"):
+        return f"postgresql+asyncpg://{rest}"
+    return url
+
+def _pool_options(url: str) -> dict:
+    if url.startswith("sqlite") and ":memory:" in url:
+        return {}
+    return {"pool_size": settings.DB_POOL_SIZE, "max_overflow": settings.DB_MAX_OVERFLOW}
+
+def _is_sqlite_file(url: str) -> bool:
+    return url.startswith("sqlite") and ":memory:" not in url
+
+def sqlite_pragmas() -> list[str]:
+    """SQLITE_PROFILE=wal 일 때 연결마다 거는 PRAGMA (default 면 SQLite 기본값 그대로)"""
+    if settings.SQLITE_PROFILE != "wal":
+        return []
+    return [
+        "PRAGMA journal_mode=WAL",            # 읽기와 쓰기가 서로 막지 않음
+        "PRAGMA synchronous=NORMAL",          # WAL 에서는 체크포인트 때만 fsync
+        f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}",  # 잠김이면 바로 실패하지 않고 대기
+        f"PRAGMA cache_size=-{settings.SQLITE_CACHE_KB}",          # 음수 = KiB 단위
+        f"PRAGMA mmap_size={settings.SQLITE_MMAP_MB * 1024 * 1024}",
+        "PRAGMA temp_store=MEMORY",
+    ]
+
+def _apply_pragmas(sync_engine) -> None:
+    pragmas = sqlite_pragmas()
+    if not pragmas:
+        return
+
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_conn, _record):
+        cur = dbapi_conn.cursor()
+        for p in pragmas:
+            cur.execute(p)
+        cur.close()
+
+# 동기 엔진: alembic / 관리 스크립트 / 테스트 픽스처용
 engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+# 비동기 엔진: 모든 라우트/백그라운드 작업(읽기는 풀 전체로 퍼짐)
+async_engine = create_async_engine(
+    async_url(settings.DATABASE_URL), pool_pre_ping=True, **_pool_options(settings.DATABASE_URL)
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
+# 쓰기 전용 엔진: SQLite 파일 DB 는 쓰기를 연결 하나로 모아 순서대로 처리(단일 writer)
+# SQLite 는 어차피 동시에 한 트랜잭션만 쓸 수 있어, 여러 연결이 쓰기 잠금을 두고 다투다
+# "database is locked" 가 나는 대신 풀 대기열에서 차례를 기다림. 다른 DB 는 같은 엔진 사용
+if _is_sqlite_file(settings.DATABASE_URL) and settings.SQLITE_SINGLE_WRITER:
+    async_write_engine = create_async_engine(
+        async_url(settings.DATABASE_URL), pool_pre_ping=True,
+        pool_size=1, max_overflow=0, pool_timeout=settings.SQLITE_WRITE_TIMEOUT_SEC,
+    )
+else:
+    async_write_engine = async_engine
+AsyncWriteSessionLocal = async_sessionmaker(async_write_engine, autoflush=False, expire_on_commit=False)
+
+if _is_sqlite_file(settings.DATABASE_URL):
+    for _e in {engine, async_engine.sync_engine, async_write_engine.sync_engine}:
+        _apply_pragmas(_e)
+
+async def get_db() -> AsyncIterator[AsyncSession]:
+    """조회용 세션"""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+async def get_write_db() -> AsyncIterator[AsyncSession]:
+    """쓰기(INSERT/UPDATE/commit)가 있는 라우트용 세션"""
+    async with AsyncWriteSessionLocal() as db:
+        yield db
@@ -11,12 +11,41 @@
 # app.include_router(api_router, prefix="/api")
 
 # app/main.py
+import asyncio
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.api import router as api_router
+from app.db.session import async_engine, async_write_engine
+from app.services.stt_models import model_registry, parse_sizes
+from app.services.stt_pool import stt_pool
+from app.services import metric_buffer, report_jobs, transcript_cache, transcription_jobs
+from app.services.llm_client import close_client
+from app.services.question_bank import question_bank
+from app.services.realtime_bus import broker
 
-app = FastAPI(title=settings.APP_NAME)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # STT 모델 미리 로드 + 워밍업(첫 업로드가 로드 시간을 떠안지 않도록)
+    await asyncio.to_thread(model_registry.preload, parse_sizes(settings.WHISPER_PRELOAD))
+    await question_bank.load()  # 질문 은행 → 메모리 색인
+    # 재시작 전 queued/running 작업 복구
+    await transcription_jobs.resume_pending_jobs()
+    await report_jobs.resume_pending_jobs()
+    yield
+    await transcription_jobs.cancel_running_jobs()
+    await report_jobs.cancel_running_jobs()
+    stt_pool.shutdown()
+    await close_client()
+    await broker.close()
+    await metric_buffer.drain()  # 끊긴 연결의 남은 지표 스냅샷 저장
+    await transcript_cache.flush_hits()  # 모아 둔 전사 캐시 적중 수
+    await async_engine.dispose()
+    if async_write_engine is not async_engine:
+        await async_write_engine.dispose()
+
+app = FastAPI(title=settings.APP_NAME, lifespan=lifespan)
 
 origins = [
     "http://localhost:5173",
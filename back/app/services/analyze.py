@@ -1,47 +1,69 @@
 # app/services/analyze.py
 import re
-from typing import List, Dict
+from typing import List, Dict, Sequence
+
+import numpy as np
+
+from app.services.matcher import KeywordMatcher, get_matcher
 
 FILLERS = {"음", "어", "그", "음...", "어...", "약간", "뭐랄까", "그러니까"}
+POS_WORDS = {"성공", "해결", "개선", "달성", "최적화", "확장"}
+NEG_WORDS = {"문제", "실패", "어려움", "이슈", "장애"}
+_SENTIMENT_MATCHER = KeywordMatcher(sorted(POS_WORDS | NEG_WORDS))
+
+_SPLIT_RE = re.compile(r"[\\s\\,\\.\\!\\?\\-\\:;\\(\\)\\[\\]\\{\\}]+")
+# 증분 토큰화 시 보관하는 미완성 토큰 꼬리 길이
+# (가장 긴 충전어 + 아직 덜 들어온 구분자(최소 매치 길이 6 미만)가 함께 들어갈 만큼)
+_PENDING_TAIL = 16
 
 def tokenize_ko(text: str) -> List[str]:
     # 단순 토크나이저(공백/구두점 기준)
-    return [t for t in re.split(r"[\\s\\,\\.\\!\\?\\-\\:;\\(\\)\\[\\]\\{\\}]+", text) if t]
+    return [t for t in _SPLIT_RE.split(text) if t]
 
 def calc_filler_ratio(tokens: List[str]) -> float:
-    if not tokens: return 0.0
-    filler_count = sum(1 for t in tokens if t in FILLERS)
-    return min(1.0, filler_count / max(1, len(tokens)))
+    return _filler_ratio(sum(1 for t in tokens if t in FILLERS), len(tokens))
+
+def _filler_ratio(filler_count: int, n_tokens: int) -> float:
+    if not n_tokens: return 0.0
+    return min(1.0, filler_count / max(1, n_tokens))
 
 def calc_wpm(tokens: List[str], duration_sec: float) -> float:
+    return _wpm(len(tokens), duration_sec)
+
+def _wpm(n_tokens: int, duration_sec: float) -> float:
     if duration_sec <= 0:
         # 길이 모르면 대략 150 wpm 가정으로 역산하지 않고 0 처리
         return 0.0
     minutes = duration_sec / 60.0
-    return len(tokens) / minutes if minutes > 0 else 0.0
+    return n_tokens / minutes if minutes > 0 else 0.0
+
+def _normalize_keywords(rubric_keywords: List[str]) -> List[str]:
+    return [kw.strip().lower() for kw in rubric_keywords]
+
+def _count_hits(kws: List[str], found) -> int:
+    # 루브릭에 같은 키워드가 여러 번 있으면 각각 센다(기존 동작 유지)
+    return sum(1 for kw in kws if kw and kw in found)
 
 def calc_keyword_hit_rate(transcript: str, rubric_keywords: List[str]) -> float:
     if not rubric_keywords:
         return 0.0
-    t = transcript.lower()
-    hits = 0
-    for kw in rubric_keywords:
-        kw = kw.strip().lower()
-        if not kw: continue
-        if kw in t:
-            hits += 1
-    return hits / len(rubric_keywords)
+    kws = _normalize_keywords(rubric_keywords)
+    found = get_matcher(kws).found(transcript.lower())
+    return _count_hits(kws, found) / len(rubric_keywords)
+
+def keyword_hits(transcript: str, rubric_keywords: List[str]) -> List[str]:
+    """답변에 등장한 루브릭 키워드(원래 표기, 루브릭 순서)"""
+    found = get_matcher(_normalize_keywords(rubric_keywords)).found(transcript.lower())
+    return [kw for kw in rubric_keywords if kw.strip() and kw.strip().lower() in found]
+
+def _sentiment_score(found) -> int:
+    return len(found & POS_WORDS) - len(found & NEG_WORDS)
 
 def simple_sentiment(transcript: str) -> str:
     # 아주 단순한 룰(placeholder) – 나중에 koBERT 등으로 교체
-    pos_words = {"성공", "해결", "개선", "달성", "최적화", "확장"}
-    neg_words = {"문제", "실패", "어려움", "이슈", "장애"}
-    score = 0
-    low = transcript.lower()
-    for w in pos_words:
-        if w in low: score += 1
-    for w in neg_words:
-        if w in low: score -= 1
+    return _sentiment_label(_sentiment_score(_SENTIMENT_MATCHER.found(transcript.lower())))
+
+def _sentiment_label(score: int) -> str:
     return "pos" if score > 0 else ("neg" if score < 0 else "neu")
 
 def calc_quality_scores(filler_ratio: float, wpm: float, keyword_hit_rate: float) -> Dict[str, float]:
@@ -71,3 +93,156 @@ def analyze(transcript: str, rubric_keywords: List[str], duration_sec: float) ->
         "clarity_score": round(qs["clarity"], 2),
         "coherence_score": round(qs["coherence"], 2),
     }
+
+class AnalyzerState:
+    """
+    실시간(누적 전사) 문항 하나에 대한 증분 분석 상태
+    - feed(suffix): 새로 덧붙은 텍스트만 처리 → 메시지당 비용이 전체 답변 길이와 무관
+    - result(): analyze(지금까지의 전체 텍스트, ...) 와 동일한 결과
+    """
+
+    def __init__(self, rubric_keywords: List[str]):
+        self.rubric_keywords = list(rubric_keywords)
+        self._kws = _normalize_keywords(self.rubric_keywords)
+        # 키워드/감성 단어는 Aho–Corasick 상태를 이어 가므로 청크 경계에 걸친 매치도 그대로 잡힘
+        self._kw_matcher = get_matcher(self._kws)
+        self._kw_state = 0
+        self._kw_hits: set = set()
+        self._sent_state = 0
+        self._sent_hits: set = set()
+        # 아직 끝나지 않은 마지막 토큰: 길이 + 꼬리만 보관(전체를 매번 다시 훑지 않도록)
+        self._pend_len = 0
+        self._pend_tail = ""
+        self._pend_delim = ""  # 텍스트 끝에 걸친 구분자(다음 청크와 이어져 길어질 수 있음)
+        self._n_tokens = 0  # 확정된 토큰 수
+        self._n_fillers = 0
+        self.text = ""
+
+    def reset(self) -> None:
+        self.__init__(self.rubric_keywords)
+
+    def update(self, text: str) -> "AnalyzerState":
+        """누적 전사 전체를 받아 이전 대비 덧붙은 부분만 처리(앞부분이 바뀌었으면 처음부터)"""
+        if text.startswith(self.text):
+            return self.feed(text[len(self.text):])
+        self.reset()
+        return self.feed(text)
+
+    def feed(self, suffix: str) -> "AnalyzerState":
+        if not suffix:
+            return self
+        self.text += suffix
+
+        # 1) 토큰: 마지막 구분자 이후는 다음 청크와 이어질 수 있으므로 보류
+        if self._pend_delim:
+            buf, hidden = self._pend_delim + suffix, 0
+        else:
+            buf, hidden = self._pend_tail + suffix, self._pend_len - len(self._pend_tail)
+        matches = list(_SPLIT_RE.finditer(buf))
+        keep = matches.pop() if matches and matches[-1].end() == len(buf) else None
+        prev = 0
+        for mt in matches:
+            self._count_token(buf[prev:mt.start()], hidden)
+            hidden, prev = 0, mt.end()
+        if keep:
+            self._count_token(buf[prev:keep.start()], hidden)
+            self._pend_delim, self._pend_len, self._pend_tail = buf[keep.start():], 0, ""
+        else:
+            rest = buf[prev:]
+            self._pend_delim = ""
+            self._pend_len = hidden + len(rest)
+            self._pend_tail = rest[-_PENDING_TAIL:]
+
+        # 2) 키워드/감성 단어: 새 텍스트만 오토마톤에 이어서 넣음
+        low = suffix.lower()
+        self._kw_state, hits = self._kw_matcher.scan(low, self._kw_state)
+        self._kw_hits.update(self._kw_matcher.patterns[i] for i in hits)
+        self._sent_state, hits = _SENTIMENT_MATCHER.scan(low, self._sent_state)
+        self._sent_hits.update(_SENTIMENT_MATCHER.patterns[i] for i in hits)
+        return self
+
+    def _count_token(self, tok: str, hidden: int = 0) -> None:
+        # hidden: 이전 청크에서 넘어온(꼬리 밖) 토큰 앞부분 길이
+        if tok or hidden:
+            self._n_tokens += 1
+            if not hidden and tok in FILLERS:
+                self._n_fillers += 1
+
+    def result(self, duration_sec: float) -> Dict[str, float | str]:
+        n_tokens = self._n_tokens + (1 if self._pend_len else 0)
+        n_fillers = self._n_fillers
+        if self._pend_len and self._pend_len == len(self._pend_tail) and self._pend_tail in FILLERS:
+            n_fillers += 1
+        filler_ratio = _filler_ratio(n_fillers, n_tokens)
+        wpm = _wpm(n_tokens, duration_sec)
+        khr = _count_hits(self._kws, self._kw_hits) / len(self._kws) if self._kws else 0.0
+        sent = _sentiment_label(_sentiment_score(self._sent_hits))
+        qs = calc_quality_scores(filler_ratio, wpm, khr)
+        return {
+            "filler_ratio": round(filler_ratio, 3),
+            "wpm": round(wpm, 1),
+            "keyword_hit_rate": round(khr, 3),
+            "sentiment": sent,
+            "clarity_score": round(qs["clarity"], 2),
+            "coherence_score": round(qs["coherence"], 2),
+        }
+
+# --------------------------------------------
+# 배치 분석(여러 답변을 한 번에): 재채점/일괄 제출용
+# --------------------------------------------
+def analyze_batch(
+    transcripts: Sequence[str], rubrics: Sequence[List[str]], durations: Sequence[float]
+) -> Dict[str, np.ndarray]:
+    """
+    analyze() 의 배치 버전. 지표를 NumPy 배열로 반환(반올림 전 값)
+    토큰화/키워드 매칭은 답변별로 하고, 비율/점수 계산은 배열 연산으로 한 번에 처리
+    """
+    n = len(transcripts)
+    n_tokens = np.zeros(n, dtype=np.int64)
+    n_fillers = np.zeros(n, dtype=np.int64)
+    hits = np.zeros(n, dtype=np.float64)
+    n_kws = np.zeros(n, dtype=np.float64)
+    sentiment = np.empty(n, dtype=object)
+    for i, (text, kws) in enumerate(zip(transcripts, rubrics)):
+        tokens = tokenize_ko(text)
+        n_tokens[i] = len(tokens)
+        n_fillers[i] = sum(1 for t in tokens if t in FILLERS)
+        low = text.lower()
+        if kws:
+            norm = _normalize_keywords(kws)
+            hits[i] = _count_hits(norm, get_matcher(norm).found(low))
+            n_kws[i] = len(kws)
+        sentiment[i] = _sentiment_label(_sentiment_score(_SENTIMENT_MATCHER.found(low)))
+
+    dur = np.asarray(durations, dtype=np.float64)
+    filler_ratio = np.where(n_tokens > 0, np.minimum(1.0, n_fillers / np.maximum(1, n_tokens)), 0.0)
+    minutes = np.where(dur > 0, dur / 60.0, 0.0)
+    wpm = np.divide(n_tokens, minutes, out=np.zeros(n), where=minutes > 0)
+    khr = np.divide(hits, n_kws, out=np.zeros(n), where=n_kws > 0)
+
+    clarity = 5.0 - filler_ratio * 3.0
+    clarity = np.clip(clarity - np.where((wpm > 220) | (wpm < 60), 1.0, 0.0), 0.0, 5.0)
+    coherence = np.clip(2.0 + khr * 3.0, 0.0, 5.0)
+    return {
+        "filler_ratio": filler_ratio,
+        "wpm": wpm,
+        "keyword_hit_rate": khr,
+        "sentiment": sentiment,
+        "clarity_score": clarity,
+        "coherence_score": coherence,
+    }
+
+def batch_results(batch: Dict[str, np.ndarray]) -> List[Dict[str, float | str]]:
+    """analyze_batch 결과를 analyze() 와 같은 형태/반올림의 dict 목록으로"""
+    cols = zip(*(batch[k].tolist() for k in ("filler_ratio", "wpm", "keyword_hit_rate", "sentiment", "clarity_score", "coherence_score")))
+    return [
+        {
+            "filler_ratio": round(fr, 3),
+            "wpm": round(wpm, 1),
+            "keyword_hit_rate": round(khr, 3),
+            "sentiment": sent,
+            "clarity_score": round(cl, 2),
+            "coherence_score": round(co, 2),
+        }
+        for fr, wpm, khr, sent, cl, co in cols
+    ]
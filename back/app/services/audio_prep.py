@@ -0,0 +1,75 @@
+# app/services/audio_prep.py
+"""
+오디오 전처리: 업로드를 한 번만 16kHz mono 로 디코딩해 PCM 사이드카(<오디오 파일>.pcm16.npy)로 보관
+- 같은 오디오를 다른 모델 크기/언어로 다시 전사할 때 ffmpeg(PyAV) 디코딩/리샘플을 건너뜀
+- int16 으로 저장(float32 의 절반 크기), mmap 으로 열어 블록 단위로 float32 로 바꿔 모델에 바로 넘김
+- 업로드 파일 이름이 내용 해시라 같은 내용이면 사이드카도 함께 재사용
+"""
+import asyncio
+import logging
+import os
+import uuid
+from typing import Optional
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.stt import AudioSource, as_input
+
+log = logging.getLogger("stt.prep")
+
+SR = 16000
+SUFFIX = ".pcm16.npy"
+BLOCK = SR * 60  # float32 변환 단위(샘플 수)
+
+def pcm_path(audio_path: str) -> str:
+    return audio_path + SUFFIX
+
+def decode(source: AudioSource) -> np.ndarray:
+    """파일 경로/bytes → 16kHz mono float32"""
+    from faster_whisper.audio import decode_audio
+    return decode_audio(as_input(source), sampling_rate=SR)
+
+def _to_float(pcm: np.ndarray) -> np.ndarray:
+    """int16 → float32 를 결과 배열에 블록씩 바로 써서, 전체 크기의 임시 배열 없이 mmap 을 순서대로 읽음"""
+    out = np.empty(len(pcm), dtype=np.float32)
+    for i in range(0, len(pcm), BLOCK):
+        np.multiply(pcm[i:i + BLOCK], np.float32(1 / 32768), out=out[i:i + BLOCK])
+    return out
+
+def _save(path: str, audio: np.ndarray) -> None:
+    pcm = (np.clip(audio, -1.0, 32767 / 32768) * 32768).astype("<i2")
+    tmp = f"{path}.{uuid.uuid4().hex}.tmp"
+    with open(tmp, "wb") as f:
+        np.save(f, pcm)
+    os.replace(tmp, path)  # 동시에 같은 파일을 전처리해도 반쯤 쓴 사이드카를 읽지 않게
+
+def load_pcm(audio_path: str, source: Optional[AudioSource] = None) -> np.ndarray:
+    """
+    사이드카가 있으면 mmap 으로 읽고, 없으면 source(없으면 audio_path)를 디코딩해 사이드카를 만든 뒤 반환
+    반환값은 모델에 바로 넣을 수 있는 16kHz mono float32
+    """
+    side = pcm_path(audio_path)
+    if os.path.exists(side):
+        try:
+            return _to_float(np.load(side, mmap_mode="r"))
+        except (OSError, ValueError):
+            log.warning("broken PCM sidecar %s, decoding again", side)
+    audio = decode(source if source is not None else audio_path)
+    try:
+        _save(side, audio)
+    except OSError:
+        log.exception("cannot write PCM sidecar %s", side)
+    return audio
+
+async def prepare(audio_path: str, source: Optional[AudioSource] = None) -> AudioSource:
+    """전사 입력 준비(AUDIO_PCM_CACHE 가 꺼져 있으면 source 그대로)"""
+    original = source if source is not None else audio_path
+    if not settings.AUDIO_PCM_CACHE:
+        return original
+    try:
+        return await asyncio.to_thread(load_pcm, audio_path, source)
+    except Exception:
+        # 디코딩할 수 없는 파일은 원본 그대로 넘겨 전사 단계에서 오류를 보고하게 함
+        log.warning("audio preprocessing failed for %s", audio_path, exc_info=True)
+        return original
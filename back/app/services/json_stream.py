@@ -0,0 +1,90 @@
+# app/services/json_stream.py
+"""
+스트리밍 JSON 에서 최상위 문자열 필드 값을 조각 단위로 뽑아내는 파서
+- LLM 이 {"summary_md": "...", ...} 를 토큰 단위로 보낼 때 값이 끝나기 전에도 화면에 흘려보내기 위함
+- 이스케이프(\\n, \\", \\uXXXX, 서로게이트 쌍)가 청크 경계에서 잘려도 이어서 처리
+- 전체 파싱/검증은 스트림이 끝난 뒤 json.loads 로 따로 함
+"""
+from typing import Iterable, List, Tuple
+
+_ESC = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+class JsonFieldStream:
+    def __init__(self, fields: Iterable[str]):
+        self.fields = set(fields)
+        self._depth = 0
+        self._in_str = False
+        self._esc = False
+        self._hex: str | None = None   # \u 뒤 16진수 수집 중
+        self._high: int | None = None  # 짝을 기다리는 상위 서로게이트
+        self._expect_key = False
+        self._is_key = False
+        self._key = ""
+        self._last_key = ""
+        self._capture = False          # 관심 필드 값 문자열 안
+
+    def feed(self, chunk: str) -> List[Tuple[str, str]]:
+        """chunk 를 넣고 새로 확정된 (필드, 텍스트) 조각들 반환(같은 필드 연속 조각은 합침)"""
+        out: List[Tuple[str, str]] = []
+        buf: List[str] = []
+
+        def emit(s: str) -> None:
+            if self._is_key:
+                self._key += s
+            elif self._capture:
+                buf.append(s)
+
+        for ch in chunk:
+            if self._in_str:
+                if self._hex is not None:
+                    self._hex += ch
+                    if len(self._hex) == 4:
+                        cp, self._hex = int(self._hex, 16), None
+                        if 0xD800 <= cp < 0xDC00:
+                            self._high = cp
+                        elif 0xDC00 <= cp < 0xE000 and self._high is not None:
+                            emit(chr(0x10000 + ((self._high - 0xD800) << 10) + (cp - 0xDC00)))
+                            self._high = None
+                        else:
+                            emit(chr(cp))
+                elif self._esc:
+                    self._esc = False
+                    if ch == "u":
+                        self._hex = ""
+                    else:
+                        emit(_ESC.get(ch, ch))
+                elif ch == "\\":
+                    self._esc = True
+                elif ch == '"':
+                    self._in_str = False
+                    if self._is_key:
+                        self._last_key, self._is_key = self._key, False
+                    elif self._capture:
+                        self._capture = False
+                        if buf:
+                            out.append((self._last_key, "".join(buf)))
+                            buf = []
+                else:
+                    emit(ch)
+                continue
+
+            if ch == '"':
+                self._in_str = True
+                if self._depth == 1 and self._expect_key:
+                    self._is_key, self._key = True, ""
+                elif self._depth == 1:
+                    self._capture = self._last_key in self.fields
+            elif ch in "{[":
+                self._depth += 1
+                if self._depth == 1:
+                    self._expect_key = True
+            elif ch in "}]":
+                self._depth -= 1
+            elif self._depth == 1 and ch == ":":
+                self._expect_key = False
+            elif self._depth == 1 and ch == ",":
+                self._expect_key = True
+
+        if buf:
+            out.append((self._last_key, "".join(buf)))
+        return out
@@ -1,7 +1,11 @@
-from typing import List, Dict
+from typing import Iterable, List, Dict, Optional
 
-# Temporary stub until real LLM integration
-def generate_questions(role: str, job_title: str, level: str, stack: List[str], difficulty: str) -> List[Dict]:
+from app.services.question_bank import normalize_text, question_bank
+
+N_QUESTIONS = 8
+
+# 은행이 비었거나 조건에 맞는 질문이 모자랄 때 채우는 기본 질문
+def _stub_questions(stack: List[str], difficulty: str) -> List[Dict]:
     base = [
         "자기소개 및 최근 프로젝트에서 맡은 역할을 설명해 주세요.",
         "해당 직무에서 가장 중요하다고 생각하는 역량은 무엇이며, 어떻게 증명하셨나요?",
@@ -20,3 +24,45 @@ def generate_questions(role: str, job_title: str, level: str, stack: List[str],
         }
         for i, q in enumerate(base, 1)
     ]
+
+def generate_questions(
+    role: str,
+    job_title: str,
+    level: str,
+    stack: List[str],
+    difficulty: str,
+    company: str = "",
+    seen: Optional[Iterable[str]] = None,
+    n: int = N_QUESTIONS,
+) -> List[Dict]:
+    """
+    질문 은행 색인에서 조건에 맞는 질문 n개 선택(seen: 사용자가 이미 받은 질문 텍스트, 오래된 것부터)
+    모자라면 LLM 백필을 예약하고 이번에는 기본 질문으로 채움
+    그래도 모자라면 이미 받은 질문을 오래된 것부터 다시 냄 — 세션은 항상 n개
+    """
+    seen = list(seen or ())
+    picked = question_bank.select(role, level, difficulty, stack, company=company, exclude=seen, n=n)
+    if len(picked) < n:
+        question_bank.schedule_backfill(role, level, difficulty, stack, company)
+        used = {normalize_text(q) for q in seen} | {normalize_text(q["text"]) for q in picked}
+        for q in _stub_questions(stack, difficulty):
+            if len(picked) >= n:
+                break
+            if normalize_text(q["text"]) not in used:
+                picked.append(q)
+                used.add(normalize_text(q["text"]))
+    if len(picked) < n and seen:
+        again: Dict[str, Dict] = {}
+        for q in _stub_questions(stack, difficulty) + question_bank.select(
+            role, level, difficulty, stack, company=company, n=len(question_bank)
+        ):
+            again[normalize_text(q["text"])] = q
+        chosen = {normalize_text(q["text"]) for q in picked}
+        for text in seen:
+            key = normalize_text(text)
+            if len(picked) >= n:
+                break
+            if key in again and key not in chosen:
+                picked.append(again[key])
+                chosen.add(key)
+    return picked
@@ -0,0 +1,178 @@
+# app/services/llm_client.py
+"""
+LLM HTTP 클라이언트(프로세스 공용)
+- httpx.AsyncClient 하나를 재사용: keep-alive 커넥션 풀 + 동시 연결 상한(LLM_MAX_CONNECTIONS)
+- 429/5xx/네트워크 오류는 지수 백오프 + full jitter 로 재시도(Retry-After 가 있으면 우선)
+- 연속 실패가 쌓이면 서킷 브레이커가 열려 한동안 바로 LLMUnavailable → 호출 측은 폴백
+- stream_events(): 공급자 스트리밍 모드(SSE) 응답을 청크 단위로
+- lifespan 종료 시 close_client() 로 풀 정리
+"""
+import asyncio
+import json
+import logging
+import random
+import time
+from typing import Any, AsyncIterator, Dict, Optional
+
+import httpx
+
+from app.core.config import settings
+
+log = logging.getLogger("llm.client")
+
+RETRY_STATUS = {408, 409, 429, 500, 502, 503, 504}
+BACKOFF_BASE_SEC = 0.5
+BACKOFF_MAX_SEC = 8.0
+
+class LLMUnavailable(Exception):
+    """재시도 후에도 실패했거나 서킷이 열려 있음"""
+
+class CircuitBreaker:
+    """closed → (연속 실패 threshold 회) open → reset_sec 후 half-open(시험 호출 1개) → 성공 시 closed"""
+
+    def __init__(self, threshold: int, reset_sec: float):
+        self.threshold = threshold
+        self.reset_sec = reset_sec
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self._trial = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_sec:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        st = self.state
+        if st == "closed":
+            return True
+        if st == "half-open" and not self._trial:
+            self._trial = True  # 시험 호출은 하나만
+            return True
+        return False
+
+    def success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+        self._trial = False
+
+    def failure(self) -> None:
+        self.failures += 1
+        self._trial = False
+        if self.opened_at is not None or self.failures >= self.threshold:
+            self.opened_at = time.monotonic()  # half-open 실패면 다시 열고 타이머 재시작
+
+    def release(self) -> None:
+        """시험 호출이 결과 없이 끝남(취소/호출 측 타임아웃): 다음 호출이 다시 시험하도록"""
+        self._trial = False
+
+breaker = CircuitBreaker(settings.LLM_BREAKER_FAILURES, settings.LLM_BREAKER_RESET_SEC)
+_client: Optional[httpx.AsyncClient] = None
+
+def get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            base_url=settings.OPENAI_BASE_URL,
+            timeout=httpx.Timeout(settings.LLM_TIMEOUT_SEC, connect=5.0),
+            limits=httpx.Limits(
+                max_connections=settings.LLM_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.LLM_MAX_CONNECTIONS,
+                keepalive_expiry=60,
+            ),
+        )
+    return _client
+
+async def close_client() -> None:
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+def _backoff(attempt: int, resp: Optional[httpx.Response]) -> float:
+    if resp is not None:
+        try:
+            return min(BACKOFF_MAX_SEC, float(resp.headers["Retry-After"]))
+        except (KeyError, ValueError):
+            pass
+    return random.uniform(0, min(BACKOFF_MAX_SEC, BACKOFF_BASE_SEC * 2 ** attempt))
+
+async def post_json(path: str, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """POST → JSON 응답. 재시도/서킷 포함, 최종 실패 시 LLMUnavailable"""
+    if not breaker.allow():
+        raise LLMUnavailable("circuit open")
+    trial = breaker.state == "half-open"  # 이 호출이 시험 호출
+    try:
+        client = get_client()
+        last: Exception | None = None
+        for attempt in range(settings.LLM_MAX_RETRIES + 1):
+            resp = None
+            try:
+                resp = await client.post(path, json=body, headers=headers)
+                if resp.status_code not in RETRY_STATUS:
+                    resp.raise_for_status()  # 4xx(재시도 무의미)는 바로 실패
+                    out = resp.json()
+                    breaker.success()
+                    return out
+                last = httpx.HTTPStatusError(f"status {resp.status_code}", request=resp.request, response=resp)
+            except httpx.TransportError as e:  # 연결/타임아웃
+                last = e
+            except (httpx.HTTPStatusError, ValueError) as e:
+                breaker.failure()
+                raise LLMUnavailable(str(e)) from e
+            if attempt < settings.LLM_MAX_RETRIES:
+                delay = _backoff(attempt, resp)
+                log.warning("LLM call failed (%s), retry %d in %.2fs", last, attempt + 1, delay)
+                await asyncio.sleep(delay)
+        breaker.failure()
+        raise LLMUnavailable(str(last)) from last
+    finally:
+        if trial:
+            breaker.release()  # 취소돼도 시험 슬롯을 돌려줌(안 그러면 서킷이 영영 안 닫힘)
+
+async def stream_events(path: str, body: Dict[str, Any], headers: Optional[Dict[str, str]] = None) -> AsyncIterator[Dict[str, Any]]:
+    """
+    스트리밍(SSE) POST → 'data:' 줄을 JSON 으로 하나씩. 첫 바이트 전 실패만 재시도(이미 내보낸 토큰은 되돌릴 수 없음)
+    """
+    if not breaker.allow():
+        raise LLMUnavailable("circuit open")
+    trial = breaker.state == "half-open"
+    try:
+        client = get_client()
+        last: Exception | None = None
+        for attempt in range(settings.LLM_MAX_RETRIES + 1):
+            resp = None
+            try:
+                async with client.stream("POST", path, json=body, headers=headers) as resp:
+                    if resp.status_code in RETRY_STATUS:
+                        last = httpx.HTTPStatusError(f"status {resp.status_code}", request=resp.request, response=resp)
+                    else:
+                        if resp.is_error:
+                            breaker.failure()
+                            raise LLMUnavailable(f"status {resp.status_code}")
+                        async for line in resp.aiter_lines():
+                            if not line.startswith("data:"):
+                                continue
+                            data = line[5:].strip()
+                            if data == "[DONE]":
+                                break
+                            yield json.loads(data)
+                        breaker.success()
+                        return
+            except httpx.TransportError as e:
+                if resp is not None and resp.is_success:
+                    breaker.failure()
+                    raise LLMUnavailable(f"stream interrupted: {e}") from e
+                last = e
+            if attempt < settings.LLM_MAX_RETRIES:
+                delay = _backoff(attempt, resp)
+                log.warning("LLM stream failed (%s), retry %d in %.2fs", last, attempt + 1, delay)
+                await asyncio.sleep(delay)
+        breaker.failure()
+        raise LLMUnavailable(str(last)) from last
+    finally:
+        if trial:
+            breaker.release()  # 소비자가 끊어 제너레이터가 닫혀도(GeneratorExit/취소) 시험 슬롯 반환
@@ -0,0 +1,88 @@
+# app/services/matcher.py
+"""
+Aho–Corasick 다중 패턴 매처
+- 루브릭 키워드/감성 사전처럼 여러 단어의 '부분 문자열 포함 여부'를 한 번의 순회로 검사
+- 패턴 묶음마다 한 번만 빌드하고 get_matcher() 로 캐시해서 재사용
+- scan(text, state) 로 이어서 넣을 수 있어 실시간 누적 전사에도 그대로 사용 가능
+"""
+from collections import deque
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Set, Tuple
+
+class KeywordMatcher:
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: Tuple[str, ...] = tuple(dict.fromkeys(p for p in patterns if p))
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[int]] = [[]]
+        for idx, pat in enumerate(self.patterns):
+            s = 0
+            for ch in pat:
+                nxt = goto[s].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[s][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                s = nxt
+            out[s].append(idx)
+
+        # 실패 링크(BFS) + 출력 병합
+        fail = [0] * len(goto)
+        q = deque(goto[0].values())
+        while q:
+            s = q.popleft()
+            for ch, nxt in goto[s].items():
+                q.append(nxt)
+                f = fail[s]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                out[nxt].extend(out[fail[nxt]])
+
+        self._goto = goto
+        self._fail = fail
+        self._out: List[Tuple[int, ...]] = [tuple(o) for o in out]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def scan(self, text: str, state: int = 0) -> Tuple[int, Set[int]]:
+        """text 를 state 에서 이어 훑고 (마지막 상태, 등장한 패턴 인덱스 집합) 반환"""
+        goto, fail, out = self._goto, self._fail, self._out
+        found: Set[int] = set()
+        s = state
+        for ch in text:
+            nxt = goto[s].get(ch)
+            while nxt is None and s:
+                s = fail[s]
+                nxt = goto[s].get(ch)
+            s = nxt if nxt is not None else 0
+            if out[s]:
+                found.update(out[s])
+        return s, found
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """모든 매치를 (start, end, pattern) 으로 (겹치는 매치 포함, end 순)"""
+        goto, fail, out = self._goto, self._fail, self._out
+        s = 0
+        for i, ch in enumerate(text):
+            nxt = goto[s].get(ch)
+            while nxt is None and s:
+                s = fail[s]
+                nxt = goto[s].get(ch)
+            s = nxt if nxt is not None else 0
+            for idx in out[s]:
+                pat = self.patterns[idx]
+                yield i + 1 - len(pat), i + 1, pat
+
+    def found(self, text: str) -> FrozenSet[str]:
+        """text 에 한 번이라도 등장한 패턴들"""
+        return frozenset(self.patterns[i] for i in self.scan(text)[1])
+
+@lru_cache(maxsize=512)
+def _build(patterns: Tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(patterns)
+
+def get_matcher(patterns: Iterable[str]) -> KeywordMatcher:
+    """같은 패턴 묶음이면 빌드된 오토마톤을 재사용(순서 무관)"""
+    return _build(tuple(sorted(set(p for p in patterns if p))))
@@ -0,0 +1,111 @@
+# app/services/metric_buffer.py
+"""
+실시간 피드백 지표의 write-behind 버퍼
+- websocket 메시지마다 나오는 지표를 연결별로 메모리에 모았다가 metric_snapshots 에 일괄 INSERT
+  (METRICS_FLUSH_ROWS 개가 모이거나 METRICS_FLUSH_SEC 가 지나면, 그리고 연결 종료 시)
+- 저장은 수신 루프와 별도 태스크에서(피드백 응답을 DB 쓰기로 늦추지 않음)
+- 연결별 상한(METRICS_BUFFER_MAX_ROWS). DB 가 밀려 넘치면 오래된 스냅샷부터 버림
+- 저장 실패한 묶음은 버림(타임라인은 분석용이라 피드백 자체를 막지 않음)
+"""
+import asyncio
+import logging
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from app.core.config import settings
+from app.db.bulk import insert_metric_snapshots
+from app.db.session import AsyncWriteSessionLocal
+
+log = logging.getLogger("realtime.metrics")
+
+FIELDS = ("filler_ratio", "wpm", "sentiment", "keyword_hit_rate", "clarity_score", "coherence_score")
+
+_counters = {"added": 0, "flushed_rows": 0, "flushes": 0, "dropped": 0, "errors": 0}
+_closing: set = set()  # 연결 종료 후 마무리 저장 중인 태스크
+
+def stats() -> Dict[str, int]:
+    return dict(_counters)
+
+async def drain() -> None:
+    """종료 시: 끊긴 연결들의 마무리 저장을 기다림"""
+    await asyncio.gather(*_closing, return_exceptions=True)
+
+class MetricBuffer:
+    def __init__(
+        self,
+        session_id: int,
+        flush_rows: Optional[int] = None,
+        flush_sec: Optional[float] = None,
+        max_rows: Optional[int] = None,
+    ):
+        self.session_id = session_id
+        self.flush_rows = flush_rows or settings.METRICS_FLUSH_ROWS
+        self.flush_sec = flush_sec or settings.METRICS_FLUSH_SEC
+        self.max_rows = max_rows or settings.METRICS_BUFFER_MAX_ROWS
+        self.rows: Deque[Dict[str, Any]] = deque()
+        self._lock = asyncio.Lock()
+        self._timer: Optional[asyncio.Task] = None
+        self._pending: set = set()
+
+    def start(self) -> "MetricBuffer":
+        self._timer = asyncio.create_task(self._tick())
+        return self
+
+    def add(self, question_id: int, elapsed_sec: float, metrics: Dict[str, Any], source: str = "text") -> None:
+        if len(self.rows) >= self.max_rows:
+            self.rows.popleft()
+            _counters["dropped"] += 1
+        self.rows.append({
+            "session_id": self.session_id,
+            "question_id": question_id,
+            "elapsed_sec": elapsed_sec,
+            "source": source,
+            **{f: metrics[f] for f in FIELDS},
+        })
+        _counters["added"] += 1
+        if len(self.rows) >= self.flush_rows and not self._lock.locked():
+            t = asyncio.create_task(self.flush())
+            self._pending.add(t)
+            t.add_done_callback(self._pending.discard)
+
+    async def flush(self) -> int:
+        """버퍼를 비울 때까지 flush_rows 개씩 일괄 INSERT. 저장한 행 수 반환"""
+        written = 0
+        async with self._lock:
+            while self.rows:
+                batch = [self.rows.popleft() for _ in range(min(self.flush_rows, len(self.rows)))]
+                try:
+                    async with AsyncWriteSessionLocal() as db:
+                        await insert_metric_snapshots(db, batch)
+                        await db.commit()
+                except Exception:
+                    _counters["errors"] += 1
+                    _counters["dropped"] += len(batch)
+                    log.exception("metric snapshot flush failed (session %s, %d rows)", self.session_id, len(batch))
+                    continue
+                written += len(batch)
+                _counters["flushes"] += 1
+                _counters["flushed_rows"] += len(batch)
+        return written
+
+    async def _tick(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_sec)
+            if self.rows:
+                await self.flush()
+
+    async def _finish(self) -> None:
+        await asyncio.gather(*self._pending, return_exceptions=True)
+        await self.flush()
+
+    async def close(self) -> None:
+        """
+        연결 종료: 주기 저장을 멈추고 남은 스냅샷을 모두 저장
+        연결 핸들러가 취소되더라도 마무리 저장은 끝까지 가도록 별도 태스크로(shield)
+        """
+        if self._timer:
+            self._timer.cancel()
+        t = asyncio.create_task(self._finish())
+        _closing.add(t)
+        t.add_done_callback(_closing.discard)
+        await asyncio.shield(t)
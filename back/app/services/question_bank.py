@@ -0,0 +1,218 @@
+# app/services/question_bank.py
+"""
+질문 은행 + 태그 역색인
+- 질문마다 role/level/difficulty/company/stack 태그 → 역색인(tag → 질문 id 집합)을 메모리에 두고
+  세션 생성 시 DB/LLM 왕복 없이 점수 매겨 선택(수 ms)
+- 사용자가 이미 받은 질문(정규화 텍스트 해시)은 제외
+- 조건에 맞는 새 질문이 모자라면 LLM 백필을 백그라운드로 예약 → 은행이 점점 커짐(이번 요청은 기다리지 않음)
+- 색인은 프로세스 로컬. 다른 워커가 백필한 질문은 재시작(load) 후 반영
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import random
+import re
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal, AsyncWriteSessionLocal
+from app.db import models as m
+from app.db.bulk import insert_bank_questions
+from app.services.llm_client import post_json
+
+log = logging.getLogger("question.bank")
+
+# 태그 가중치(역색인 점수)
+WEIGHTS = {"role": 4, "company": 4, "stack": 3, "level": 2, "difficulty": 1}
+BACKFILL_SIZE = 8
+
+SEED: List[Dict[str, Any]] = [
+    {"text": "자기소개 및 최근 프로젝트에서 맡은 역할을 설명해 주세요.", "rubric_keywords": "핵심키워드,경험근거"},
+    {"text": "동료와의 협업에서 갈등이 있었던 경험과 해결 방법을 공유해 주세요.", "rubric_keywords": "핵심키워드,경험근거"},
+    {"text": "최근 학습하거나 흥미롭게 본 기술/논문 한 가지를 설명해 주세요.", "rubric_keywords": "핵심키워드,경험근거"},
+    {"text": "문제가 발생했을 때 원인 분석부터 해결까지의 과정을 구체적으로 설명해 주세요.", "rubric_keywords": "원인-해결,구체성,영향도"},
+    {"role": "backend", "text": "트래픽이 10배로 늘었을 때 가장 먼저 병목이 될 지점과 대응 방법을 설명해 주세요.", "rubric_keywords": "병목,캐시,수평 확장"},
+    {"role": "backend", "text": "트랜잭션 격리 수준의 차이와 실제로 겪은 동시성 문제를 설명해 주세요.", "rubric_keywords": "격리 수준,락,정합성"},
+    {"role": "backend", "level": "junior", "difficulty": "easy", "text": "REST API 설계 시 상태 코드와 에러 응답을 어떻게 정하셨나요?", "rubric_keywords": "상태 코드,일관성,에러 포맷"},
+    {"role": "backend", "level": "senior", "difficulty": "hard", "text": "서비스를 분리할 때 데이터 일관성을 어떻게 보장했는지 설명해 주세요.", "rubric_keywords": "사가,이벤트,멱등성"},
+    {"role": "backend", "stack": "redis", "text": "Redis 를 캐시로 쓸 때 만료/무효화 전략과 캐시 스탬피드 대응을 설명해 주세요.", "rubric_keywords": "TTL,무효화,스탬피드"},
+    {"role": "backend", "stack": "postgresql,mysql", "text": "느린 쿼리를 찾고 인덱스로 개선한 경험을 실행 계획과 함께 설명해 주세요.", "rubric_keywords": "실행 계획,인덱스,카디널리티"},
+    {"role": "backend", "stack": "kafka", "text": "메시지 큐에서 중복/순서 보장 문제를 어떻게 다뤘나요?", "rubric_keywords": "멱등성,파티션,오프셋"},
+    {"role": "backend", "stack": "python,fastapi", "text": "비동기 웹 서버에서 블로킹 호출이 섞이면 어떤 문제가 생기고 어떻게 피하셨나요?", "rubric_keywords": "이벤트 루프,스레드풀,블로킹"},
+    {"role": "backend", "stack": "spring,java", "text": "JPA 의 N+1 문제를 발견하고 해결한 경험을 설명해 주세요.", "rubric_keywords": "N+1,페치 조인,배치 사이즈"},
+    {"role": "data", "text": "데이터 파이프라인에서 데이터 품질 이슈를 어떻게 탐지하고 복구하셨나요?", "rubric_keywords": "검증,모니터링,재처리"},
+    {"role": "data", "stack": "spark", "text": "Spark 작업에서 셔플/스큐로 느려진 경험과 개선 방법을 설명해 주세요.", "rubric_keywords": "셔플,파티셔닝,스큐"},
+    {"role": "data", "stack": "sql", "text": "윈도 함수를 활용해 해결한 분석 쿼리 사례를 설명해 주세요.", "rubric_keywords": "윈도 함수,집계,성능"},
+    {"role": "ml", "text": "모델 성능이 오프라인 지표와 온라인 지표에서 다르게 나온 경험을 설명해 주세요.", "rubric_keywords": "데이터 분포,지표,A/B 테스트"},
+    {"role": "ml", "text": "학습 데이터 불균형 문제를 어떻게 다뤘나요?", "rubric_keywords": "샘플링,가중치,평가 지표"},
+    {"role": "ml", "stack": "pytorch", "text": "추론 지연 시간을 줄이기 위해 적용한 최적화를 설명해 주세요.", "rubric_keywords": "배치,양자화,프로파일링"},
+    {"role": "ml", "level": "senior", "difficulty": "hard", "text": "모델 배포 후 드리프트를 감지하고 재학습하는 체계를 설명해 주세요.", "rubric_keywords": "드리프트,모니터링,재학습"},
+    {"role": "frontend", "text": "렌더링 성능 문제를 측정하고 개선한 경험을 설명해 주세요.", "rubric_keywords": "프로파일링,리렌더링,번들 크기"},
+    {"role": "frontend", "stack": "react", "text": "React 에서 상태 관리 방식을 선택한 기준을 설명해 주세요.", "rubric_keywords": "상태 범위,캐싱,리렌더링"},
+]
+
+def normalize_text(text: str) -> str:
+    return re.sub(r"[\s?.!]+$", "", re.sub(r"\s+", " ", text).strip()).lower()
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode()).hexdigest()
+
+def _tags(role: str, level: str, difficulty: str, company: str, stack: Iterable[str]) -> List[tuple]:
+    tags = [("role", role.lower()), ("level", level.lower()), ("difficulty", difficulty.lower()), ("company", company.strip().lower())]
+    tags += [("stack", s.strip().lower()) for s in stack if s.strip()]
+    return [(k, v) for k, v in tags if v]
+
+def _seed_rows() -> List[Dict[str, Any]]:
+    return [
+        {
+            "text": q["text"],
+            "text_hash": text_hash(q["text"]),
+            "role": q.get("role", ""),
+            "level": q.get("level", ""),
+            "difficulty": q.get("difficulty", ""),
+            "company": q.get("company", ""),
+            "stack": q.get("stack", ""),
+            "rubric_keywords": q["rubric_keywords"],
+            "source": "seed",
+        }
+        for q in SEED
+    ]
+
+class QuestionBank:
+    def __init__(self):
+        self._items: Dict[int, Dict[str, Any]] = {}
+        self._index: Dict[tuple, Set[int]] = defaultdict(set)  # (kind, value) → id 집합
+        self._backfilling: Set[tuple] = set()
+        self._tasks: set = set()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, row: m.BankQuestion) -> None:
+        self._items[row.id] = {
+            "text": row.text,
+            "hash": row.text_hash,
+            "rubric_keywords": [s.strip() for s in (row.rubric_keywords or "").split(",") if s.strip()],
+            "difficulty": row.difficulty,
+            "role": row.role,
+        }
+        for tag in _tags(row.role, row.level, row.difficulty, row.company, (row.stack or "").split(",")):
+            self._index[tag].add(row.id)
+        if not row.role:
+            self._index[("role", "*")].add(row.id)  # 직무 공통
+
+    async def load(self) -> int:
+        """DB → 색인. 은행이 비어 있으면 SEED 를 먼저 넣음"""
+        async with AsyncWriteSessionLocal() as db:
+            rows = (await db.scalars(select(m.BankQuestion))).all()
+            if not rows:
+                rows = await insert_bank_questions(db, _seed_rows())
+                await db.commit()
+        self._items.clear(); self._index.clear()
+        for row in rows:
+            self.add(row)
+        return len(rows)
+
+    def select(
+        self,
+        role: str,
+        level: str,
+        difficulty: str,
+        stack: Iterable[str],
+        company: str = "",
+        exclude: Iterable[str] = (),
+        n: int = 8,
+    ) -> List[Dict[str, Any]]:
+        """role(또는 공통) 후보를 태그 일치 가중치로 점수 → 상위 n개(동점은 무작위). exclude 는 질문 텍스트"""
+        candidates = self._index.get(("role", role.lower()), set()) | self._index.get(("role", "*"), set())
+        skip = {text_hash(t) for t in exclude}
+        score: Dict[int, int] = dict.fromkeys(candidates, 0)
+        for kind, value in _tags(role, level, difficulty, company, stack):
+            for qid in self._index.get((kind, value), ()):
+                if qid in score:
+                    score[qid] += WEIGHTS[kind]
+        ranked = sorted(
+            (qid for qid in score if self._items[qid]["hash"] not in skip),
+            key=lambda qid: (-score[qid], random.random()),
+        )
+        return [
+            {
+                "text": self._items[qid]["text"],
+                "rubric_keywords": self._items[qid]["rubric_keywords"],
+                "difficulty": self._items[qid]["difficulty"] or difficulty,
+            }
+            for qid in ranked[:n]
+        ]
+
+    # --------------------------------------------
+    # LLM 백필
+    # --------------------------------------------
+    def schedule_backfill(self, role: str, level: str, difficulty: str, stack: List[str], company: str = "") -> bool:
+        """같은 조건의 백필이 진행 중이 아니면 백그라운드 태스크 예약(이벤트 루프 안에서만)"""
+        if settings.LLM_PROVIDER != "openai":
+            return False
+        key = (role.lower(), level.lower(), difficulty.lower(), company.strip().lower(), tuple(sorted(s.lower() for s in stack)))
+        if key in self._backfilling:
+            return False
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        self._backfilling.add(key)
+        t = loop.create_task(self._backfill(key))
+        self._tasks.add(t)
+        t.add_done_callback(self._tasks.discard)
+        return True
+
+    async def _backfill(self, key: tuple) -> None:
+        role, level, difficulty, company, stack = key
+        try:
+            api_key = settings.OPENAI_API_KEY or os.getenv("OPENAI_API_KEY")
+            if not api_key:
+                return
+            req = {
+                "model": settings.LLM_MODEL,
+                "messages": [
+                    {"role": "system", "content": (
+                        "You are a Korean technical interviewer. Return ONLY JSON: "
+                        '{"questions": [{"text": string, "rubric_keywords": [string]}]}'
+                    )},
+                    {"role": "user", "content": (
+                        f"직무={role}, 레벨={level}, 난이도={difficulty}, 회사={company or '무관'}, 기술스택={', '.join(stack) or '무관'}\n"
+                        f"이 조건에 맞는 서로 다른 면접 질문 {BACKFILL_SIZE}개와 채점용 핵심 키워드(2~4개)를 한국어로 만들어 주세요."
+                    )},
+                ],
+                "temperature": 0.7,
+                "response_format": {"type": "json_object"},
+            }
+            out = await post_json("/chat/completions", req, headers={"Authorization": f"Bearer {api_key}"})
+            items = json.loads(out["choices"][0]["message"]["content"]).get("questions", [])
+            rows = [
+                {
+                    "text": it["text"].strip(),
+                    "text_hash": text_hash(it["text"]),
+                    "role": role, "level": level, "difficulty": difficulty, "company": company,
+                    "stack": ",".join(stack),
+                    "rubric_keywords": ",".join(str(k).strip() for k in it.get("rubric_keywords", [])),
+                    "source": "llm",
+                }
+                for it in items if isinstance(it, dict) and str(it.get("text", "")).strip()
+            ]
+            rows = list({r["text_hash"]: r for r in rows}.values())
+            async with AsyncWriteSessionLocal() as db:
+                added = await insert_bank_questions(db, rows)
+                await db.commit()
+            for row in added:
+                self.add(row)
+            log.info("question bank backfill %s: +%d", key, len(added))
+        except Exception:
+            log.exception("question bank backfill failed for %s", key)
+        finally:
+            self._backfilling.discard(key)
+
+question_bank = QuestionBank()
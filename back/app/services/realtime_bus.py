@@ -0,0 +1,231 @@
+# app/services/realtime_bus.py
+"""
+실시간 피드백 pub/sub (세션별 채널)
+- 지원자 연결이 만든 지표를 같은 세션을 보는 모든 구독자(면접관/관찰자 화면)에게 전달
+- 백엔드: memory(프로세스 하나) | redis(Redis 호환 서버, 여러 워커/노드가 같은 채널 공유)
+- 구독자마다 대기열 상한(REALTIME_SUB_QUEUE). 느린 구독자는 오래된 메시지를 버리고 최신 지표만 받음
+- 지원자 연결은 publish_nowait(): 기다리지 않음. redis 는 워커별 발행 대기열(상한) + 전송 태스크(타임아웃)
+- 구독자가 없는 채널은 발행을 건너뜀(redis 는 PUBLISH 수신자 0 이면 잠시 건너뛰고 다시 확인)
+- 발행 실패는 로그만(지원자 피드백 자체는 막지 않음)
+"""
+import asyncio
+import json
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, Optional, Set
+
+from app.core.config import settings
+
+log = logging.getLogger("realtime.bus")
+
+IDLE_RECHECK_SEC = 1.0  # redis: 수신자 0 이던 채널은 이 시간 동안 발행하지 않음(새 관찰자는 다음 지표부터 받음)
+
+def session_channel(session_id: int) -> str:
+    return f"session:{session_id}"
+
+class Subscription:
+    def __init__(self, channel: str, maxsize: int, counters: Dict[str, int]):
+        self.channel = channel
+        self._q: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self._counters = counters
+        self.dropped = 0
+
+    def offer(self, message: Dict[str, Any]) -> None:
+        """가득 차 있으면 가장 오래된 메시지를 버리고 넣음(최신 우선)"""
+        if self._q.full():
+            self._q.get_nowait()
+            self.dropped += 1
+            self._counters["dropped"] += 1
+        self._q.put_nowait(message)
+        self._counters["delivered"] += 1
+
+    async def get(self) -> Dict[str, Any]:
+        return await self._q.get()
+
+    def __aiter__(self) -> "Subscription":
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        return await self.get()
+
+class MemoryBroker:
+    """프로세스 안 fan-out (redis 백엔드의 로컬 전달에도 사용)"""
+
+    def __init__(self, queue_size: Optional[int] = None):
+        self.queue_size = queue_size or settings.REALTIME_SUB_QUEUE
+        self._subs: Dict[str, Set[Subscription]] = {}
+        self.counters = {"published": 0, "delivered": 0, "dropped": 0, "skipped": 0, "errors": 0}
+
+    def _fanout(self, channel: str, message: Dict[str, Any]) -> int:
+        subs = self._subs.get(channel, ())
+        for sub in subs:
+            sub.offer(message)
+        return len(subs)
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> int:
+        self.counters["published"] += 1
+        return self._fanout(channel, message)
+
+    def publish_nowait(self, channel: str, message: Dict[str, Any]) -> None:
+        """기다리지 않고 발행(지원자 수신 루프용). 구독자가 없으면 건너뜀"""
+        if channel not in self._subs:
+            self.counters["skipped"] += 1
+            return
+        self.counters["published"] += 1
+        self._fanout(channel, message)
+
+    def _add(self, channel: str) -> Subscription:
+        sub = Subscription(channel, self.queue_size, self.counters)
+        self._subs.setdefault(channel, set()).add(sub)
+        return sub
+
+    def _remove(self, sub: Subscription) -> bool:
+        """구독 해제. 채널의 마지막 구독자였으면 True"""
+        subs = self._subs.get(sub.channel)
+        if subs is None:
+            return False
+        subs.discard(sub)
+        if not subs:
+            del self._subs[sub.channel]
+            return True
+        return False
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[Subscription]:
+        sub = self._add(channel)
+        try:
+            yield sub
+        finally:
+            self._remove(sub)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": type(self).__name__,
+            "channels": len(self._subs),
+            "subscribers": sum(len(s) for s in self._subs.values()),
+            **self.counters,
+        }
+
+    async def close(self) -> None:
+        self._subs.clear()
+
+class RedisBroker(MemoryBroker):
+    """
+    Redis PUBLISH/SUBSCRIBE. 워커마다 pubsub 연결 하나로 필요한 채널만 구독하고,
+    받은 메시지는 그 워커의 구독자들에게 로컬 fan-out. redis 패키지가 필요(client 를 넘기면 그걸 사용)
+    """
+
+    def __init__(self, url: str, queue_size: Optional[int] = None, prefix: str = "rt:", client=None):
+        super().__init__(queue_size)
+        if client is None:
+            try:
+                import redis.asyncio as aioredis
+            except ImportError as e:
+                raise RuntimeError("REALTIME_BROKER=redis requires the 'redis' package") from e
+            client = aioredis.from_url(url)
+        self._r = client
+        self._ps = client.pubsub()
+        self.prefix = prefix
+        self._reader: Optional[asyncio.Task] = None
+        self._sub_lock = asyncio.Lock()
+        self._out: Optional[asyncio.Queue] = None  # (channel, message) 발행 대기열
+        self._sender: Optional[asyncio.Task] = None
+        self._idle: Dict[str, float] = {}  # channel -> PUBLISH 수신자 0 을 확인한 시각
+        self.counters["publish_dropped"] = 0
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> int:
+        # 자기 워커의 구독자도 redis 를 거쳐 받음(워커 간 순서가 같게)
+        self.counters["published"] += 1
+        return await self._r.publish(self.prefix + channel, json.dumps(message, ensure_ascii=False))
+
+    def publish_nowait(self, channel: str, message: Dict[str, Any]) -> None:
+        """발행 대기열에 넣고 바로 반환. redis 가 느려도 지원자 피드백은 기다리지 않음"""
+        now = time.monotonic()
+        idle = self._idle.get(channel)
+        if idle is not None and channel not in self._subs:
+            if now - idle < IDLE_RECHECK_SEC:
+                self.counters["skipped"] += 1
+                return
+            del self._idle[channel]
+        if self._out is None:
+            self._out = asyncio.Queue(maxsize=settings.REALTIME_PUBLISH_QUEUE)
+        if self._out.full():
+            self._out.get_nowait()
+            self.counters["publish_dropped"] += 1
+        self._out.put_nowait((channel, message))
+        if self._sender is None or self._sender.done():
+            self._sender = asyncio.create_task(self._send())
+
+    async def _send(self) -> None:
+        while True:
+            channel, message = await self._out.get()
+            try:
+                n = await asyncio.wait_for(self.publish(channel, message), settings.REALTIME_PUBLISH_TIMEOUT_SEC)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.counters["errors"] += 1
+                log.warning("redis publish failed (%s): %r", channel, e)
+                continue
+            if n:
+                self._idle.pop(channel, None)
+            else:
+                if len(self._idle) >= 1024:  # 끝난 세션 채널이 쌓이지 않게
+                    now = time.monotonic()
+                    self._idle = {c: t for c, t in self._idle.items() if now - t < IDLE_RECHECK_SEC}
+                self._idle[channel] = time.monotonic()
+
+    async def _read(self) -> None:
+        while True:
+            try:
+                msg = await self._ps.get_message(ignore_subscribe_messages=True, timeout=1.0)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.counters["errors"] += 1
+                log.exception("redis pubsub read failed")
+                await asyncio.sleep(1.0)
+                continue
+            if not msg or msg.get("type") != "message":
+                continue
+            channel = msg["channel"]
+            channel = (channel.decode() if isinstance(channel, bytes) else channel)[len(self.prefix):]
+            try:
+                self._fanout(channel, json.loads(msg["data"]))
+            except ValueError:
+                self.counters["errors"] += 1
+
+    @asynccontextmanager
+    async def subscribe(self, channel: str) -> AsyncIterator[Subscription]:
+        async with self._sub_lock:
+            first = channel not in self._subs
+            sub = self._add(channel)
+            if first:
+                await self._ps.subscribe(self.prefix + channel)
+            if self._reader is None:
+                self._reader = asyncio.create_task(self._read())
+        try:
+            yield sub
+        finally:
+            async with self._sub_lock:
+                if self._remove(sub):
+                    await self._ps.unsubscribe(self.prefix + channel)
+
+    async def close(self) -> None:
+        for t in (self._reader, self._sender):
+            if t:
+                t.cancel()
+                await asyncio.gather(t, return_exceptions=True)
+        self._reader = self._sender = None
+        await self._ps.aclose()
+        await super().close()
+
+def make_broker(name: str) -> MemoryBroker:
+    if name == "memory":
+        return MemoryBroker()
+    if name == "redis":
+        return RedisBroker(settings.REDIS_URL)
+    raise ValueError(f"unknown REALTIME_BROKER: {name}")
+
+broker = make_broker(settings.REALTIME_BROKER)
@@ -0,0 +1,189 @@
+# app/services/report_cache.py
+"""
+LLM 리포트 결과 캐시(내용 주소 방식)
+- 키 = sha256(정규화한 리포트 입력 payload + LLM_MODEL + PROMPT_VERSION)
+  세션 id/생성 시각은 빼므로 내용이 같으면 같은 키 → 답변이 바뀌지 않았으면 LLM 을 다시 부르지 않음
+- 백엔드: memory(프로세스 내 LRU+TTL) | sqlite(파일, 재시작 후에도 유지) | redis(여러 프로세스 공유) | none
+- 조회/저장 실패는 캐시 미스로 취급(리포트 생성 자체는 막지 않음)
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.core.config import settings
+
+log = logging.getLogger("report.cache")
+
+def _normalize(payload: Dict[str, Any]) -> Dict[str, Any]:
+    s = payload.get("session", {})
+    return {
+        "session": {k: s.get(k) for k in ("role", "job_title", "level", "difficulty")},
+        "qas": [
+            {
+                "question": qa.get("question"),
+                "rubric_keywords": qa.get("rubric_keywords"),
+                "missing_keywords": qa.get("missing_keywords"),
+                "answer": qa.get("answer"),
+                "analytics": {k: round(v, 4) if isinstance(v, float) else v for k, v in sorted((qa.get("analytics") or {}).items())},
+            }
+            for qa in payload.get("qas", [])
+        ],
+    }
+
+def cache_key(payload: Dict[str, Any], model: str, prompt_version: str) -> str:
+    blob = json.dumps(
+        {"payload": _normalize(payload), "model": model, "prompt": prompt_version},
+        ensure_ascii=False, sort_keys=True, separators=(",", ":"),
+    )
+    return hashlib.sha256(blob.encode()).hexdigest()
+
+# --------------------------------------------
+# 백엔드 (get/set 은 JSON 직렬화 가능한 dict)
+# --------------------------------------------
+class MemoryCache:
+    def __init__(self, max_items: int, ttl_sec: float):
+        self.max_items = max_items
+        self.ttl_sec = ttl_sec
+        self._data: "OrderedDict[str, tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at < time.time():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        self._data[key] = (time.time() + self.ttl_sec, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_items:
+            self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+class SqliteCache:
+    """단일 파일 KV. 호출마다 짧은 커넥션을 스레드에서 열어 이벤트 루프를 막지 않음"""
+
+    def __init__(self, path: str, ttl_sec: float):
+        self.path = path
+        self.ttl_sec = ttl_sec
+        with self._conn() as c:
+            c.execute("CREATE TABLE IF NOT EXISTS report_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)")
+
+    def _conn(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5)
+
+    def _get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._conn() as c:
+            row = c.execute("SELECT value, expires_at FROM report_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] < time.time():
+                c.execute("DELETE FROM report_cache WHERE key = ?", (key,))
+                return None
+            return json.loads(row[0])
+
+    def _set(self, key: str, value: Dict[str, Any]) -> None:
+        now = time.time()
+        with self._conn() as c:
+            c.execute(
+                "INSERT OR REPLACE INTO report_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), now + self.ttl_sec),
+            )
+            c.execute("DELETE FROM report_cache WHERE expires_at < ?", (now,))
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        await asyncio.to_thread(self._set, key, value)
+
+class RedisCache:
+    """Redis 호환 서버(redis/valkey/dragonfly). redis 패키지가 필요"""
+
+    def __init__(self, url: str, ttl_sec: float, prefix: str = "report:"):
+        try:
+            import redis.asyncio as aioredis
+        except ImportError as e:
+            raise RuntimeError("REPORT_CACHE_BACKEND=redis requires the 'redis' package") from e
+        self._r = aioredis.from_url(url)
+        self.ttl_sec = ttl_sec
+        self.prefix = prefix
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        raw = await self._r.get(self.prefix + key)
+        return json.loads(raw) if raw else None
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        await self._r.set(self.prefix + key, json.dumps(value, ensure_ascii=False), ex=int(self.ttl_sec))
+
+class ReportCache:
+    """백엔드 + hit/miss 지표"""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = self.misses = self.sets = self.errors = 0
+        self._get_ms = 0.0
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.backend is None:
+            return None
+        t0 = time.perf_counter()
+        try:
+            value = await self.backend.get(key)
+        except Exception:
+            self.errors += 1
+            log.exception("report cache get failed")
+            value = None
+        self._get_ms += (time.perf_counter() - t0) * 1000
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    async def set(self, key: str, value: Dict[str, Any]) -> None:
+        if self.backend is None:
+            return
+        try:
+            await self.backend.set(key, value)
+            self.sets += 1
+        except Exception:
+            self.errors += 1
+            log.exception("report cache set failed")
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__ if self.backend is not None else "none",
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "sets": self.sets,
+            "errors": self.errors,
+            "avg_get_ms": round(self._get_ms / lookups, 3) if lookups else 0.0,
+        }
+
+def make_backend(name: str):
+    ttl = settings.REPORT_CACHE_TTL_SEC
+    if name == "memory":
+        return MemoryCache(settings.REPORT_CACHE_MAX_ITEMS, ttl)
+    if name == "sqlite":
+        return SqliteCache(settings.REPORT_CACHE_PATH, ttl)
+    if name == "redis":
+        return RedisCache(settings.REDIS_URL, ttl)
+    if name == "none":
+        return None
+    raise ValueError(f"unknown REPORT_CACHE_BACKEND: {name}")
+
+report_cache = ReportCache(make_backend(settings.REPORT_CACHE_BACKEND))
@@ -0,0 +1,203 @@
+# app/services/report_jobs.py
+"""
+최종 리포트 생성 작업(ReportJob)
+- POST 는 job id 만 돌려주고, 수집 → LLM(공용 AsyncClient) → Report upsert 는 백그라운드 태스크로 진행
+- 같은 세션에 진행 중인 작업이 있으면 새로 만들지 않고 그 작업을 돌려줌(동시 요청은 부분 UNIQUE 인덱스로 막음)
+- LLM 실패/서킷 open 은 generate_report 안에서 규칙기반 리포트로 폴백되므로 작업은 대부분 done
+- 재시작 시 queued/running 작업 재실행(resume_pending_jobs) ※ 단일 프로세스 기준
+"""
+import asyncio
+import logging
+import uuid
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import AsyncSessionLocal, AsyncWriteSessionLocal
+from app.db import models as m
+from app.services.analyze import keyword_hits
+from app.services.report_llm import generate_report
+
+log = logging.getLogger("report.jobs")
+
+ACTIVE = ("queued", "running")
+TERMINAL = ("done", "failed")
+
+_tasks: set = set()
+
+async def collect_session_payload(db: AsyncSession, session_id: int) -> Optional[Dict[str, Any]]:
+    """리포트 입력(세션 메타 + 질문별 최신 답변/분석). 세션이 없으면 None"""
+    s = await db.get(m.Session, session_id)
+    if not s:
+        return None
+
+    # Q/A + Analytics 를 한 번에: 질문별 최신 답변(가장 큰 id) + 분석 결과(없을 수 있음)
+    latest = (
+        select(func.max(m.Answer.id).label("id"))
+        .join(m.Question, m.Question.id == m.Answer.question_id)
+        .where(m.Question.session_id == s.id)
+        .group_by(m.Answer.question_id)
+        .subquery()
+    )
+    rows = (await db.execute(
+        select(m.Question.text, m.Question.rubric_keywords, m.Answer.transcript, m.Analytics)
+        .join(m.Answer, m.Answer.question_id == m.Question.id)
+        .join(latest, latest.c.id == m.Answer.id)
+        .outerjoin(m.Analytics, m.Analytics.answer_id == m.Answer.id)
+        .where(m.Question.session_id == s.id)
+        .order_by(m.Question.id)
+    )).all()
+
+    payload_qas = []
+    for q_text, rubric, transcript, an in rows:
+        kws = [s.strip() for s in (rubric or "").split(",") if s.strip()]
+        hit = set(keyword_hits(transcript, kws))
+        payload_qas.append({
+            "question": q_text,
+            "rubric_keywords": rubric,
+            "missing_keywords": [kw for kw in kws if kw not in hit],
+            "answer": transcript,
+            "analytics": {
+                "filler_ratio": getattr(an, "filler_ratio", 0.0),
+                "wpm": getattr(an, "wpm", 0.0),
+                "sentiment": getattr(an, "sentiment", "neu"),
+                "keyword_hit_rate": getattr(an, "keyword_hit_rate", 0.0),
+                "clarity_score": getattr(an, "clarity_score", 2.5),
+                "coherence_score": getattr(an, "coherence_score", 2.5),
+            }
+        })
+
+    return {
+        "session": {
+            "id": s.id,
+            "role": s.role,
+            "job_title": s.job_title,
+            "level": s.level,
+            "difficulty": s.difficulty,
+            "created_at": s.created_at.isoformat(),
+        },
+        "qas": payload_qas,
+    }
+
+async def save_report(db: AsyncSession, session_id: int, data: Dict[str, Any]) -> m.Report:
+    """세션당 1개 upsert(커밋 포함)"""
+    rep = await db.scalar(select(m.Report).where(m.Report.session_id == session_id))
+    if rep is None:
+        rep = m.Report(session_id=session_id)
+        db.add(rep)
+    rep.total_score = data.get("total_score", 0.0)
+    rep.summary_md = data.get("summary_md", "## 요약\n- 데이터 부족")
+    rep.suggestions_md = data.get("suggestions_md", "## 다음 연습 질문\n- 데이터 부족")
+    await db.commit()
+    return rep
+
+# --------------------------------------------
+# 작업 테이블
+# --------------------------------------------
+async def _active_job(db: AsyncSession, session_id: int) -> Optional[m.ReportJob]:
+    return await db.scalar(
+        select(m.ReportJob).where(m.ReportJob.session_id == session_id, m.ReportJob.status.in_(ACTIVE))
+    )
+
+async def create_job(db: AsyncSession, session_id: int) -> m.ReportJob:
+    job = await _active_job(db, session_id)
+    if job:
+        return job
+    job = m.ReportJob(id=uuid.uuid4().hex, session_id=session_id, status="queued", error="")
+    db.add(job)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # 동시에 들어온 요청이 먼저 만듦(uq_report_jobs_active_session) → 그 작업을 돌려줌
+        await db.rollback()
+        job = await db.scalar(
+            select(m.ReportJob).where(m.ReportJob.session_id == session_id)
+            .order_by(m.ReportJob.created_at.desc()).limit(1)  # 그새 끝났을 수도 있으니 상태 무관 최신
+        )
+        if job is None:
+            raise
+        return job
+    enqueue(job.id)
+    return job
+
+def job_to_dict(job: m.ReportJob) -> Dict[str, Any]:
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "session_id": job.session_id,
+        "report_id": job.report_id,
+        "error": job.error or None,
+        "created_at": job.created_at.isoformat(),
+        "updated_at": job.updated_at.isoformat(),
+    }
+
+async def get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    async with AsyncSessionLocal() as db:
+        job = await db.get(m.ReportJob, job_id)
+        return job_to_dict(job) if job else None
+
+async def _set_status(job_id: str, status: str, error: str = "", report_id: Optional[int] = None) -> None:
+    async with AsyncWriteSessionLocal() as db:
+        job = await db.get(m.ReportJob, job_id)
+        if job:
+            job.status = status
+            job.error = error
+            if report_id is not None:
+                job.report_id = report_id
+            await db.commit()
+
+async def _pending_ids() -> List[str]:
+    async with AsyncWriteSessionLocal() as db:
+        jobs = (await db.scalars(
+            select(m.ReportJob).where(m.ReportJob.status.in_(ACTIVE)).order_by(m.ReportJob.created_at)
+        )).all()
+        for j in jobs:
+            j.status = "queued"
+        await db.commit()
+        return [j.id for j in jobs]
+
+# --------------------------------------------
+# 실행
+# --------------------------------------------
+async def _run(job_id: str) -> None:
+    try:
+        async with AsyncSessionLocal() as db:  # 조회는 읽기 풀에서 — 쓰기 연결은 상태 갱신/저장 때만
+            job = await db.get(m.ReportJob, job_id)
+            if not job:
+                return
+            session_id = job.session_id
+            await _set_status(job_id, "running")
+            payload = await collect_session_payload(db, session_id)
+        if not payload or not payload["qas"]:
+            await _set_status(job_id, "failed", "No answers found for this session")
+            return
+        data = await generate_report(payload)  # DB 세션을 잡지 않은 채로 LLM 대기
+        async with AsyncWriteSessionLocal() as db:
+            rep = await save_report(db, session_id, data)
+            report_id = rep.id
+        await _set_status(job_id, "done", report_id=report_id)
+    except asyncio.CancelledError:
+        raise  # 종료 중: 재시작 시 복구
+    except Exception as e:
+        log.exception("report job %s failed", job_id)
+        await _set_status(job_id, "failed", f"report failed: {e}")
+
+def enqueue(job_id: str) -> None:
+    t = asyncio.create_task(_run(job_id))
+    _tasks.add(t)
+    t.add_done_callback(_tasks.discard)
+
+async def resume_pending_jobs() -> int:
+    ids = await _pending_ids()
+    for job_id in ids:
+        enqueue(job_id)
+    if ids:
+        log.info("resumed %d report jobs", len(ids))
+    return len(ids)
+
+async def cancel_running_jobs() -> None:
+    for t in list(_tasks):
+        t.cancel()
+    await asyncio.gather(*_tasks, return_exceptions=True)
@@ -1,6 +1,16 @@
 # app/services/report_llm.py
-from typing import Any, Dict
+import json
+import logging
+import os
+from typing import Any, AsyncIterator, Dict, Tuple
 from app.core.config import settings
+from app.services.json_stream import JsonFieldStream
+from app.services.llm_client import LLMUnavailable, post_json, stream_events
+from app.services.report_cache import cache_key, report_cache
+
+log = logging.getLogger("llm.report")
+
+PROMPT_VERSION = "chat-json-1"  # 프롬프트/스키마를 바꾸면 올려서 캐시 무효화
 
 def _fallback_report(payload: Dict[str, Any]) -> Dict[str, Any]:
     """LLM 실패/미사용 시 간단 규칙기반 리포트 생성"""
@@ -14,7 +24,9 @@ def _fallback_report(payload: Dict[str, Any]) -> Dict[str, Any]:
         if an.get("keyword_hit_rate", 0) >= 0.6:
             strengths.append(f"- `{qa['question'][:28]}...`: 키워드 충족률 양호")
         else:
-            improvements.append(f"- `{qa['question'][:28]}...`: 핵심 키워드 언급 강화 필요")
+            missing = qa.get("missing_keywords") or []
+            hint = f" (누락: {', '.join(missing[:5])})" if missing else ""
+            improvements.append(f"- `{qa['question'][:28]}...`: 핵심 키워드 언급 강화 필요{hint}")
         if an.get("filler_ratio", 0) > 0.08:
             improvements.append("- 충전어(음/어) 줄이기")
 
@@ -36,15 +48,13 @@ def _fallback_report(payload: Dict[str, Any]) -> Dict[str, Any]:
         "suggestions_md": suggestions_md,
     }
 
-def _responses_json(payload: Dict[str, Any]) -> Dict[str, Any]:
+async def _responses_json(payload: Dict[str, Any]) -> Dict[str, Any]:
     """
     OpenAI Responses API + Structured Outputs 로 JSON 스키마 강제
     """
-    import os, json, httpx
-
     api_key = settings.OPENAI_API_KEY or os.getenv("OPENAI_API_KEY")
     if not api_key:
-        return _fallback_report(payload)
+        raise LLMUnavailable("OPENAI_API_KEY is not set")  # 호출 측에서 폴백(캐시하지 않음)
 
     # 모델이 반드시 지켜야 하는 JSON 스키마
     json_schema = {
@@ -83,28 +93,34 @@ def _responses_json(payload: Dict[str, Any]) -> Dict[str, Any]:
         "temperature": 0.2,
     }
 
-    url = "https://api.openai.com/v1/responses"
     headers = {"Authorization": f"Bearer {api_key}"}
 
-    with httpx.Client(timeout=60) as client:
-        r = client.post(url, json=req, headers=headers)
-        r.raise_for_status()
-        out = r.json()
-        # Structured Outputs 사용 시 JSON 문자열이 content에 들어옵니다.
-        # (Responses API 포맷: output[0].content[0].text)
-        if "output" in out:
-            text = out["output"][0]["content"][0]["text"]
-        else:
-            # (호환) chat.completions 경로로 응답이 온 경우
-            text = out["choices"][0]["message"]["content"]
-        return json.loads(text)
+    out = await post_json("/responses", req, headers=headers)
+    # Structured Outputs 사용 시 JSON 문자열이 content에 들어옵니다.
+    # (Responses API 포맷: output[0].content[0].text)
+    if "output" in out:
+        text = out["output"][0]["content"][0]["text"]
+    else:
+        # (호환) chat.completions 경로로 응답이 온 경우
+        text = out["choices"][0]["message"]["content"]
+    return json.loads(text)
 
-def generate_report(payload: Dict[str, Any]) -> Dict[str, Any]:
+async def generate_report(payload: Dict[str, Any]) -> Dict[str, Any]:
     if settings.LLM_PROVIDER != "openai":
         return _fallback_report(payload)
+    key = cache_key(payload, settings.LLM_MODEL, PROMPT_VERSION)
+    cached = await report_cache.get(key)
+    if cached is not None:
+        return cached
     try:
-        return _chat_json(payload)   # ✅ 우선 JSON 모드로 안정 실행
+        data = await _chat_json(payload)   # ✅ 우선 JSON 모드로 안정 실행
+        await report_cache.set(key, data)  # 폴백 결과는 캐시하지 않음(다음에 LLM 재시도)
+        return data
+    except LLMUnavailable as e:
+        log.warning("LLM report unavailable, using fallback: %s", e)
+        return _fallback_report(payload)
     except Exception:
+        log.exception("LLM report failed, using fallback")
         return _fallback_report(payload)
     # """
     # payload = {
@@ -121,16 +137,15 @@ def generate_report(payload: Dict[str, Any]) -> Dict[str, Any]:
 
     # # OpenAI Responses API 경로
     # try:
-    #     return _responses_json(payload)
+    #     return await _responses_json(payload)
     # except Exception:
     #     # 문제가 생기면 언제나 폴백
     #     return _fallback_report(payload)
 
-def _chat_json(payload: Dict[str, Any]) -> Dict[str, Any]:
-    import os, json, httpx
+def _chat_request(payload: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, str]]:
     api_key = settings.OPENAI_API_KEY or os.getenv("OPENAI_API_KEY")
     if not api_key:
-        return _fallback_report(payload)
+        raise LLMUnavailable("OPENAI_API_KEY is not set")  # 호출 측에서 폴백(캐시하지 않음)
 
     system = (
         "You are a Korean interview coach. Write concise, actionable Markdown. "
@@ -151,11 +166,64 @@ def _chat_json(payload: Dict[str, Any]) -> Dict[str, Any]:
         "response_format": {"type": "json_object"},
     }
     headers = {"Authorization": f"Bearer {api_key}"}
-    url = "https://api.openai.com/v1/chat/completions"
+    return req, headers
 
-    with httpx.Client(timeout=60) as client:
-        r = client.post(url, json=req, headers=headers)
-        r.raise_for_status()
-        out = r.json()
-        text = out["choices"][0]["message"]["content"]
-        return json.loads(text)
+async def _chat_json(payload: Dict[str, Any]) -> Dict[str, Any]:
+    req, headers = _chat_request(payload)
+    out = await post_json("/chat/completions", req, headers=headers)
+    text = out["choices"][0]["message"]["content"]
+    return json.loads(text)
+
+# --------------------------------------------
+# 스트리밍: ("delta", {"field","text"}) ... → ("done", report dict)
+# --------------------------------------------
+STREAM_FIELDS = ("summary_md", "suggestions_md")
+
+def _whole(data: Dict[str, Any], source: str) -> list:
+    """캐시/폴백처럼 이미 완성된 리포트를 같은 이벤트 모양으로"""
+    events = [("delta", {"field": f, "text": data.get(f, "")}) for f in STREAM_FIELDS if data.get(f)]
+    return events + [("done", {**data, "source": source})]
+
+async def stream_report(payload: Dict[str, Any]) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+    """
+    공급자 스트리밍 모드로 리포트 생성. summary_md/suggestions_md 토큰이 오는 대로 delta 로 내보내고,
+    끝나면 전체 JSON 을 done 으로. 스트림 시작 전 실패는 폴백, 도중 실패는 그때까지 보낸 뒤 폴백 done
+    """
+    if settings.LLM_PROVIDER != "openai":
+        for ev in _whole(_fallback_report(payload), "fallback"):
+            yield ev
+        return
+    key = cache_key(payload, settings.LLM_MODEL, PROMPT_VERSION)
+    cached = await report_cache.get(key)
+    if cached is not None:
+        for ev in _whole(cached, "cache"):
+            yield ev
+        return
+
+    parser = JsonFieldStream(STREAM_FIELDS)
+    parts: list[str] = []
+    try:
+        req, headers = _chat_request(payload)
+        async for chunk in stream_events("/chat/completions", {**req, "stream": True}, headers=headers):
+            choices = chunk.get("choices") or [{}]
+            text = (choices[0].get("delta") or {}).get("content") or ""
+            if not text:
+                continue
+            parts.append(text)
+            for field, piece in parser.feed(text):
+                yield "delta", {"field": field, "text": piece}
+        data = json.loads("".join(parts))
+    except Exception as e:
+        if isinstance(e, LLMUnavailable):
+            log.warning("LLM report stream unavailable, using fallback: %s", e)
+        else:
+            log.exception("LLM report stream failed, using fallback")
+        data = _fallback_report(payload)
+        if parts:  # 이미 일부를 보냈으면 done 에 전체 폴백을 실어 화면을 덮어쓰게 함
+            yield "done", {**data, "source": "fallback"}
+            return
+        for ev in _whole(data, "fallback"):
+            yield ev
+        return
+    await report_cache.set(key, data)
+    yield "done", {**data, "source": "llm"}
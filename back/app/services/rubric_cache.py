@@ -0,0 +1,118 @@
+# app/services/rubric_cache.py
+"""
+질문 루브릭 캐시(프로세스 공용 LRU)
+- 질문은 만들어진 뒤 바뀌지 않으므로 question_id → (session_id, 키워드 목록) 을 한 번만 읽고 파싱
+  (키워드 매처는 analyze 쪽 get_matcher() 캐시가 키워드 묶음별로 재사용)
+- 답변 제출/오디오 업로드/전사 작업/실시간 연결이 모두 공유(연결이 끊겨도 남음)
+- 세션 생성 시 prime() 으로 미리 채워 첫 답변도 DB 를 거치지 않음
+- 없는 질문은 캐시하지 않음(나중에 생길 수 있는 id 를 막지 않도록)
+- 무효화: invalidate(qid) / invalidate_session(sid) / clear(), ORM 으로 질문을 수정/삭제하면 자동 무효화
+"""
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from sqlalchemy import event, select
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.db import models as m
+
+class Rubric(NamedTuple):
+    question_id: int
+    session_id: int
+    keywords: List[str]
+
+def parse_keywords(raw: Optional[str]) -> List[str]:
+    return [s.strip() for s in (raw or "").split(",") if s.strip()]
+
+def make_rubric(question_id: int, session_id: int, keywords: Sequence[str]) -> Rubric:
+    return Rubric(question_id, session_id, [k.strip() for k in keywords if k.strip()])
+
+class RubricCache:
+    def __init__(self, max_items: int):
+        self.max_items = max_items
+        self._items: "OrderedDict[int, Rubric]" = OrderedDict()
+        self.hits = self.misses = self.loads = self.evictions = self.invalidations = 0
+
+    def _put(self, rub: Rubric) -> None:
+        self._items[rub.question_id] = rub
+        self._items.move_to_end(rub.question_id)
+        while len(self._items) > self.max_items:
+            self._items.popitem(last=False)
+            self.evictions += 1
+
+    def peek(self, question_id: int) -> Optional[Rubric]:
+        rub = self._items.get(question_id)
+        if rub is not None:
+            self._items.move_to_end(question_id)
+        return rub
+
+    async def get(self, question_id: int) -> Optional[Rubric]:
+        """캐시 → 없으면 DB. 질문이 없으면 None"""
+        return (await self.get_many([question_id])).get(question_id)
+
+    async def get_many(self, question_ids: Iterable[int]) -> Dict[int, Rubric]:
+        """여러 질문을 한 번에(미스만 한 쿼리로 읽음). 없는 질문은 결과에서 빠짐"""
+        out: Dict[int, Rubric] = {}
+        missing = []
+        for qid in dict.fromkeys(question_ids):
+            rub = self.peek(qid)
+            if rub is None:
+                missing.append(qid)
+            else:
+                out[qid] = rub
+        self.hits += len(out)
+        self.misses += len(missing)
+        if missing:
+            async with AsyncSessionLocal() as db:
+                rows = (await db.execute(
+                    select(m.Question.id, m.Question.session_id, m.Question.rubric_keywords)
+                    .where(m.Question.id.in_(missing))
+                )).all()
+            self.loads += 1
+            for qid, sid, raw in rows:
+                out[qid] = make_rubric(qid, sid, parse_keywords(raw))
+                self._put(out[qid])
+        return out
+
+    def prime(self, session_id: int, questions: Iterable[Tuple[int, Sequence[str]]]) -> None:
+        """방금 저장(커밋)한 세션 질문들 [(question_id, 키워드 목록)] 로 미리 채움"""
+        for qid, kws in questions:
+            self._put(make_rubric(qid, session_id, kws))
+
+    def invalidate(self, question_id: int) -> None:
+        if self._items.pop(question_id, None) is not None:
+            self.invalidations += 1
+
+    def invalidate_session(self, session_id: int) -> None:
+        for qid in [qid for qid, r in self._items.items() if r.session_id == session_id]:
+            self.invalidate(qid)
+
+    def clear(self) -> None:
+        self.invalidations += len(self._items)
+        self._items.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._items),
+            "max_items": self.max_items,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "db_loads": self.loads,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+rubric_cache = RubricCache(settings.RUBRIC_CACHE_MAX_ITEMS)
+
+# ORM 으로 질문/세션을 수정·삭제하면 해당 항목을 무효화(벌크 UPDATE/DELETE 는 직접 invalidate 호출)
+@event.listens_for(m.Question, "after_update")
+@event.listens_for(m.Question, "after_delete")
+def _question_changed(_mapper, _conn, target) -> None:
+    rubric_cache.invalidate(target.id)
+
+@event.listens_for(m.Session, "after_delete")
+def _session_deleted(_mapper, _conn, target) -> None:
+    rubric_cache.invalidate_session(target.id)
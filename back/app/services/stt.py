@@ -1,28 +1,49 @@
 # app/services/stt.py
+import io
+import numpy as np
 from faster_whisper import WhisperModel
-from typing import Optional, Tuple
-from app.core.config import settings
+from typing import BinaryIO, Dict, Iterator, Optional, Tuple, Union
+from app.services.stt_models import model_registry
 
-_model: Optional[WhisperModel] = None
+# 파일 경로 / 메모리에 올라온 파일 내용(짧은 업로드) / 이미 디코딩된 16kHz mono float32(PCM 사이드카)
+AudioSource = Union[str, bytes, np.ndarray]
 
-def get_model() -> WhisperModel:
-    global _model
-    if _model is None:
-        _model = WhisperModel(
-            settings.WHISPER_MODEL_SIZE,
-            device=settings.WHISPER_DEVICE if settings.WHISPER_DEVICE != "auto" else "cpu",
-            compute_type="int8",  # mac CPU에서 빠르고 충분히 정확
-        )
-    return _model
+def as_input(src: AudioSource) -> Union[str, BinaryIO, np.ndarray]:
+    """bytes 면 디코더(PyAV)가 그대로 읽도록 파일 객체로 감쌈. 배열은 모델이 디코딩 없이 바로 사용"""
+    return io.BytesIO(src) if isinstance(src, (bytes, bytearray)) else src
 
-def transcribe_audio(path: str, language: str = "ko") -> Tuple[str, float]:
+def get_model(size: Optional[str] = None) -> WhisperModel:
+    """레지스트리의 모델(기본 WHISPER_MODEL_SIZE). 워커 풀 밖에서 직접 전사할 때용"""
+    return model_registry.get(size)
+
+def transcribe_segments(
+    path: AudioSource, language: str = "ko", model: Optional[WhisperModel] = None
+) -> Tuple[Iterator[Dict[str, Union[str, float]]], float]:
+    """
+    Returns: (segments, duration_sec)
+    segments 는 디코딩되는 즉시 {text, start, end, avg_logprob} 를 내보내는 제너레이터
+    """
+    model = model or get_model()
+    segments, info = model.transcribe(as_input(path), language=language, vad_filter=True)
+
+    def _iter():
+        for seg in segments:
+            text = seg.text.strip()
+            if text:
+                yield {
+                    "text": text,
+                    "start": round(seg.start, 2),
+                    "end": round(seg.end, 2),
+                    "avg_logprob": round(seg.avg_logprob, 3),
+                }
+
+    return _iter(), float(info.duration)
+
+def transcribe_audio(path: AudioSource, language: str = "ko", model: Optional[WhisperModel] = None) -> Tuple[str, float]:
     """
     Returns: (full_text, duration_sec)
+    model 을 넘기면 해당 인스턴스로 전사(워커 풀에서 워커별 모델 사용)
     """
-    model = get_model()
-    segments, info = model.transcribe(path, language=language, vad_filter=True)
-    texts = []
-    for seg in segments:
-        texts.append(seg.text.strip())
-    full = " ".join([t for t in texts if t])
-    return full.strip(), float(info.duration)
+    segments, duration = transcribe_segments(path, language=language, model=model)
+    full = " ".join(seg["text"] for seg in segments)
+    return full.strip(), duration
@@ -0,0 +1,251 @@
+# app/services/stt_live.py
+"""
+실시간(websocket) 음성 스트리밍 전사
+- 클라이언트가 보내는 PCM(s16le/f32le) 또는 Opus 프레임 → 16kHz mono float 롤링 버퍼
+- STT_LIVE_STEP_SEC 마다 버퍼 전체를 STT 풀에서 다시 전사(word timestamps)하고
+  LocalAgreement-2: 직전 가설과 이번 가설이 앞에서부터 일치하는 단어까지만 확정(commit)
+- 확정된 단어 끝까지는 버퍼에서 잘라내 버퍼 길이를 STT_LIVE_BUFFER_SEC 안으로 유지
+- 프레임 대기열은 연결별로 상한(STT_LIVE_MAX_PENDING_FRAMES). 가득 차면 수신 루프가 기다림(backpressure)
+- 깨진 프레임/전사 실패는 on_error 로 알리고 다음 프레임을 계속 처리
+"""
+import asyncio
+import logging
+import re
+from typing import Awaitable, Callable, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.stt_pool import SttQueueFull, SttWorkerPool, stt_pool
+
+log = logging.getLogger("stt.live")
+
+SR = 16000
+FORMATS = ("pcm_s16le", "pcm_f32le", "opus")
+PROMPT_CHARS = 200  # 이전 확정 텍스트를 initial_prompt 로(문맥 유지)
+
+Word = Tuple[float, float, str]  # (start, end, text) — 초, 스트림 시작 기준
+
+def transcribe_words(audio: np.ndarray, offset_sec: float, language: str = "ko", prompt: str = "", model=None) -> List[Word]:
+    """워커에서 실행: 버퍼 전사 → 단어 단위 (start, end, text)"""
+    segments, _ = model.transcribe(
+        audio, language=language, word_timestamps=True, vad_filter=False, beam_size=1,
+        condition_on_previous_text=False, initial_prompt=prompt or None,
+    )
+    return [(w.start + offset_sec, w.end + offset_sec, w.word) for seg in segments for w in (seg.words or [])]
+
+def _norm(word: str) -> str:
+    return re.sub(r"[^\w]", "", word).lower()
+
+class LocalAgreement:
+    """연속한 두 가설의 공통 접두 단어만 확정"""
+
+    def __init__(self):
+        self.committed: List[Word] = []
+        self._prev: List[Word] = []
+
+    @property
+    def committed_end(self) -> float:
+        return self.committed[-1][1] if self.committed else 0.0
+
+    def insert(self, words: List[Word]) -> List[Word]:
+        # 이미 확정된 시간대는 버리고, 확정 꼬리와 겹쳐 다시 나온 n-gram(1~5) 도 제거
+        words = [w for w in words if w[0] > self.committed_end - 0.1]
+        if words and self.committed and abs(words[0][0] - self.committed_end) < 1.0:
+            for n in range(min(5, len(words), len(self.committed)), 0, -1):
+                if [_norm(w[2]) for w in self.committed[-n:]] == [_norm(w[2]) for w in words[:n]]:
+                    words = words[n:]
+                    break
+        agreed: List[Word] = []
+        for a, b in zip(self._prev, words):
+            if _norm(a[2]) != _norm(b[2]):
+                break
+            agreed.append(b)
+        self.committed += agreed
+        self._prev = words[len(agreed):]
+        return agreed
+
+    def pending(self) -> List[Word]:
+        return list(self._prev)
+
+    def flush(self) -> List[Word]:
+        """스트림 종료: 남은 가설을 그대로 확정"""
+        rest, self._prev = self._prev, []
+        self.committed += rest
+        return rest
+
+class FrameDecoder:
+    def __init__(self, fmt: str, sample_rate: int):
+        if fmt not in FORMATS:
+            raise ValueError(f"unsupported audio format: {fmt}")
+        self.fmt = fmt
+        self.sample_rate = sample_rate
+        self._codec = self._resampler = None
+        self._rest = b""  # PCM 샘플 경계에 안 맞아 남은 바이트(다음 프레임 앞에 붙임)
+        if fmt == "opus":
+            import av  # faster-whisper 의존성(PyAV)
+            self._codec = av.CodecContext.create("opus", "r")
+            self._resampler = av.AudioResampler(format="flt", layout="mono", rate=SR)
+
+    def decode(self, frame: bytes) -> np.ndarray:
+        if self.fmt == "opus":
+            import av
+            out = []
+            for f in self._codec.decode(av.Packet(frame)):
+                for r in self._resampler.resample(f):
+                    out.append(r.to_ndarray().reshape(-1))
+            return np.concatenate(out).astype(np.float32) if out else np.zeros(0, np.float32)
+        width = 2 if self.fmt == "pcm_s16le" else 4
+        data = self._rest + frame
+        cut = len(data) - len(data) % width
+        data, self._rest = data[:cut], data[cut:]
+        if self.fmt == "pcm_s16le":
+            pcm = np.frombuffer(data, dtype="<i2").astype(np.float32) / 32768.0
+        else:
+            pcm = np.frombuffer(data, dtype="<f4").astype(np.float32)
+        if self.sample_rate != SR and len(pcm):  # 단순 선형 보간 리샘플
+            n = int(round(len(pcm) * SR / self.sample_rate))
+            pcm = np.interp(np.linspace(0, len(pcm) - 1, n), np.arange(len(pcm)), pcm).astype(np.float32)
+        return pcm
+
+Emit = Callable[[str, str, float], Awaitable[None]]  # (새로 확정된 텍스트, 미확정 텍스트, 받은 오디오 길이 초)
+OnError = Callable[[str], Awaitable[None]]
+
+class LiveTranscriber:
+    def __init__(
+        self,
+        emit: Emit,
+        fmt: str = "pcm_s16le",
+        sample_rate: int = SR,
+        language: str = "ko",
+        model_size: Optional[str] = None,
+        pool: Optional[SttWorkerPool] = None,
+        on_error: Optional[OnError] = None,
+    ):
+        self.decoder = FrameDecoder(fmt, sample_rate)
+        self.emit = emit
+        self.on_error = on_error
+        self.language = language
+        self.model_size = model_size or settings.STT_LIVE_MODEL_SIZE
+        self.pool = pool or stt_pool
+        self.agreement = LocalAgreement()
+        self.frames: asyncio.Queue = asyncio.Queue(maxsize=settings.STT_LIVE_MAX_PENDING_FRAMES)
+        self._buf = np.zeros(0, np.float32)
+        self._buf_start = 0.0   # 버퍼 첫 샘플의 스트림 시각(초)
+        self._received = 0      # 받은 총 샘플 수
+        self._since_step = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def audio_sec(self) -> float:
+        return self._received / SR
+
+    def start(self) -> "LiveTranscriber":
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    def _alive(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def _put(self, item: Optional[bytes]) -> None:
+        """대기열이 빌 때까지 기다려 넣기. 그 사이 전사 태스크가 끝나면 더 기다리지 않음"""
+        put = asyncio.ensure_future(self.frames.put(item))
+        try:
+            await asyncio.wait({put, self._task}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            if not put.done():
+                put.cancel()
+
+    async def push(self, frame: bytes) -> bool:
+        """프레임 넣기. 대기열이 가득 차서 기다렸으면 True(클라이언트에 알릴 용도). 전사 태스크가 끝났으면 버림"""
+        if not self._alive():
+            return False
+        if not self.frames.full():
+            self.frames.put_nowait(frame)
+            return False
+        await self._put(frame)  # 처리 쪽이 따라잡을 때까지 수신 루프를 멈춤
+        return True
+
+    async def finish(self) -> None:
+        """남은 프레임 처리 + 마지막 확정. 전사 태스크의 예외는 여기서 다시 던지지 않음"""
+        if self._alive():
+            await self._put(None)
+        if self._task:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    def cancel(self) -> None:
+        if self._task:
+            self._task.cancel()
+
+    async def close(self) -> None:
+        """연결 종료: 태스크를 취소하고 끝날 때까지 기다림"""
+        self.cancel()
+        if self._task:
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _report(self, what: str, e: Exception) -> None:
+        log.warning("live transcription %s failed: %s", what, e)
+        if self.on_error is not None:
+            try:
+                await self.on_error(f"{what} failed: {e}")
+            except Exception:
+                log.exception("live transcription error report failed")
+
+    async def _run(self) -> None:
+        """프레임 하나가 깨지거나 전사가 실패해도 알리고 계속(태스크가 죽으면 대기열이 안 비어 수신 루프가 멈춤)"""
+        step = int(settings.STT_LIVE_STEP_SEC * SR)
+        while True:
+            frame = await self.frames.get()
+            if frame is None:
+                break
+            try:
+                pcm = self.decoder.decode(frame)
+            except Exception as e:
+                await self._report("audio decode", e)
+                continue
+            self._buf = np.concatenate([self._buf, pcm])
+            self._received += len(pcm)
+            self._since_step += len(pcm)
+            if self._since_step >= step and self.frames.empty():  # 밀려 있으면 모아서 한 번에
+                self._since_step = 0
+                try:
+                    await self._step()
+                except Exception as e:
+                    self._trim()  # 실패가 이어져도 버퍼는 STT_LIVE_BUFFER_SEC 안으로
+                    await self._report("transcription", e)
+        try:
+            await self._step(final=True)
+        except Exception as e:
+            await self._report("transcription", e)
+
+    async def _step(self, final: bool = False) -> None:
+        if len(self._buf):
+            prompt = "".join(w[2] for w in self.agreement.committed)[-PROMPT_CHARS:]
+            try:
+                words = await self.pool.submit(
+                    transcribe_words, self._buf, self._buf_start,
+                    language=self.language, prompt=prompt, model_size=self.model_size,
+                )
+            except SttQueueFull:
+                words = None  # 풀이 바쁘면 이번 스텝은 건너뜀(버퍼는 다음 스텝에 그대로)
+            if words is not None:
+                new = self.agreement.insert(words)
+                if final:
+                    new += self.agreement.flush()
+                self._trim()
+                if new or not final:
+                    await self.emit("".join(w[2] for w in new), "".join(w[2] for w in self.agreement.pending()), self.audio_sec)
+                return
+        if final:
+            rest = self.agreement.flush()
+            await self.emit("".join(w[2] for w in rest), "", self.audio_sec)
+
+    def _trim(self) -> None:
+        """확정된 마지막 단어 끝까지 버퍼에서 제거, 그래도 길면 오래된 쪽을 버림"""
+        cut = int((self.agreement.committed_end - self._buf_start) * SR)
+        limit = int(settings.STT_LIVE_BUFFER_SEC * SR)
+        if len(self._buf) - max(cut, 0) > limit:
+            cut = len(self._buf) - limit
+        if cut > 0:
+            self._buf = self._buf[cut:]
+            self._buf_start += cut / SR
@@ -0,0 +1,192 @@
+# app/services/stt_long.py
+"""
+긴 오디오 전사: VAD 무음 경계에서 청크로 나눠 STT 워커 풀에 병렬 투입 → 타임스탬프 보정 후 이어 붙임
+- 청크는 음성 구간을 STT_CHUNK_SEC 까지 묶어서 만들고, 무음 없이 긴 구간만 겹침(STT_CHUNK_OVERLAP_SEC)을 두고 강제 분할
+- 겹친 부분의 중복 세그먼트는 "세그먼트 중앙이 어느 청크 담당 구간에 있나"로 한쪽만 남김
+- 결과는 transcribe_audio 와 같은 (text, duration_sec)
+- transcribe_file(): 길이가 STT_LONG_AUDIO_SEC 이상이면 청크 모드, 아니면 기존 단일 전사
+"""
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.core.config import settings
+from app.services.stt import AudioSource, as_input, transcribe_audio
+from app.services.stt_pool import SttQueueFull, SttWorkerPool, stt_pool
+
+log = logging.getLogger("stt.long")
+
+SR = 16000
+QUEUE_RETRY_SEC = 1.0
+
+Segment = Dict[str, Any]
+
+def probe_duration(path: AudioSource) -> Optional[float]:
+    """컨테이너 메타데이터로 길이(초)만 빠르게(디코딩된 배열이면 정확한 길이). 읽을 수 없으면 None"""
+    if isinstance(path, np.ndarray):
+        return len(path) / SR
+    try:
+        import av
+        with av.open(as_input(path)) as c:
+            return c.duration / av.time_base if c.duration else None
+    except Exception:
+        return None
+
+def _load_audio(path: AudioSource) -> np.ndarray:
+    if isinstance(path, np.ndarray):
+        return path
+    from faster_whisper.audio import decode_audio
+    return decode_audio(as_input(path), sampling_rate=SR)
+
+def _speech_regions(audio: np.ndarray) -> List[Dict[str, int]]:
+    from faster_whisper.vad import VadOptions, get_speech_timestamps
+    return get_speech_timestamps(audio, VadOptions(min_silence_duration_ms=500, speech_pad_ms=200), sampling_rate=SR)
+
+def plan_chunks(
+    regions: List[Dict[str, int]], target: int, overlap: int
+) -> List[Tuple[int, int]]:
+    """음성 구간(샘플) → 청크 [(start, end)]. 무음 경계에서 끊고, target 의 2배를 넘는 연속 음성만 겹쳐서 분할"""
+    grouped: List[Tuple[int, int]] = []
+    for r in regions:
+        if grouped and r["end"] - grouped[-1][0] <= target:
+            grouped[-1] = (grouped[-1][0], r["end"])
+        else:
+            grouped.append((r["start"], r["end"]))
+
+    chunks: List[Tuple[int, int]] = []
+    for start, end in grouped:
+        if end - start <= 2 * target:
+            chunks.append((start, end))
+            continue
+        p = start
+        while True:
+            chunks.append((p, min(p + target, end)))
+            if p + target >= end:
+                break
+            p += target - overlap
+    return chunks
+
+def _owned_windows(chunks: List[Tuple[int, int]]) -> List[Tuple[float, float]]:
+    """청크별 담당 구간(초). 겹치면 겹침 중앙에서, 안 겹치면 다음 청크 시작에서 나눔"""
+    bounds = [0.0]
+    for (_, a_end), (b_start, _) in zip(chunks, chunks[1:]):
+        cut = (b_start + a_end) / 2 if b_start < a_end else b_start
+        bounds.append(cut / SR)
+    bounds.append(float("inf"))
+    return list(zip(bounds, bounds[1:]))
+
+def merge_segments(chunks: List[Tuple[int, int]], results: List[List[Segment]]) -> List[Segment]:
+    """청크별 세그먼트(이미 절대 시간) → 중복 제거 후 시간순"""
+    merged: List[Segment] = []
+    for (lo, hi), segs in zip(_owned_windows(chunks), results):
+        merged += [s for s in segs if lo <= (s["start"] + s["end"]) / 2 < hi]
+    merged.sort(key=lambda s: s["start"])
+    return merged
+
+def transcribe_chunk(audio: np.ndarray, offset_sec: float, language: str = "ko", model=None) -> List[Segment]:
+    """워커에서 실행: 청크 하나 전사 → 원본 기준 타임스탬프로 보정"""
+    segments, _ = model.transcribe(audio, language=language, vad_filter=True)
+    out = []
+    for seg in segments:
+        text = seg.text.strip()
+        if text:
+            out.append({
+                "text": text,
+                "start": round(seg.start + offset_sec, 2),
+                "end": round(seg.end + offset_sec, 2),
+                "avg_logprob": round(seg.avg_logprob, 3),
+            })
+    return out
+
+class SttUsage:
+    """
+    한 전사 요청의 풀 사용 기록. on_submit: 첫 작업이 풀 대기열에 들어간 직후 한 번 호출
+    run_sec: 워커에서 실제로 모델을 돌린 시간 합(대기열 대기/디코딩 제외, 청크 병렬이면 청크별 합)
+    """
+
+    def __init__(self, on_submit: Optional[Callable[[], Awaitable[None]]] = None):
+        self.on_submit = on_submit
+        self.submitted = 0
+        self.run_sec = 0.0
+
+async def _submit(pool: SttWorkerPool, fn, *args, retry_when_full: bool = False, usage: Optional[SttUsage] = None, **kwargs):
+    while True:
+        try:
+            cf = pool.submit_nowait(fn, *args, **kwargs)
+            break
+        except SttQueueFull:
+            if not retry_when_full:
+                raise
+            await asyncio.sleep(QUEUE_RETRY_SEC)
+    fut = asyncio.wrap_future(cf)
+    if usage is None:
+        return await fut
+    usage.submitted += 1
+    if usage.submitted == 1 and usage.on_submit is not None:
+        await usage.on_submit()
+    out = await fut
+    usage.run_sec += getattr(cf, "run_sec", 0.0)
+    return out
+
+async def transcribe_long(
+    path: AudioSource,
+    language: str = "ko",
+    model_size: Optional[str] = None,
+    pool: Optional[SttWorkerPool] = None,
+    retry_when_full: bool = False,
+    usage: Optional[SttUsage] = None,
+) -> Tuple[str, float]:
+    pool = pool or stt_pool
+    audio = await asyncio.to_thread(_load_audio, path)
+    duration = len(audio) / SR
+    regions = await asyncio.to_thread(_speech_regions, audio)
+    chunks = plan_chunks(regions, int(settings.STT_CHUNK_SEC * SR), int(settings.STT_CHUNK_OVERLAP_SEC * SR))
+    if not chunks:
+        return "", duration
+
+    # 동시에 워커 수만큼만 넣어 다른 요청 몫의 대기열을 독점하지 않음
+    sem = asyncio.Semaphore(pool.workers)
+
+    async def one(start: int, end: int) -> List[Segment]:
+        async with sem:
+            return await _submit(
+                pool, transcribe_chunk, audio[start:end], start / SR,
+                language=language, model_size=model_size, retry_when_full=retry_when_full, usage=usage,
+            )
+
+    tasks = [asyncio.ensure_future(one(s, e)) for s, e in chunks]
+    try:
+        results = await asyncio.gather(*tasks)
+    except BaseException:
+        # 한 청크라도 실패(SttQueueFull 등)/취소되면 나머지 청크도 취소 — 대기열에 있던 작업은 워커가 건너뜀
+        for t in tasks:
+            t.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+    segments = merge_segments(chunks, results)
+    log.info("long transcription: %.0fs audio, %d chunks, %d segments", duration, len(chunks), len(segments))
+    return " ".join(s["text"] for s in segments).strip(), duration
+
+async def transcribe_file(
+    path: AudioSource,
+    language: str = "ko",
+    model_size: Optional[str] = None,
+    chunked: Optional[bool] = None,
+    retry_when_full: bool = False,
+    usage: Optional[SttUsage] = None,
+) -> Tuple[str, float]:
+    """
+    path 는 파일 경로 또는 파일 내용(bytes). chunked=None 이면 길이로 자동 선택
+    대기열이 가득 차면 SttQueueFull(retry_when_full 이면 기다림)
+    """
+    if chunked is None:
+        duration = await asyncio.to_thread(probe_duration, path)
+        chunked = duration is not None and duration >= settings.STT_LONG_AUDIO_SEC
+    if chunked:
+        return await transcribe_long(path, language, model_size, retry_when_full=retry_when_full, usage=usage)
+    return await _submit(
+        stt_pool, transcribe_audio, path,
+        language=language, model_size=model_size, retry_when_full=retry_when_full, usage=usage,
+    )
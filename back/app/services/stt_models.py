@@ -0,0 +1,153 @@
+# app/services/stt_models.py
+"""
+faster-whisper 모델 레지스트리
+- 크기별(tiny/base/small/medium/...) 모델을 프로세스에 하나씩 두고 STT 워커들이 공유
+  (WhisperModel(num_workers=STT_WORKERS) 라 여러 스레드가 같은 모델로 동시에 transcribe 가능)
+- 크기별 락으로 동시 첫 요청이 같은 모델을 두 번 로드하지 않음
+- lifespan 에서 WHISPER_PRELOAD 모델을 미리 로드 + 1초 무음 디코드로 워밍업
+- 예상 메모리 합이 STT_MODEL_MEMORY_MB 를 넘으면 사용 중이 아닌 모델부터 LRU 로 내림
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
+
+from app.core.config import settings
+
+log = logging.getLogger("stt.models")
+
+# int8 기준 대략적인 상주 메모리(MB)
+MODEL_MB = {"tiny": 75, "base": 145, "small": 480, "medium": 1500, "large-v2": 3100, "large-v3": 3100}
+DEFAULT_MB = 1500
+
+def parse_sizes(csv: str) -> list[str]:
+    return [s.strip() for s in csv.split(",") if s.strip()]
+
+def load_whisper(size: str) -> Any:
+    from faster_whisper import WhisperModel  # 실제 사용 시점에 import
+    return WhisperModel(
+        size,
+        device=settings.WHISPER_DEVICE if settings.WHISPER_DEVICE != "auto" else "cpu",
+        compute_type="int8",  # mac CPU에서 빠르고 충분히 정확
+        num_workers=max(1, settings.STT_WORKERS),  # 워커 스레드들이 한 모델을 동시에 사용
+    )
+
+def warmup(model: Any) -> None:
+    """첫 요청의 초기화 비용(커널/메모리 할당)을 미리 치르는 짧은 디코드"""
+    import numpy as np
+    segments, _ = model.transcribe(np.zeros(16000, dtype=np.float32), language="ko", vad_filter=False, beam_size=1)
+    for _ in segments:
+        pass
+
+class ModelRegistry:
+    def __init__(
+        self,
+        loader: Optional[Callable[[str], Any]] = None,
+        warmer: Optional[Callable[[Any], None]] = warmup,
+        budget_mb: int = 2048,
+        default_size: str = "small",
+        allowed: Iterable[str] = ("tiny", "base", "small", "medium"),
+    ):
+        self._loader = loader
+        self._warmer = warmer
+        self.budget_mb = budget_mb
+        self.default_size = default_size
+        self.allowed = set(allowed) | {default_size}
+        self._models: "OrderedDict[str, Any]" = OrderedDict()  # LRU 순서(뒤가 최근)
+        self._refs: Dict[str, int] = {}
+        self._size_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._counters = {"loads": 0, "hits": 0, "evictions": 0}
+        self._load_ms: Dict[str, float] = {}
+
+    def _load(self, size: str) -> Any:
+        return (self._loader or load_whisper)(size)
+
+    def resolve(self, size: Optional[str]) -> str:
+        size = size or self.default_size
+        if size not in self.allowed:
+            raise ValueError(f"unsupported model size: {size} (allowed: {', '.join(sorted(self.allowed))})")
+        return size
+
+    def _hit_locked(self, size: str) -> Any:
+        self._models.move_to_end(size)
+        self._refs[size] = self._refs.get(size, 0) + 1
+        self._counters["hits"] += 1
+        return self._models[size]
+
+    def _acquire(self, size: str) -> Any:
+        with self._lock:
+            if size in self._models:
+                return self._hit_locked(size)
+            size_lock = self._size_locks.setdefault(size, threading.Lock())
+        with size_lock:  # 같은 크기는 한 스레드만 로드, 나머지는 기다렸다가 재사용
+            with self._lock:
+                if size in self._models:
+                    return self._hit_locked(size)
+            started = time.perf_counter()
+            model = self._load(size)
+            with self._lock:
+                self._load_ms[size] = round((time.perf_counter() - started) * 1000, 1)
+                self._models[size] = model
+                self._refs[size] = self._refs.get(size, 0) + 1
+                self._counters["loads"] += 1
+                self._evict_locked()
+            log.info("loaded whisper model %s in %.0fms", size, self._load_ms[size])
+            return model
+
+    def _release(self, size: str) -> None:
+        with self._lock:
+            self._refs[size] -= 1  # 내리기는 다음 로드 때(방금 쓴 모델을 바로 버리지 않도록)
+
+    def _used_mb(self) -> int:
+        return sum(MODEL_MB.get(s, DEFAULT_MB) for s in self._models)
+
+    def _evict_locked(self) -> None:
+        while self._used_mb() > self.budget_mb:
+            idle = next((s for s in self._models if not self._refs.get(s)), None)  # 가장 오래 안 쓴 것부터
+            if idle is None:
+                break  # 전부 사용 중이면 잠시 예산 초과 허용
+            del self._models[idle]
+            self._counters["evictions"] += 1
+            log.info("evicted whisper model %s (budget %dMB)", idle, self.budget_mb)
+
+    @contextmanager
+    def use(self, size: Optional[str] = None) -> Iterator[Any]:
+        """사용하는 동안은 내려가지 않도록 참조를 잡고 모델을 빌려줌"""
+        size = self.resolve(size)
+        model = self._acquire(size)
+        try:
+            yield model
+        finally:
+            self._release(size)
+
+    def get(self, size: Optional[str] = None) -> Any:
+        with self.use(size) as model:
+            return model
+
+    def preload(self, sizes: Iterable[str], warm: bool = True) -> None:
+        for size in sizes:
+            with self.use(size) as model:
+                if warm and self._warmer is not None:
+                    started = time.perf_counter()
+                    self._warmer(model)
+                    log.info("warmed up whisper model %s in %.0fms", size, (time.perf_counter() - started) * 1000)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "loaded": list(self._models),
+                "in_use": {s: n for s, n in self._refs.items() if n},
+                "used_mb": self._used_mb(),
+                "budget_mb": self.budget_mb,
+                "load_ms": dict(self._load_ms),
+                **self._counters,
+            }
+
+model_registry = ModelRegistry(
+    budget_mb=settings.STT_MODEL_MEMORY_MB,
+    default_size=settings.WHISPER_MODEL_SIZE,
+    allowed=parse_sizes(settings.WHISPER_ALLOWED_SIZES),
+)
@@ -0,0 +1,171 @@
+# app/services/stt_pool.py
+"""
+STT 전용 워커 풀
+- 이벤트 루프 밖(워커 스레드)에서 전사 실행 → websocket 등 다른 요청이 멈추지 않음
+- 모델은 레지스트리(stt_models)에서 작업마다 크기별로 빌려 씀 (CTranslate2 는 추론 중 GIL 을 놓으므로 스레드로 충분)
+- 대기열 상한 초과 시 SttQueueFull → 라우트에서 503 으로 변환(backpressure)
+"""
+import asyncio
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Optional
+
+from app.core.config import settings
+from app.services.stt_models import ModelRegistry, model_registry
+
+log = logging.getLogger("stt")
+
+class SttQueueFull(Exception):
+    """대기열이 가득 차 작업을 받을 수 없음"""
+
+@dataclass
+class _Job:
+    fn: Callable[..., Any]
+    args: tuple
+    kwargs: dict
+    future: Future
+    model_size: Optional[str] = None
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+def _summary(samples: deque) -> Dict[str, float]:
+    if not samples:
+        return {"avg": 0.0, "p50": 0.0, "p95": 0.0, "max": 0.0}
+    xs = sorted(samples)
+    return {
+        "avg": round(sum(xs) / len(xs), 1),
+        "p50": round(xs[len(xs) // 2], 1),
+        "p95": round(xs[min(len(xs) - 1, int(len(xs) * 0.95))], 1),
+        "max": round(xs[-1], 1),
+    }
+
+class SttWorkerPool:
+    def __init__(self, workers: int, queue_size: int, registry: Optional[ModelRegistry] = None):
+        self.workers = max(1, workers)
+        self.queue_size = max(1, queue_size)
+        self.registry = registry or model_registry
+        self._q: "queue.Queue[Optional[_Job]]" = queue.Queue(maxsize=self.queue_size)
+        self._threads: list[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._counters = {"submitted": 0, "completed": 0, "failed": 0, "rejected": 0}
+        self._wait_ms: deque = deque(maxlen=200)  # 최근 작업 기준
+        self._run_ms: deque = deque(maxlen=200)
+
+    def _ensure_started(self) -> None:
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.workers):
+                t = threading.Thread(target=self._worker, name=f"stt-worker-{i}", daemon=True)
+                t.start()
+                self._threads.append(t)
+
+    def _worker(self) -> None:
+        while True:
+            job = self._q.get()
+            if job is None:
+                break
+            if not job.future.set_running_or_notify_cancel():
+                continue
+            started = time.perf_counter()
+            with self._lock:
+                self._in_flight += 1
+            ok = False
+            try:
+                with self.registry.use(job.model_size) as model:
+                    t_fn = time.perf_counter()
+                    result = job.fn(*job.args, model=model, **job.kwargs)
+                job.future.run_sec = time.perf_counter() - t_fn  # 대기/모델 로드를 뺀 실행 시간(SttUsage 가 합산)
+                job.future.set_result(result)
+                ok = True
+            except BaseException as e:
+                job.future.set_exception(e)
+            finally:
+                wait_ms = (started - job.enqueued_at) * 1000
+                run_ms = (time.perf_counter() - started) * 1000
+                with self._lock:
+                    self._in_flight -= 1
+                    self._counters["completed" if ok else "failed"] += 1
+                    self._wait_ms.append(wait_ms)
+                    self._run_ms.append(run_ms)
+                log.info("stt job done ok=%s wait=%.0fms run=%.0fms", ok, wait_ms, run_ms)
+
+    def full(self) -> bool:
+        return self._q.full()
+
+    def submit_nowait(self, fn: Callable[..., Any], *args, model_size: Optional[str] = None, **kwargs) -> Future:
+        """
+        fn(*args, model=<model_size 모델>, **kwargs) 를 워커에서 실행. 대기열이 가득 차면 SttQueueFull
+        지원하지 않는 model_size 는 ValueError(대기열에 넣기 전)
+        """
+        self.registry.resolve(model_size)
+        self._ensure_started()
+        fut: Future = Future()
+        try:
+            self._q.put_nowait(_Job(fn, args, kwargs, fut, model_size))
+        except queue.Full:
+            with self._lock:
+                self._counters["rejected"] += 1
+            raise SttQueueFull()
+        with self._lock:
+            self._counters["submitted"] += 1
+        return fut
+
+    async def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        return await asyncio.wrap_future(self.submit_nowait(fn, *args, **kwargs))
+
+    async def stream(self, fn: Callable[..., Iterable[Any]], *args, **kwargs) -> AsyncIterator[Any]:
+        """
+        fn 이 워커에서 만들어 내는 항목을 생성 즉시 이벤트 루프로 전달
+        소비 측이 중간에 끊으면(클라이언트 연결 종료 등) 워커도 다음 항목에서 멈춤
+        """
+        loop = asyncio.get_running_loop()
+        items: asyncio.Queue = asyncio.Queue()
+        stop = threading.Event()
+        end = object()
+
+        def run(*a, model=None, **kw):
+            for item in fn(*a, model=model, **kw):
+                if stop.is_set():
+                    break
+                loop.call_soon_threadsafe(items.put_nowait, item)
+
+        fut = self.submit_nowait(run, *args, **kwargs)
+        fut.add_done_callback(lambda _: loop.call_soon_threadsafe(items.put_nowait, end))
+        try:
+            while True:
+                item = await items.get()
+                if item is end:
+                    break
+                yield item
+            fut.result()  # 워커 예외 전파
+        finally:
+            stop.set()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_size": self.queue_size,
+                "queue_depth": self._q.qsize(),
+                "in_flight": self._in_flight,
+                **self._counters,
+                "wait_ms": _summary(self._wait_ms),
+                "run_ms": _summary(self._run_ms),
+                "models": self.registry.stats(),
+            }
+
+    def shutdown(self) -> None:
+        with self._lock:
+            threads, self._threads = self._threads, []
+        for _ in threads:
+            self._q.put(None)
+        for t in threads:
+            t.join(timeout=5)
+
+stt_pool = SttWorkerPool(settings.STT_WORKERS, settings.STT_QUEUE_SIZE)
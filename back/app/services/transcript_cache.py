@@ -0,0 +1,135 @@
+# app/services/transcript_cache.py
+"""
+오디오 전사 결과 캐시
+- 키 = (오디오 내용 sha256, 모델 크기, 언어). 업로드 재시도/같은 녹음 재제출은 Whisper 를 다시 돌리지 않음
+- DB 테이블(transcript_cache)이라 재시작 후에도 유지. 해시는 업로드를 저장하면서 계산(다시 읽지 않음)
+- 지표: 적중/미스, 적중으로 아낀 전사 시간(그 오디오를 처음 전사할 때 워커가 모델을 돌린 시간의 합)
+- 조회/저장 실패는 미스로 취급(전사 자체는 막지 않음)
+"""
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import bindparam, select
+
+from app.core.config import settings
+from app.db.bulk import insert_transcript_cache
+from app.db.session import AsyncSessionLocal, AsyncWriteSessionLocal
+from app.db import models as m
+from app.services import audio_prep
+from app.services.stt import AudioSource
+from app.services.stt_long import SttUsage, transcribe_file
+from app.services.stt_pool import stt_pool
+
+log = logging.getLogger("stt.cache")
+
+class _Stats:
+    def __init__(self):
+        self.hits = self.misses = self.stores = self.errors = 0
+        self.stt_sec_saved = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "enabled": settings.TRANSCRIPT_CACHE_ENABLED,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "stores": self.stores,
+            "errors": self.errors,
+            "stt_sec_saved": round(self.stt_sec_saved, 3),
+        }
+
+_stats = _Stats()
+
+def stats() -> Dict[str, Any]:
+    return _stats.as_dict()
+
+def _key(audio_hash: str, model_size: str, language: str):
+    t = m.TranscriptCache
+    return (t.audio_hash == audio_hash) & (t.model_size == model_size) & (t.language == language)
+
+HITS_FLUSH = 50  # 행별 hits 카운터는 메모리에 모았다가 이만큼 쌓이면 한 번에 UPDATE
+
+_pending_hits: Dict[int, int] = {}  # transcript_cache.id -> 아직 저장 안 한 적중 수
+
+async def flush_hits() -> None:
+    """모아 둔 적중 수를 UPDATE 한 번(executemany)으로 반영. 종료 시 lifespan 에서도 호출"""
+    if not _pending_hits:
+        return
+    batch = dict(_pending_hits)
+    _pending_hits.clear()
+    t = m.TranscriptCache.__table__
+    try:
+        async with AsyncWriteSessionLocal() as db:
+            await db.execute(
+                t.update().where(t.c.id == bindparam("rid")).values(hits=t.c.hits + bindparam("n")),
+                [{"rid": rid, "n": n} for rid, n in batch.items()],
+            )
+            await db.commit()
+    except Exception:
+        _stats.errors += 1
+        log.exception("transcript cache hit flush failed")
+
+async def lookup(audio_hash: str, model_size: str, language: str) -> Optional[Tuple[str, float]]:
+    """조회는 읽기 세션만 씀(적중/미스 모두 쓰기 연결을 잡지 않음)"""
+    try:
+        async with AsyncSessionLocal() as db:
+            row = await db.scalar(select(m.TranscriptCache).where(_key(audio_hash, model_size, language)))
+    except Exception:
+        _stats.errors += 1
+        log.exception("transcript cache lookup failed")
+        return None
+    if row is None:
+        _stats.misses += 1
+        return None
+    _stats.hits += 1
+    _stats.stt_sec_saved += row.stt_sec
+    _pending_hits[row.id] = _pending_hits.get(row.id, 0) + 1
+    if sum(_pending_hits.values()) >= HITS_FLUSH:
+        await flush_hits()
+    return row.transcript, row.duration_sec
+
+async def store(audio_hash: str, model_size: str, language: str, transcript: str, duration_sec: float, stt_sec: float) -> None:
+    try:
+        async with AsyncWriteSessionLocal() as db:
+            await insert_transcript_cache(db, {  # 같은 오디오가 동시에 올라와 둘 다 전사했으면 먼저 들어간 쪽 유지
+                "audio_hash": audio_hash, "model_size": model_size, "language": language,
+                "transcript": transcript, "duration_sec": duration_sec, "stt_sec": stt_sec,
+            })
+            await db.commit()
+        _stats.stores += 1
+    except Exception:
+        _stats.errors += 1
+        log.exception("transcript cache store failed")
+
+async def transcribe_cached(
+    source: AudioSource,
+    audio_hash: str,
+    language: str = "ko",
+    model_size: Optional[str] = None,
+    chunked: Optional[bool] = None,
+    retry_when_full: bool = False,
+    audio_path: Optional[str] = None,
+    usage: Optional[SttUsage] = None,
+) -> Tuple[str, float]:
+    """
+    transcribe_file 과 같지만 캐시를 먼저 확인하고, 새로 전사한 결과는 저장. audio_hash 가 없으면 캐시 없이
+    audio_path(저장된 업로드)를 주면 미스일 때 16kHz PCM 사이드카로 전처리한 배열을 모델에 넘김
+    """
+    if not audio_hash or not settings.TRANSCRIPT_CACHE_ENABLED:
+        if audio_path:
+            source = await audio_prep.prepare(audio_path, source)
+        return await transcribe_file(source, language, model_size, chunked=chunked, retry_when_full=retry_when_full, usage=usage)
+    size = stt_pool.registry.resolve(model_size)
+    hit = await lookup(audio_hash, size, language)
+    if hit is not None:
+        return hit
+    if audio_path:
+        source = await audio_prep.prepare(audio_path, source)
+    usage = usage or SttUsage()
+    transcript, duration_sec = await transcribe_file(
+        source, language, size, chunked=chunked, retry_when_full=retry_when_full, usage=usage
+    )
+    # 아낀 시간 = 워커 실행 시간만(대기열 대기/디코딩은 캐시 적중과 무관하게 생기는 비용이라 제외)
+    await store(audio_hash, size, language, transcript, duration_sec, usage.run_sec)
+    return transcript, duration_sec
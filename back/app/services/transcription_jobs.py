@@ -0,0 +1,221 @@
+# app/services/transcription_jobs.py
+"""
+오디오 업로드 파이프라인 + 비동기 전사 작업(TranscriptionJob)
+- 파이프라인: 저장된 파일 → transcribe_cached(전사 캐시 → STT 풀, 긴 오디오는 청크 병렬) → Answer → analyze → Analytics
+- async 모드: 업로드는 job id 만 돌려주고, 작업은 이벤트 루프의 백그라운드 태스크로 진행
+- 작업 상태는 DB 에 남으므로 재시작 시 queued/running 작업을 다시 실행(resume_pending_jobs)
+  ※ 단일 프로세스 기준. 여러 워커를 띄우면 복구 작업이 중복 실행될 수 있음
+"""
+import asyncio
+import json
+import logging
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import AsyncSessionLocal, AsyncWriteSessionLocal
+from app.db import models as m
+from app.services.analyze import analyze
+from app.services.rubric_cache import Rubric, rubric_cache
+from app.services.stt_long import SttUsage
+from app.services.transcript_cache import transcribe_cached
+
+log = logging.getLogger("stt.jobs")
+
+ACTIVE = ("queued", "running")
+TERMINAL = ("done", "failed")
+
+_events: Dict[str, asyncio.Event] = {}
+_watchers: Dict[str, int] = {}  # job_id -> 대기 중인 SSE 연결 수
+_tasks: set = set()
+
+async def save_answer(
+    db: AsyncSession,
+    rub: Rubric,
+    transcript: str,
+    duration_sec: float,
+    audio_url: str,
+    job: Optional[m.TranscriptionJob] = None,
+) -> Dict[str, Any]:
+    """전사 결과로 Answer + Analytics 를 한 트랜잭션에 저장(job 이 있으면 상태도 함께 갱신)"""
+    a = m.Answer(
+        question_id=rub.question_id,
+        type="audio",
+        transcript=transcript,
+        audio_url=audio_url,
+        duration_sec=duration_sec,
+    )
+    db.add(a); await db.flush()
+
+    result = analyze(transcript, rub.keywords, duration_sec)
+
+    db.add(m.Analytics(
+        answer_id=a.id,
+        filler_ratio=result["filler_ratio"],
+        wpm=result["wpm"],
+        sentiment=result["sentiment"],
+        keyword_hit_rate=result["keyword_hit_rate"],
+        clarity_score=result["clarity_score"],
+        coherence_score=result["coherence_score"],
+    ))
+    out = {
+        "answer_id": a.id,
+        "duration_sec": duration_sec,
+        "transcript": transcript,
+        "analytics": result,
+    }
+    if job is not None:
+        job.status = "done"
+        job.answer_id = a.id
+        job.result = json.dumps(out, ensure_ascii=False)
+    await db.commit()
+    return out
+
+# --------------------------------------------
+# 작업 테이블
+# --------------------------------------------
+async def create_job(
+    db: AsyncSession, question_id: int, audio_path: str, language: str, model_size: str = "", audio_hash: str = ""
+) -> m.TranscriptionJob:
+    job = m.TranscriptionJob(
+        id=uuid.uuid4().hex,
+        question_id=question_id,
+        audio_path=audio_path,
+        language=language,
+        model_size=model_size,
+        audio_hash=audio_hash,
+        status="queued",
+        result="",
+        error="",
+    )
+    db.add(job); await db.commit()
+    return job
+
+def job_to_dict(job: m.TranscriptionJob) -> Dict[str, Any]:
+    return {
+        "job_id": job.id,
+        "status": job.status,
+        "question_id": job.question_id,
+        "answer_id": job.answer_id,
+        "result": json.loads(job.result) if job.result else None,
+        "error": job.error or None,
+        "created_at": job.created_at.isoformat(),
+        "updated_at": job.updated_at.isoformat(),
+    }
+
+async def get_job(job_id: str) -> Optional[Dict[str, Any]]:
+    async with AsyncSessionLocal() as db:
+        job = await db.get(m.TranscriptionJob, job_id)
+        return job_to_dict(job) if job else None
+
+async def _set_status(job_id: str, status: str, error: str = "") -> None:
+    async with AsyncWriteSessionLocal() as db:
+        job = await db.get(m.TranscriptionJob, job_id)
+        if job:
+            job.status = status
+            job.error = error
+            await db.commit()
+
+async def _finish(job_id: str, transcript: str, duration_sec: float) -> None:
+    async with AsyncWriteSessionLocal() as db:
+        job = await db.get(m.TranscriptionJob, job_id)
+        if job is None:  # 작업 행이 지워짐(Postgres 는 질문 삭제 CASCADE): 남길 곳이 없음
+            log.info("transcription job %s: job gone, result dropped", job_id)
+            return
+        rub = await rubric_cache.get(job.question_id)
+        if rub is None:
+            # 전사 중 질문이 삭제됨. SQLite 는 foreign_keys 를 켜지 않아 작업 행이 남으므로
+            # 종료 상태로 남겨야 재시작 때 resume_pending_jobs 가 다시 전사하지 않음
+            job.status = "failed"
+            job.error = "question not found"
+            await db.commit()
+            return
+        await save_answer(db, rub, transcript, duration_sec, job.audio_path, job=job)
+
+async def _load(job_id: str) -> Optional[tuple]:
+    async with AsyncSessionLocal() as db:
+        job = await db.get(m.TranscriptionJob, job_id)
+        return (job.audio_path, job.language, job.model_size or None, job.audio_hash) if job else None
+
+async def _pending_ids() -> List[str]:
+    async with AsyncWriteSessionLocal() as db:
+        jobs = (await db.scalars(
+            select(m.TranscriptionJob)
+            .where(m.TranscriptionJob.status.in_(ACTIVE))
+            .order_by(m.TranscriptionJob.created_at)
+        )).all()
+        for j in jobs:
+            j.status = "queued"  # 중단된 running 작업은 처음부터 다시
+        await db.commit()
+        return [j.id for j in jobs]
+
+# --------------------------------------------
+# 실행 / 알림
+# --------------------------------------------
+def job_event(job_id: str) -> asyncio.Event:
+    """상태 변경 대기용 이벤트(다음 변경 시 set 후 교체됨)"""
+    return _events.setdefault(job_id, asyncio.Event())
+
+@contextmanager
+def watching(job_id: str):
+    """SSE 연결 동안 감싸기: 마지막 연결이 끝나면(끊김/종료 상태) 이벤트를 지워 쌓이지 않게"""
+    _watchers[job_id] = _watchers.get(job_id, 0) + 1
+    try:
+        yield
+    finally:
+        n = _watchers.pop(job_id) - 1
+        if n:
+            _watchers[job_id] = n
+        else:
+            _events.pop(job_id, None)
+
+def _notify(job_id: str) -> None:
+    ev = _events.pop(job_id, None)
+    if ev:
+        ev.set()
+
+async def _run(job_id: str) -> None:
+    loaded = await _load(job_id)
+    if not loaded:
+        return
+    path, language, model_size, audio_hash = loaded
+
+    async def running() -> None:
+        await _set_status(job_id, "running")
+        _notify(job_id)
+
+    try:
+        # 같은 오디오는 캐시 재사용, 긴 오디오는 청크 병렬 전사, 풀이 가득 차면 빌 때까지 기다림
+        # running 은 풀이 첫 작업을 받아 준 뒤에(대기열 재시도 중에는 queued 그대로)
+        transcript, duration_sec = await transcribe_cached(
+            path, audio_hash, language, model_size, retry_when_full=True, audio_path=path,
+            usage=SttUsage(on_submit=running),
+        )
+        await _finish(job_id, transcript, duration_sec)
+    except asyncio.CancelledError:
+        raise  # 종료 중: 상태를 남겨 두고 재시작 시 복구
+    except Exception as e:
+        log.exception("transcription job %s failed", job_id)
+        await _set_status(job_id, "failed", f"STT failed: {e}")
+    _notify(job_id)
+
+def enqueue(job_id: str) -> None:
+    t = asyncio.create_task(_run(job_id))
+    _tasks.add(t)
+    t.add_done_callback(_tasks.discard)
+
+async def resume_pending_jobs() -> int:
+    ids = await _pending_ids()
+    for job_id in ids:
+        enqueue(job_id)
+    if ids:
+        log.info("resumed %d transcription jobs", len(ids))
+    return len(ids)
+
+async def cancel_running_jobs() -> None:
+    for t in list(_tasks):
+        t.cancel()
+    await asyncio.gather(*_tasks, return_exceptions=True)
@@ -0,0 +1,69 @@
+"""
+오디오 전처리: 재전사 때마다 원본 디코딩(PyAV 디코딩+16kHz 리샘플) vs PCM 사이드카(mmap) 읽기
+- 모델 없이 디코딩 단계만 측정(전사 시간은 둘이 같음)
+- --audio 가 없으면 --seconds 길이의 합성 음성(webm/opus 48kHz 스테레오)을 만들어 사용
+
+    cd back && python -m scripts.bench_audio_prep [--audio answer.m4a] [--seconds 120] [--repeat 5]
+"""
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+
+from app.services import audio_prep
+
+def synth(path: str, seconds: float) -> None:
+    import av
+    rate = 48000
+    with av.open(path, "w") as out:
+        st = out.add_stream("libopus", rate=rate, layout="stereo")
+        t = np.arange(int(seconds * rate)) / rate
+        wave = (np.sin(2 * np.pi * 220 * t) * np.sin(2 * np.pi * 0.5 * t) * 0.3).astype(np.float32)
+        step = 960 * 50
+        for i in range(0, len(wave), step):
+            part = np.ascontiguousarray(np.stack([wave[i:i + step]] * 2))
+            frame = av.AudioFrame.from_ndarray(part, format="fltp", layout="stereo")
+            frame.sample_rate = rate
+            for pkt in st.encode(frame):
+                out.mux(pkt)
+        for pkt in st.encode(None):
+            out.mux(pkt)
+
+def timeit(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--audio")
+    ap.add_argument("--seconds", type=float, default=120.0)
+    ap.add_argument("--repeat", type=int, default=5)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = args.audio
+        if not path:
+            path = os.path.join(tmp, "synth.webm")
+            synth(path, args.seconds)
+        side = audio_prep.pcm_path(path) if not args.audio else os.path.join(tmp, "bench" + audio_prep.SUFFIX)
+
+        decode_sec = timeit(lambda: audio_prep.decode(path), args.repeat)
+        audio = audio_prep.decode(path)
+        audio_prep._save(side, audio)
+        # mmap + float32 변환까지(모델에 넘기기 직전 상태)
+        load_sec = timeit(lambda: np.asarray(np.load(side, mmap_mode="r"), dtype=np.float32) / 32768.0, args.repeat)
+
+        duration = len(audio) / audio_prep.SR
+        print(f"audio={duration:.1f}s  source={os.path.getsize(path) / 1e6:.2f}MB  sidecar={os.path.getsize(side) / 1e6:.2f}MB")
+        print(f"decode+resample {decode_sec * 1000:8.1f} ms   (x{duration / decode_sec:.0f} realtime)")
+        print(f"sidecar mmap    {load_sec * 1000:8.1f} ms   (x{duration / load_sec:.0f} realtime)")
+        print(f"saved per re-transcription: {(decode_sec - load_sec) * 1000:.1f} ms (x{decode_sec / load_sec:.1f})")
+
+if __name__ == "__main__":
+    main()
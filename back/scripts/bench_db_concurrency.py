@@ -0,0 +1,105 @@
+"""
+동기(threadpool) 라우트 vs 비동기(AsyncSession) 라우트 동시 요청 처리량 비교
+- 같은 조회(GET /api/answers/{id}/analytics 와 같은 쿼리)를 두 방식으로 실행
+  sync : def 라우트 + SessionLocal (Starlette threadpool, 기본 40 스레드)
+  async: 실제 앱 라우트(app.main) + AsyncSessionLocal
+- httpx ASGITransport 로 프로세스 내에서 동시 요청 --concurrency 개씩 --requests 개
+- SQLite 는 드라이버가 결국 스레드에서 돌아 차이가 작음 → 의미 있는 비교는 --url postgresql://...
+
+    cd back && python -m scripts.bench_db_concurrency [--requests 2000] [--concurrency 200] [--url ...]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+def _setup_env(url: str | None) -> str:
+    # app import 전에 DB URL 확정
+    if not url:
+        url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    os.environ["DATABASE_URL"] = url
+    return url
+
+def seed(n: int = 200) -> list[int]:
+    from app.db.base import Base
+    from app.db.session import SessionLocal, engine
+    from app.db import models as m
+
+    Base.metadata.create_all(engine)
+    with SessionLocal() as db:
+        s = m.Session(role="backend", job_title="Backend Engineer", level="junior", difficulty="medium", company="")
+        db.add(s); db.flush()
+        q = m.Question(session_id=s.id, text="Q", rubric_keywords="캐시", difficulty="medium")
+        db.add(q); db.flush()
+        answers = [m.Answer(question_id=q.id, type="text", transcript="캐시", duration_sec=10) for _ in range(n)]
+        db.add_all(answers); db.flush()
+        db.add_all([m.Analytics(answer_id=a.id, filler_ratio=0.0, wpm=120.0, sentiment="neu",
+                                keyword_hit_rate=1.0, clarity_score=4.0, coherence_score=3.5) for a in answers])
+        db.commit()
+        return [a.id for a in answers]
+
+def sync_app():
+    from fastapi import FastAPI, HTTPException
+    from app.db.session import SessionLocal
+    from app.db import models as m
+
+    app = FastAPI()
+
+    @app.get("/api/answers/{answer_id}/analytics")
+    def get_analytics(answer_id: int):
+        with SessionLocal() as db:
+            an = db.query(m.Analytics).filter(m.Analytics.answer_id == answer_id).first()
+            if not an:
+                raise HTTPException(404, "Analytics not found")
+            return {"answer_id": answer_id, "wpm": an.wpm, "created_at": an.created_at.isoformat()}
+    return app
+
+async def run(app, ids: list[int], requests: int, concurrency: int) -> dict:
+    import httpx
+
+    lat: list[float] = []
+    sem = asyncio.Semaphore(concurrency)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def one(i: int):
+            async with sem:
+                t0 = time.perf_counter()
+                r = await client.get(f"/api/answers/{ids[i % len(ids)]}/analytics")
+                r.raise_for_status()
+                lat.append((time.perf_counter() - t0) * 1000)
+
+        await one(0)  # 워밍업(커넥션 풀)
+        lat.clear()
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        elapsed = time.perf_counter() - started
+    lat.sort()
+    return {
+        "rps": requests / elapsed,
+        "p50": statistics.median(lat),
+        "p95": lat[int(len(lat) * 0.95) - 1],
+        "max": lat[-1],
+    }
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--requests", type=int, default=2000)
+    ap.add_argument("--concurrency", type=int, default=200)
+    ap.add_argument("--url", default=None, help="기본: 임시 SQLite 파일")
+    args = ap.parse_args()
+
+    url = _setup_env(args.url)
+    ids = seed()
+    from app.main import app as async_app
+    from app.db.session import async_engine
+
+    print(f"db={url.split('://')[0]} requests={args.requests} concurrency={args.concurrency}")
+    for name, app in (("sync ", sync_app()), ("async", async_app)):
+        r = asyncio.run(run(app, ids, args.requests, args.concurrency))
+        print(f"{name}: {r['rps']:8.0f} req/s  p50 {r['p50']:7.1f}ms  p95 {r['p95']:7.1f}ms  max {r['max']:7.1f}ms")
+        asyncio.run(async_engine.dispose())  # 루프가 바뀌므로 풀 비우기
+
+if __name__ == "__main__":
+    main()
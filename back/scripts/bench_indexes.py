@@ -0,0 +1,134 @@
+"""
+조회 인덱스 전/후 쿼리 플랜 + 소요 시간 비교
+- 기본: 임시 SQLite 파일에 답변 100만 건 시드 → 인덱스 없이 측정 → 인덱스 생성 → 재측정
+- Postgres: --url postgresql://... (EXPLAIN 사용, 빈 DB 에서 실행할 것)
+
+    cd back && python -m scripts.bench_indexes [--answers 1000000] [--url sqlite:////tmp/bench.db]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, text
+
+from app.db.base import Base
+from app.db import models as m
+
+N_USERS = 1000
+QUESTIONS_PER_SESSION = 10
+ANSWERS_PER_QUESTION = 2
+
+# (이름, SQL) — 실제 라우트의 조회 모양 그대로
+QUERIES = [
+    ("questions of a session",
+     "SELECT id, text FROM questions WHERE session_id = :sid"),
+    ("latest answer per question (report payload)",
+     "SELECT q.text, a.transcript, an.wpm FROM questions q "
+     "JOIN answers a ON a.question_id = q.id "
+     "JOIN (SELECT max(a2.id) AS id FROM answers a2 JOIN questions q2 ON q2.id = a2.question_id "
+     "      WHERE q2.session_id = :sid GROUP BY a2.question_id) l ON l.id = a.id "
+     "LEFT JOIN analytics an ON an.answer_id = a.id WHERE q.session_id = :sid ORDER BY q.id"),
+    ("analytics of an answer",
+     "SELECT * FROM analytics WHERE answer_id = :aid"),
+    ("report of a session",
+     "SELECT * FROM reports WHERE session_id = :sid"),
+    ("my sessions (newest first)",
+     "SELECT id, company, created_at FROM sessions WHERE user_id = :uid ORDER BY created_at DESC, id DESC LIMIT 20"),
+    ("my sessions filtered by company",
+     "SELECT id, company, created_at FROM sessions WHERE user_id = :uid AND company = :company "
+     "ORDER BY created_at DESC, id DESC LIMIT 20"),
+]
+
+LOOKUP_INDEXES = {"ix_questions_session_id", "ix_answers_question_id_id", "ix_sessions_user_created", "ix_sessions_user_company_created"}
+NEW_INDEXES = [ix for t in Base.metadata.sorted_tables for ix in t.indexes if ix.name in LOOKUP_INDEXES]
+
+def seed(engine, n_answers: int) -> None:
+    n_questions = n_answers // ANSWERS_PER_QUESTION
+    n_sessions = n_questions // QUESTIONS_PER_SESSION
+    rng = random.Random(0)
+    t0 = datetime(2025, 1, 1)
+    companies = ["Naver", "Kakao", "Toss", "Coupang", ""]
+    with engine.begin() as conn:
+        conn.execute(m.User.__table__.insert(), [
+            {"id": u, "email": f"u{u}@x.com", "password_hash": "x", "created_at": t0} for u in range(1, N_USERS + 1)
+        ])
+        conn.execute(m.Session.__table__.insert(), [
+            {"id": s, "role": "backend", "job_title": "BE", "level": "junior", "difficulty": "medium",
+             "created_at": t0 + timedelta(minutes=s), "user_id": rng.randint(1, N_USERS), "company": rng.choice(companies)}
+            for s in range(1, n_sessions + 1)
+        ])
+        conn.execute(m.Question.__table__.insert(), [
+            {"id": q, "session_id": (q - 1) // QUESTIONS_PER_SESSION + 1, "text": f"Q{q}", "rubric_keywords": "a,b",
+             "difficulty": "medium"}
+            for q in range(1, n_sessions * QUESTIONS_PER_SESSION + 1)
+        ])
+        for lo in range(1, n_answers + 1, 100_000):
+            ids = range(lo, min(lo + 100_000, n_answers + 1))
+            conn.execute(m.Answer.__table__.insert(), [
+                {"id": a, "question_id": (a - 1) // ANSWERS_PER_QUESTION + 1, "type": "text", "transcript": "답변",
+                 "audio_url": "", "duration_sec": 30.0, "created_at": t0} for a in ids
+            ])
+            conn.execute(m.Analytics.__table__.insert(), [
+                {"answer_id": a, "filler_ratio": 0.0, "wpm": 120.0, "sentiment": "neu", "keyword_hit_rate": 0.5,
+                 "clarity_score": 4.0, "coherence_score": 3.5, "created_at": t0} for a in ids
+            ])
+        conn.execute(m.Report.__table__.insert(), [
+            {"session_id": s, "total_score": 70.0, "summary_md": "", "suggestions_md": "", "created_at": t0}
+            for s in range(1, n_sessions + 1, 2)
+        ])
+
+def explain(conn, sql: str, params: dict) -> str:
+    if conn.dialect.name == "sqlite":
+        rows = conn.execute(text("EXPLAIN QUERY PLAN " + sql), params).all()
+        return "\n".join(f"    {r[-1]}" for r in rows)
+    rows = conn.execute(text("EXPLAIN " + sql), params).all()
+    return "\n".join(f"    {r[0]}" for r in rows)
+
+def measure(engine, params: dict, label: str, repeat: int = 20) -> dict:
+    print(f"\n===== {label} =====")
+    out = {}
+    with engine.connect() as conn:
+        for name, sql in QUERIES:
+            t = time.perf_counter()
+            for _ in range(repeat):
+                conn.execute(text(sql), params).all()
+            ms = (time.perf_counter() - t) * 1000 / repeat
+            out[name] = ms
+            print(f"- {name}: {ms:.3f} ms\n{explain(conn, sql, params)}")
+    return out
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--answers", type=int, default=1_000_000)
+    ap.add_argument("--url", default=None)
+    args = ap.parse_args()
+
+    url = args.url or f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench_indexes.db')}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    with engine.begin() as conn:
+        for ix in NEW_INDEXES:
+            ix.drop(conn, checkfirst=True)
+
+    t = time.perf_counter()
+    seed(engine, args.answers)
+    print(f"seeded {args.answers:,} answers in {time.perf_counter() - t:.1f}s ({url})")
+
+    params = {"sid": 4242, "aid": 123_456, "uid": 77, "company": "Kakao"}
+    before = measure(engine, params, "before (no lookup indexes)")
+    with engine.begin() as conn:
+        for ix in NEW_INDEXES:
+            ix.create(conn)
+        if conn.dialect.name == "sqlite":
+            conn.execute(text("ANALYZE"))
+    after = measure(engine, params, "after")
+
+    print("\n===== summary (ms/query) =====")
+    for name, _ in QUERIES:
+        print(f"{name:<48} {before[name]:>10.3f} -> {after[name]:>8.3f}")
+
+if __name__ == "__main__":
+    main()
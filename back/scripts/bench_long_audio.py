@@ -0,0 +1,60 @@
+"""
+긴 오디오 전사: 단일 전사 vs VAD 청크 병렬 전사의 실시간 배율(RTF = 처리 시간 / 오디오 길이, 낮을수록 빠름)
+- 워커 수(=동시 청크 수)별로 측정. 워커당 CPU 스레드는 코어 수 / 워커 수
+- 실제 음성 파일과 faster-whisper 모델이 필요(처음 실행 시 모델 다운로드)
+
+    cd back && python -m scripts.bench_long_audio --audio long_answer.m4a [--model small] [--workers 1,2,4]
+"""
+import argparse
+import asyncio
+import os
+import time
+
+from app.services.stt import transcribe_audio
+from app.services.stt_long import probe_duration, transcribe_long
+from app.services.stt_models import ModelRegistry
+from app.services.stt_pool import SttWorkerPool
+
+def _registry(size: str, workers: int, cores: int) -> ModelRegistry:
+    from faster_whisper import WhisperModel
+
+    def load(s):
+        return WhisperModel(s, device="cpu", compute_type="int8", num_workers=workers, cpu_threads=max(1, cores // workers))
+    return ModelRegistry(loader=load, default_size=size, allowed=[size])
+
+async def measure(path: str, size: str, workers: int, cores: int, duration: float) -> dict:
+    pool = SttWorkerPool(workers, queue_size=workers * 2, registry=_registry(size, workers, cores))
+    try:
+        pool.registry.preload([size])  # 로드/워밍업은 측정에서 제외
+        t0 = time.perf_counter()
+        seq_text, _ = await pool.submit(transcribe_audio, path)
+        seq = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        par_text, _ = await transcribe_long(path, pool=pool)
+        par = time.perf_counter() - t0
+    finally:
+        pool.shutdown()
+    return {"seq_rtf": seq / duration, "par_rtf": par / duration, "speedup": seq / par,
+            "seq_chars": len(seq_text), "par_chars": len(par_text)}
+
+def main() -> None:
+    cores = os.cpu_count() or 1
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--audio", required=True)
+    ap.add_argument("--model", default="small")
+    ap.add_argument("--workers", default=",".join(str(n) for n in (1, 2, 4, 8) if n <= cores) or "1")
+    args = ap.parse_args()
+
+    duration = probe_duration(args.audio)
+    if not duration:
+        raise SystemExit(f"cannot read duration of {args.audio}")
+    print(f"audio={duration:.0f}s model={args.model} cores={cores}")
+    for n in (int(x) for x in args.workers.split(",")):
+        r = asyncio.run(measure(args.audio, args.model, n, cores, duration))
+        print(
+            f"workers={n:2d}  single RTF {r['seq_rtf']:.3f}  chunked RTF {r['par_rtf']:.3f}  "
+            f"speedup x{r['speedup']:.2f}  (chars {r['seq_chars']} / {r['par_chars']})"
+        )
+
+if __name__ == "__main__":
+    main()
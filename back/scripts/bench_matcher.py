@@ -0,0 +1,52 @@
+"""
+루브릭 키워드 매칭 벤치마크: 키워드마다 `kw in text` vs Aho–Corasick 한 번 순회
+
+    cd back && python -m scripts.bench_matcher [--keywords 1000] [--chars 10000] [--answers 20]
+"""
+import argparse
+import random
+import time
+
+from app.services.analyze import calc_keyword_hit_rate
+from app.services.matcher import KeywordMatcher, get_matcher
+
+SYLLABLES = "가나다라마바사아자차카타파하거너더러머버서어저처커터퍼허고노도로모보소오조초"
+
+def naive_hit_rate(transcript: str, rubric_keywords: list[str]) -> float:
+    t = transcript.lower()
+    hits = sum(1 for kw in rubric_keywords if kw.strip().lower() and kw.strip().lower() in t)
+    return hits / len(rubric_keywords)
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--keywords", type=int, default=1000)
+    ap.add_argument("--chars", type=int, default=10000)
+    ap.add_argument("--answers", type=int, default=20)
+    args = ap.parse_args()
+
+    rng = random.Random(0)
+    word = lambda lo, hi: "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(lo, hi)))
+    kws = sorted({word(2, 5) for _ in range(args.keywords * 2)})[: args.keywords]
+    answers = [" ".join(word(1, 4) for _ in range(args.chars // 3))[: args.chars] for _ in range(args.answers)]
+
+    t0 = time.perf_counter()
+    KeywordMatcher(kws)
+    build_ms = (time.perf_counter() - t0) * 1000
+    get_matcher([k.lower() for k in kws])  # 캐시 예열(라우트에서는 첫 요청 때 한 번)
+
+    t0 = time.perf_counter()
+    expected = [naive_hit_rate(a, kws) for a in answers]
+    naive_ms = (time.perf_counter() - t0) * 1000 / len(answers)
+
+    t0 = time.perf_counter()
+    got = [calc_keyword_hit_rate(a, kws) for a in answers]
+    ac_ms = (time.perf_counter() - t0) * 1000 / len(answers)
+    assert got == expected
+
+    print(f"{len(kws)} keywords, {args.chars}-char answers x {len(answers)}")
+    print(f"automaton build (once per rubric, cached): {build_ms:.1f} ms")
+    print(f"per-keyword `in` scan : {naive_ms:.2f} ms/answer")
+    print(f"Aho–Corasick (cached) : {ac_ms:.2f} ms/answer  ({naive_ms / ac_ms:.1f}x)")
+
+if __name__ == "__main__":
+    main()
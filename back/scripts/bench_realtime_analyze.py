@@ -0,0 +1,56 @@
+"""
+실시간 websocket 분석 비용 벤치마크: 메시지마다 analyze(누적 전체) vs AnalyzerState(덧붙은 부분만)
+
+    cd back && python -m scripts.bench_realtime_analyze [--chars 20000] [--step 20]
+"""
+import argparse
+import random
+import time
+
+from app.services.analyze import AnalyzerState, analyze
+
+WORDS = ["음", "그러니까", "캐시를", "적용해서", "응답 시간을", "개선했고,", "장애", "원인을", "분석했습니다.", "약간", "인덱스"]
+
+def make_text(n: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    out = []
+    size = 0
+    while size < n:
+        w = rng.choice(WORDS) + " "
+        out.append(w); size += len(w)
+    return "".join(out)[:n]
+
+def per_message_us(fn, text: str, step: int) -> list[float]:
+    times = []
+    for end in range(step, len(text) + 1, step):
+        t0 = time.perf_counter()
+        fn(text[:end], end / 10.0)
+        times.append((time.perf_counter() - t0) * 1e6)
+    return times
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--chars", type=int, default=20000)
+    ap.add_argument("--step", type=int, default=20)
+    args = ap.parse_args()
+
+    text = make_text(args.chars)
+    kws = ["캐시", "인덱스", "원인-해결", "구체성", "영향도"]
+
+    full = per_message_us(lambda t, d: analyze(t, kws, d), text, args.step)
+    st = AnalyzerState(kws)
+    incr = per_message_us(lambda t, d: st.update(t).result(d), text, args.step)
+    assert st.result(1.0) == analyze(text, kws, 1.0)
+
+    n = len(full)
+    print(f"{n} messages, {args.step} chars each, {args.chars} chars total")
+    print(f"{'answer position':>16} | {'analyze() us/msg':>16} | {'AnalyzerState us/msg':>20}")
+    for lo in range(0, 100, 20):
+        a, b = n * lo // 100, n * (lo + 20) // 100
+        f = sum(full[a:b]) / max(1, b - a)
+        i = sum(incr[a:b]) / max(1, b - a)
+        print(f"{lo:>6}% - {lo + 20:>3}%   | {f:>16.1f} | {i:>20.1f}")
+    print(f"total: analyze {sum(full) / 1e3:.1f} ms, AnalyzerState {sum(incr) / 1e3:.1f} ms")
+
+if __name__ == "__main__":
+    main()
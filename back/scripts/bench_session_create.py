@@ -0,0 +1,71 @@
+"""
+세션 생성 경로 비교: 세션 커밋 + 질문 행별 add/커밋(기존) vs 한 트랜잭션 + INSERT … RETURNING(현재)
+- 질문 8 / 50 / 200 개짜리 세션을 각각 --sessions 개 생성해 sessions/s 출력
+- 기본: 임시 SQLite 파일. Postgres 는 --url postgresql://... (빈 DB)
+
+    cd back && python -m scripts.bench_session_create [--sessions 200] [--url ...]
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+def _setup_env(url: str | None) -> str:
+    if not url:
+        url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+    os.environ["DATABASE_URL"] = url
+    return url
+
+def _questions(n: int) -> list[dict]:
+    return [{"text": f"질문 {i}", "rubric_keywords": ["캐시", "인덱스"], "difficulty": "medium"} for i in range(n)]
+
+def _session(m):
+    return m.Session(role="backend", job_title="BE", level="junior", difficulty="medium", company="")
+
+async def old_path(db, m, questions) -> None:
+    s = _session(m)
+    db.add(s)
+    await db.commit()
+    await db.refresh(s)
+    for q in questions:
+        db.add(m.Question(session_id=s.id, text=q["text"], rubric_keywords=",".join(q["rubric_keywords"]), difficulty=q["difficulty"]))
+    await db.commit()
+
+async def new_path(db, m, questions) -> None:
+    from app.db.bulk import insert_questions
+    s = _session(m)
+    db.add(s)
+    await db.flush()
+    await insert_questions(db, s.id, questions)
+    await db.commit()
+
+async def run(n_sessions: int) -> None:
+    from app.db.base import Base
+    from app.db.session import AsyncSessionLocal, async_engine
+    from app.db import models as m
+
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    for n_q in (8, 50, 200):
+        qs = _questions(n_q)
+        for name, fn in (("per-row", old_path), ("bulk   ", new_path)):
+            started = time.perf_counter()
+            for _ in range(n_sessions):
+                async with AsyncSessionLocal() as db:
+                    await fn(db, m, qs)
+            elapsed = time.perf_counter() - started
+            print(f"{n_q:4d} questions  {name}: {n_sessions / elapsed:8.1f} sessions/s")
+    await async_engine.dispose()
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sessions", type=int, default=200)
+    ap.add_argument("--url", default=None, help="기본: 임시 SQLite 파일")
+    args = ap.parse_args()
+    url = _setup_env(args.url)
+    print(f"db={url.split('://')[0]} sessions={args.sessions}")
+    asyncio.run(run(args.sessions))
+
+if __name__ == "__main__":
+    main()
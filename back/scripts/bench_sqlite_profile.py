@@ -0,0 +1,116 @@
+"""
+SQLite 프로필 비교: 기본값 vs WAL+PRAGMA+단일 writer
+- 실제 앱(app.main)에 답변 제출(POST /api/answers, 쓰기)과 분석 조회(GET /api/answers/{id}/analytics, 읽기)를
+  섞어 동시에 보냄. httpx ASGITransport 로 프로세스 내에서
+- 설정은 import 시점에 정해지므로 프로필마다 자식 프로세스로 실행
+  default: SQLITE_PROFILE=default SQLITE_SINGLE_WRITER=false (기존 동작)
+  wal    : SQLITE_PROFILE=wal     SQLITE_SINGLE_WRITER=true
+
+    cd back && python -m scripts.bench_sqlite_profile [--requests 2000] [--concurrency 100] [--write-ratio 0.5]
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+PROFILES = {
+    "default": {"SQLITE_PROFILE": "default", "SQLITE_SINGLE_WRITER": "false"},
+    "wal": {"SQLITE_PROFILE": "wal", "SQLITE_SINGLE_WRITER": "true"},
+}
+
+def seed() -> tuple[int, list[int]]:
+    from app.db.base import Base
+    from app.db.session import SessionLocal, engine
+    from app.db import models as m
+
+    Base.metadata.create_all(engine)
+    with SessionLocal() as db:
+        s = m.Session(role="backend", job_title="Backend Engineer", level="junior", difficulty="medium", company="")
+        db.add(s); db.flush()
+        q = m.Question(session_id=s.id, text="Q", rubric_keywords="캐시,인덱스", difficulty="medium")
+        db.add(q); db.flush()
+        answers = [m.Answer(question_id=q.id, type="text", transcript="캐시", duration_sec=10) for _ in range(200)]
+        db.add_all(answers); db.flush()
+        db.add_all([m.Analytics(answer_id=a.id, filler_ratio=0.0, wpm=120.0, sentiment="neu",
+                                keyword_hit_rate=1.0, clarity_score=4.0, coherence_score=3.5) for a in answers])
+        db.commit()
+        return q.id, [a.id for a in answers]
+
+async def run(qid: int, ids: list[int], requests: int, concurrency: int, write_ratio: float) -> dict:
+    import httpx
+    from app.main import app
+
+    lat = {"read": [], "write": []}
+    errors = 0
+    sem = asyncio.Semaphore(concurrency)
+    every = max(1, round(1 / write_ratio)) if write_ratio > 0 else 0
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        async def one(i: int):
+            nonlocal errors
+            kind = "write" if every and i % every == 0 else "read"
+            async with sem:
+                t0 = time.perf_counter()
+                if kind == "write":
+                    r = await client.post("/api/answers", json={"question_id": qid, "transcript": "캐시 인덱스 음 설명", "duration_sec": 5})
+                else:
+                    r = await client.get(f"/api/answers/{ids[i % len(ids)]}/analytics")
+                if r.status_code != 200:
+                    errors += 1
+                    return
+                lat[kind].append((time.perf_counter() - t0) * 1000)
+
+        await one(1)
+        for v in lat.values():
+            v.clear()
+        started = time.perf_counter()
+        await asyncio.gather(*(one(i) for i in range(requests)))
+        elapsed = time.perf_counter() - started
+
+    def p(v, q):
+        v = sorted(v)
+        return v[max(0, int(len(v) * q) - 1)] if v else 0.0
+    return {
+        "rps": requests / elapsed,
+        "errors": errors,
+        **{f"{k}_p50": statistics.median(v) if v else 0.0 for k, v in lat.items()},
+        **{f"{k}_p95": p(v, 0.95) for k, v in lat.items()},
+    }
+
+def child(args) -> None:
+    qid, ids = seed()
+    print(json.dumps(asyncio.run(run(qid, ids, args.requests, args.concurrency, args.write_ratio))))
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--requests", type=int, default=2000)
+    ap.add_argument("--concurrency", type=int, default=100)
+    ap.add_argument("--write-ratio", type=float, default=0.5)
+    ap.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        return child(args)
+
+    print(f"requests={args.requests} concurrency={args.concurrency} write_ratio={args.write_ratio}")
+    for name, env in PROFILES.items():
+        db = os.path.join(tempfile.mkdtemp(), "bench.db")
+        out = subprocess.run(
+            [sys.executable, "-m", "scripts.bench_sqlite_profile", "--child",
+             "--requests", str(args.requests), "--concurrency", str(args.concurrency), "--write-ratio", str(args.write_ratio)],
+            env={**os.environ, **env, "DATABASE_URL": f"sqlite:///{db}", "WHISPER_PRELOAD": ""},
+            capture_output=True, text=True, check=True,
+        )
+        r = json.loads(out.stdout.strip().splitlines()[-1])
+        print(
+            f"{name:7s}: {r['rps']:7.0f} req/s  errors {r['errors']:4d}  "
+            f"write p50 {r['write_p50']:7.1f}ms p95 {r['write_p95']:7.1f}ms  "
+            f"read p50 {r['read_p50']:7.1f}ms p95 {r['read_p95']:7.1f}ms"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+루브릭 변경 후 저장된 답변 전체 재채점(관리자용)
+- Answer 를 id 순 키셋 페이지로 읽고(OFFSET 없음) analyze_batch 로 한 번에 채점
+- Analytics 는 배치마다 쓰기 세션에서 bulk upsert + 커밋 1회(읽기는 읽기 풀에서)
+
+    cd back && python -m scripts.rescore_answers [--batch 1000] [--session-id 12]
+"""
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import select
+
+from app.db.session import AsyncSessionLocal, AsyncWriteSessionLocal, async_engine, async_write_engine
+from app.db import models as m
+from app.db.bulk import upsert_analytics, analytics_rows
+from app.services.analyze import analyze_batch, batch_results
+
+async def rescore(batch: int = 1000, session_id: int | None = None) -> int:
+    total, last_id = 0, 0
+    started = time.perf_counter()
+    async with AsyncSessionLocal() as db:
+        while True:
+            stmt = (
+                select(m.Answer.id, m.Answer.transcript, m.Answer.duration_sec, m.Question.rubric_keywords)
+                .join(m.Question, m.Question.id == m.Answer.question_id)
+                .where(m.Answer.id > last_id)
+                .order_by(m.Answer.id)
+                .limit(batch)
+            )
+            if session_id is not None:
+                stmt = stmt.where(m.Question.session_id == session_id)
+            rows = (await db.execute(stmt)).all()
+            await db.rollback()  # 읽기 스냅샷을 배치마다 닫아 WAL 체크포인트를 막지 않게
+            if not rows:
+                break
+
+            results = batch_results(analyze_batch(
+                [r.transcript for r in rows],
+                [[s.strip() for s in (r.rubric_keywords or "").split(",") if s.strip()] for r in rows],
+                [r.duration_sec for r in rows],
+            ))
+            async with AsyncWriteSessionLocal() as wdb:
+                await upsert_analytics(wdb, analytics_rows([r.id for r in rows], results))
+                await wdb.commit()
+
+            total += len(rows)
+            last_id = rows[-1].id
+            elapsed = time.perf_counter() - started
+            print(f"rescored {total} answers ({total / elapsed:,.0f} rows/s)", flush=True)
+
+    elapsed = time.perf_counter() - started
+    print(f"done: {total} answers in {elapsed:.2f}s ({total / max(elapsed, 1e-9):,.0f} rows/s)")
+    return total
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--batch", type=int, default=1000)
+    ap.add_argument("--session-id", type=int, default=None)
+    args = ap.parse_args()
+
+    async def run():
+        try:
+            await rescore(args.batch, args.session_id)
+        finally:
+            await async_engine.dispose()
+            if async_write_engine is not async_engine:
+                await async_write_engine.dispose()
+    asyncio.run(run())
+
+if __name__ == "__main__":
+    main()
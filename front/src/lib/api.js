@@ -1,4 +1,4 @@
-const BASE = import.meta.env.VITE_API_BASE || 'http://localhost:8000';
+export const BASE = import.meta.env.VITE_API_BASE || 'http://localhost:8000';
 export const api = {
   get: (p) => fetch(`${BASE}${p}`, { credentials: 'include' }),
   post: (p, body) =>
@@ -10,6 +10,23 @@ export const api = {
     }),
 };
 
+// 리포트 생성은 백그라운드 작업: POST → job id → 끝날 때까지 폴링
+export async function generateReport(sessionId, { intervalMs = 1000, timeoutMs = 120000 } = {}) {
+  const r = await api.post(`/api/sessions/${sessionId}/report`);
+  if (!r.ok) return null;
+  const { job_id } = await r.json();
+  const until = Date.now() + timeoutMs;
+  while (Date.now() < until) {
+    const j = await api.get(`/api/reports/jobs/${job_id}`);
+    if (!j.ok) return null;
+    const job = await j.json();
+    if (job.status === 'done') return job;
+    if (job.status === 'failed') return null;
+    await new Promise((res) => setTimeout(res, intervalMs));
+  }
+  return null;
+}
+
 export async function getMe() {
   const token = localStorage.getItem('accessToken');
   const res = await fetch(`${import.meta.env.VITE_API_BASE}/api/me`, {
@@ -1,6 +1,6 @@
 import { useEffect, useState } from 'react';
 import { useParams, Link, useNavigate } from 'react-router-dom';
-import { api } from '../lib/api';
+import { api, generateReport } from '../lib/api';
 import React from 'react';
 
 export default function Interview() {
@@ -34,8 +34,8 @@ export default function Interview() {
   };
 
   const genReport = async () => {
-    const r = await api.post(`/api/sessions/${sessionId}/report`);
-    if (r.ok) nav(`/report/${sessionId}`);
+    const job = await generateReport(sessionId);
+    if (job) nav(`/report/${sessionId}`);
     else alert('리포트 생성 실패');
   };
 
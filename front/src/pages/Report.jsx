@@ -1,6 +1,6 @@
 import { useEffect, useState } from 'react';
 import { useParams } from 'react-router-dom';
-import { api } from '../lib/api';
+import { api, BASE } from '../lib/api';
 import ReactMarkdown from 'react-markdown';
 import React from 'react';
 
@@ -21,12 +21,24 @@ export default function Report() {
     })();
   }, [sessionId]);
 
-  const regenerate = async () => {
-    const r = await api.post(`/api/sessions/${sessionId}/report`);
-    if (r.ok) {
-      const d = await r.json();
-      setData(d);
-    } else alert('생성 실패');
+  // SSE 로 요약/다음 연습 마크다운을 도착하는 대로 붙여서 표시
+  const regenerate = () => {
+    setData({ total_score: null, summary_md: '', suggestions_md: '' });
+    const es = new EventSource(`${BASE}/api/sessions/${sessionId}/report/stream`, {
+      withCredentials: true,
+    });
+    es.addEventListener('delta', (e) => {
+      const { field, text } = JSON.parse(e.data);
+      setData((d) => ({ ...d, [field]: (d?.[field] || '') + text }));
+    });
+    es.addEventListener('done', (e) => {
+      es.close();
+      setData(JSON.parse(e.data));
+    });
+    es.onerror = () => {
+      es.close();
+      alert('생성 실패');
+    };
   };
 
   if (loading) return <div>리포트 로딩...</div>;
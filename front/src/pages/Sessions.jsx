@@ -6,13 +6,15 @@ import React from 'react';
 export default function Sessions() {
   const [list, setList] = useState([]);
   const [company, setCompany] = useState('');
-  const load = async () => {
-    const r = await api.get(
-      `/api/sessions/mine${
-        company ? `?company=${encodeURIComponent(company)}` : ''
-      }`
-    );
-    setList(r.ok ? await r.json() : []);
+  const [cursor, setCursor] = useState(null); // 다음 페이지 커서(null 이면 끝)
+  const load = async (more = false) => {
+    const qs = new URLSearchParams({ limit: '20' });
+    if (company) qs.set('company', company);
+    if (more && cursor) qs.set('cursor', cursor);
+    const r = await api.get(`/api/sessions/mine?${qs}`);
+    const page = r.ok ? await r.json() : { items: [], next_cursor: null };
+    setList((prev) => (more ? [...prev, ...page.items] : page.items));
+    setCursor(page.next_cursor);
   };
   useEffect(() => {
     load();
@@ -26,7 +28,7 @@ export default function Sessions() {
           value={company}
           onChange={(e) => setCompany(e.target.value)}
         />
-        <button onClick={load}>필터 적용</button>
+        <button onClick={() => load()}>필터 적용</button>
       </div>
       <table style={{ width: '100%', marginTop: 12 }}>
         <thead>
@@ -55,6 +57,11 @@ export default function Sessions() {
           ))}
         </tbody>
       </table>
+      {cursor && (
+        <button style={{ marginTop: 12 }} onClick={() => load(true)}>
+          더 보기
+        </button>
+      )}
     </div>
   );
 }
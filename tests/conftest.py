@@ -0,0 +1,35 @@
+import os
+import tempfile
+
+import pytest
+
+# 앱 import 전에 테스트용 DB 로 전환
+_tmp = tempfile.mkdtemp()
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_tmp, 'test.db')}")
+os.environ.setdefault("WHISPER_PRELOAD", "")  # 테스트에서는 실제 Whisper 모델을 로드하지 않음
+
+@pytest.fixture(scope="session", autouse=True)
+def _schema():
+    from app.db.base import Base
+    from app.db.session import engine
+    import app.db.models  # noqa: F401
+    Base.metadata.create_all(engine)
+    yield
+
+@pytest.fixture
+def db():
+    from app.db.session import SessionLocal
+    with SessionLocal() as s:
+        yield s
+
+@pytest.fixture
+def make_session(db):
+    from app.db import models as m
+
+    def _make(n_questions=3, rubric="캐시,인덱스"):
+        s = m.Session(role="backend", job_title="Backend Engineer", level="junior", difficulty="medium", company="")
+        db.add(s); db.flush()
+        qs = [m.Question(session_id=s.id, text=f"Q{i}", rubric_keywords=rubric, difficulty="medium") for i in range(n_questions)]
+        db.add_all(qs); db.commit()
+        return s, qs
+    return _make
@@ -0,0 +1,58 @@
+import random
+
+from app.services.analyze import AnalyzerState, analyze, analyze_batch, batch_results, calc_keyword_hit_rate
+from app.services.matcher import get_matcher
+
+VOCAB = ["음", "어", "그러니까", "캐시", "를", "적용해", "문제", "해결", "장애", "성공", "Redis", "인덱스",
+         " ", " ", ", ", ". ", "?", "[", "\\", "{", "}", "]", "s", "-",
+         ".\\{\\}]", "?\\{\\}]]"]  # 실제 구분자 패턴(tokenize_ko 정규식 그대로)
+
+def _random_text(rng, n):
+    return "".join(rng.choice(VOCAB) for _ in range(n))
+
+def test_analyzer_state_matches_full_analyze():
+    rng = random.Random(7)
+    kws = ["캐시", "redis", "인덱스 설계", "", "캐시"]
+    for _ in range(500):
+        text = _random_text(rng, rng.randint(0, 60))
+        st = AnalyzerState(kws)
+        pos = 0
+        while pos < len(text):
+            step = rng.randint(1, 6)
+            st.update(text[:pos + step])
+            pos += step
+            dur = rng.choice([0.0, 3.5, 42.0])
+            assert st.result(dur) == analyze(text[:pos], kws, dur)
+
+def test_analyzer_state_resets_on_rewrite():
+    st = AnalyzerState(["캐시"])
+    st.update("캐시를 썼다")
+    st.update("다른 답변")
+    assert st.result(10) == analyze("다른 답변", ["캐시"], 10)
+
+def _naive_hit_rate(transcript, rubric_keywords):
+    # 기존(키워드마다 `in` 검사) 구현
+    if not rubric_keywords:
+        return 0.0
+    t = transcript.lower()
+    hits = sum(1 for kw in rubric_keywords if kw.strip().lower() and kw.strip().lower() in t)
+    return hits / len(rubric_keywords)
+
+def test_matcher_matches_substring_semantics():
+    rng = random.Random(3)
+    alpha = "캐시인덱스장애해결abAB "
+    for _ in range(300):
+        kws = ["".join(rng.choice(alpha) for _ in range(rng.randint(0, 4))) for _ in range(rng.randint(0, 8))]
+        text = "".join(rng.choice(alpha) for _ in range(rng.randint(0, 80)))
+        assert calc_keyword_hit_rate(text, kws) == _naive_hit_rate(text, kws)
+
+    m = get_matcher(["he", "she", "his", "hers"])
+    assert sorted(m.finditer("ushers")) == [(1, 4, "she"), (2, 4, "he"), (2, 6, "hers")]
+
+def test_analyze_batch_matches_analyze():
+    rng = random.Random(11)
+    texts = [_random_text(rng, rng.randint(0, 50)) for _ in range(300)]
+    rubrics = [rng.choice([[], ["캐시"], ["캐시", "redis", ""], ["인덱스"] * 2]) for _ in texts]
+    durations = [rng.choice([0.0, -1.0, 0.5, 12.0, 90.0]) for _ in texts]
+    got = batch_results(analyze_batch(texts, rubrics, durations))
+    assert got == [analyze(t, k, d) for t, k, d in zip(texts, rubrics, durations)]
@@ -0,0 +1,26 @@
+import wave
+
+import numpy as np
+
+from app.services import audio_prep
+
+def _write_wav(path, seconds=1.5, rate=44100):
+    t = np.arange(int(seconds * rate)) / rate
+    tone = (np.sin(2 * np.pi * 440 * t) * 0.5 * 32767).astype("<i2")
+    with wave.open(str(path), "wb") as w:
+        w.setnchannels(2); w.setsampwidth(2); w.setframerate(rate)
+        w.writeframes(np.repeat(tone, 2).tobytes())  # 스테레오
+
+def test_decode_once_then_mmap_sidecar(tmp_path, monkeypatch):
+    path = tmp_path / "a.wav"
+    _write_wav(path)
+
+    audio = audio_prep.load_pcm(str(path))
+    assert audio.dtype == np.float32 and len(audio) == int(1.5 * audio_prep.SR)
+    assert (tmp_path / ("a.wav" + audio_prep.SUFFIX)).exists()
+
+    def no_decode(source):
+        raise AssertionError("decoded again")
+    monkeypatch.setattr(audio_prep, "decode", no_decode)
+    again = audio_prep.load_pcm(str(path))  # 두 번째부터는 사이드카(mmap)
+    assert np.abs(again - audio).max() < 1e-4
@@ -0,0 +1,21 @@
+import asyncio
+
+from sqlalchemy import text
+
+from app.db.session import AsyncSessionLocal, AsyncWriteSessionLocal, async_engine, async_write_engine
+
+def test_sqlite_profile_pragmas_and_single_writer():
+    async def pragmas(factory):
+        async with factory() as db:
+            return [(await db.execute(text(f"PRAGMA {p}"))).scalar() for p in ("journal_mode", "synchronous", "busy_timeout")]
+
+    async def main():
+        try:
+            return await pragmas(AsyncSessionLocal), await pragmas(AsyncWriteSessionLocal)
+        finally:
+            await async_engine.dispose()
+            await async_write_engine.dispose()
+
+    read, write = asyncio.run(main())
+    assert read == write == ["wal", 1, 5000]  # synchronous=NORMAL(1)
+    assert async_write_engine is not async_engine and async_write_engine.pool.size() == 1
@@ -0,0 +1,68 @@
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+from app.core.auth import make_tokens
+from app.core.config import settings
+from app.db import models as m
+from app.services import question_bank as qb
+
+def test_select_scores_tags_and_skips_seen():
+    bank = qb.QuestionBank()
+    asyncio.run(bank.load())
+    picked = bank.select("backend", "mid", "medium", ["Redis"], n=20)
+    texts = [q["text"] for q in picked]
+    assert texts[0].startswith("Redis")  # role + stack 일치가 최상위
+    assert not any("Spark" in t or "드리프트" in t for t in texts)  # 다른 직무 제외
+    assert any(t.startswith("자기소개") for t in texts)  # 직무 공통 포함
+
+    again = bank.select("backend", "mid", "medium", ["redis"], exclude=[texts[0] + "  ?"], n=20)
+    assert texts[0] not in [q["text"] for q in again]  # 정규화 텍스트로 제외
+
+def test_backfill_grows_bank_without_duplicates(monkeypatch):
+    async def fake_post_json(path, body, headers=None):
+        qs = [{"text": "Go 의 고루틴 스케줄링을 설명해 주세요.", "rubric_keywords": ["GMP", "선점"]},
+              {"text": qb.SEED[0]["text"], "rubric_keywords": ["중복"]}]
+        return {"choices": [{"message": {"content": json.dumps({"questions": qs})}}]}
+
+    monkeypatch.setattr(qb, "post_json", fake_post_json)
+    monkeypatch.setattr(settings, "LLM_PROVIDER", "openai")
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test")
+    bank = qb.QuestionBank()
+
+    async def run():
+        await bank.load()
+        before = len(bank)
+        assert bank.schedule_backfill("backend", "mid", "medium", ["go"])
+        assert not bank.schedule_backfill("backend", "mid", "medium", ["go"])  # 진행 중 중복 예약 없음
+        await asyncio.gather(*bank._tasks)
+        return before
+    before = asyncio.run(run())
+    assert len(bank) == before + 1
+    assert bank.select("backend", "mid", "medium", ["go"], n=1)[0]["rubric_keywords"] == ["GMP", "선점"]
+
+def test_new_session_avoids_questions_user_has_seen(db):
+    u = m.User(email="bank@example.com", password_hash="x")
+    db.add(u); db.commit()
+    from app.main import app
+    with TestClient(app) as client:
+        client.cookies.set("access_token", make_tokens(u.id)[0])
+        body = {"role": "backend", "job_title": "BE", "level": "junior", "stack": ["redis"], "difficulty": "easy"}
+        first = client.post("/api/sessions", json=body).json()["questions"]
+        second = client.post("/api/sessions", json=body).json()["questions"]
+    assert len(first) == len(second) == 8
+    assert not {q["text"] for q in first} & {q["text"] for q in second}
+
+def test_sessions_keep_full_question_count_when_unseen_run_out(db):
+    u = m.User(email="bank-frontend@example.com", password_hash="x")
+    db.add(u); db.commit()
+    from app.main import app
+    with TestClient(app) as client:
+        client.cookies.set("access_token", make_tokens(u.id)[0])
+        body = {"role": "frontend", "job_title": "FE", "level": "junior", "stack": ["react"], "difficulty": "easy"}
+        sessions = [[q["text"] for q in client.post("/api/sessions", json=body).json()["questions"]] for _ in range(4)]
+    assert [len(qs) for qs in sessions] == [8, 8, 8, 8]  # 안 본 질문이 바닥나도 n개
+    assert all(len(set(qs)) == 8 for qs in sessions)  # 세션 안에서는 중복 없음
+    fresh = [t for t in sessions[1] if t not in sessions[0]]
+    assert sessions[1][len(fresh):] == sessions[0][:8 - len(fresh)]  # 다시 낼 때는 오래된 것부터
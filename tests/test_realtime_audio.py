@@ -0,0 +1,130 @@
+import asyncio
+import json
+import time
+
+import numpy as np
+from fastapi.testclient import TestClient
+
+from app.services import stt_live
+from app.services.stt_pool import stt_pool
+
+SR = stt_live.SR
+
+def _fake_words(audio, offset_sec, language="ko", prompt="", model=None):
+    """값이 같은 연속 구간 k → 단어 ' w{k}' (s16 값 k*100)"""
+    vals = np.round(audio * 32768 / 100).astype(int)
+    edges = np.flatnonzero(np.diff(vals)) + 1
+    bounds = [0, *edges.tolist(), len(vals)]
+    return [(offset_sec + a / SR, offset_sec + b / SR, f" w{vals[a]}") for a, b in zip(bounds, bounds[1:]) if vals[a]]
+
+def test_local_agreement_commits_common_prefix():
+    la = stt_live.LocalAgreement()
+    assert la.insert([(0.0, 0.5, " 캐시"), (0.5, 0.9, " 적")]) == []
+    assert [w[2] for w in la.insert([(0.0, 0.5, " 캐시"), (0.5, 1.2, " 적용")])] == [" 캐시"]
+    # 확정 구간을 다시 포함한 가설(버퍼 잘림 전) → 중복 없이 다음 단어만 확정
+    assert [w[2] for w in la.insert([(0.0, 0.5, " 캐시"), (0.5, 1.2, " 적용"), (1.2, 1.6, " 했")])] == [" 적용"]
+    assert [w[2] for w in la.flush()] == [" 했"]
+    assert "".join(w[2] for w in la.committed) == " 캐시 적용 했"
+
+def test_audio_frames_feed_realtime_analysis(monkeypatch, make_session):
+    monkeypatch.setattr(stt_live, "transcribe_words", _fake_words)
+    monkeypatch.setattr(stt_pool.registry, "_loader", lambda size: None)
+    s, qs = make_session(1)
+
+    from app.main import app
+    with TestClient(app) as client, client.websocket_connect(f"/api/realtime/{s.id}") as ws:
+        ws.send_text(json.dumps({"type": "audio_start", "question_id": qs[0].id, "format": "pcm_s16le"}))
+        for k in range(1, 7):  # 0.5초 프레임마다 단어 하나
+            ws.send_bytes(np.full(SR // 2, k * 100, "<i2").tobytes())
+        ws.send_text(json.dumps({"type": "audio_end"}))
+
+        msgs = []
+        while not msgs or msgs[-1].get("type") != "audio_end":
+            msgs.append(json.loads(ws.receive_text()))
+
+    feedback = [x for x in msgs if x.get("source") == "audio"]
+    assert "".join(x["committed"] for x in feedback) == " w1 w2 w3 w4 w5 w6"
+    assert feedback[-1]["elapsed_sec"] == 3.0 and feedback[-1]["partial"] == ""
+    assert "tip" in feedback[-1] and "wpm" in feedback[-1]["metrics"]
+
+def test_malformed_frames_are_reported_and_do_not_stall():
+    errors = []
+
+    async def go():
+        async def emit(*_):
+            pass
+
+        async def on_error(detail):
+            errors.append(detail)
+
+        lt = stt_live.LiveTranscriber(emit, fmt="opus", sample_rate=48000, on_error=on_error).start()
+        for _ in range(60):  # 대기열 상한(50)보다 많이
+            await lt.push(b"\xff\xfe\xfd" * 10)
+        await lt.finish()
+
+    asyncio.run(asyncio.wait_for(go(), 5))
+    assert len(errors) == 60 and errors[0].startswith("audio decode failed")
+
+def test_split_frames_and_model_error_keep_stream_going(monkeypatch, make_session):
+    calls = []
+
+    def flaky(audio, offset_sec, **kw):
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("model exploded")
+        return _fake_words(audio, offset_sec, **kw)
+
+    monkeypatch.setattr(stt_live, "transcribe_words", flaky)
+    monkeypatch.setattr(stt_pool.registry, "_loader", lambda size: None)
+    s, qs = make_session(1)
+
+    from app.main import app
+    with TestClient(app) as client, client.websocket_connect(f"/api/realtime/{s.id}") as ws:
+        ws.send_text(json.dumps({"type": "audio_start", "question_id": qs[0].id, "format": "pcm_s16le"}))
+        for k in range(1, 7):
+            frame = np.full(SR // 2, k * 100, "<i2").tobytes()
+            ws.send_bytes(frame[:3]); ws.send_bytes(frame[3:])  # 샘플 경계가 아닌 곳에서 잘린 프레임
+        ws.send_text(json.dumps({"type": "audio_end"}))
+
+        msgs = []
+        while not msgs or msgs[-1].get("type") != "audio_end":
+            msgs.append(json.loads(ws.receive_text()))
+
+    assert [x["error"] for x in msgs if "error" in x] == ["transcription failed: model exploded"]
+    assert "".join(x["committed"] for x in msgs if x.get("source") == "audio") == " w1 w2 w3 w4 w5 w6"
+
+def test_metric_snapshots_flush_and_timeline(monkeypatch, make_session):
+    from app.services import metric_buffer
+    monkeypatch.setattr(metric_buffer.settings, "METRICS_FLUSH_ROWS", 7)
+    s, qs = make_session(1)
+    _, other = make_session(1)
+    before = metric_buffer.stats()
+
+    from app.main import app
+    with TestClient(app) as client:
+        with client.websocket_connect(f"/api/realtime/{s.id}") as ws:
+            ws.send_text(json.dumps({"question_id": other[0].id, "delta": " 캐시", "elapsed_sec": 1.0}))
+            assert json.loads(ws.receive_text()) == {"error": "Question not found"}  # 다른 세션 질문
+            for i in range(1, 31):
+                ws.send_text(json.dumps({"question_id": qs[0].id, "delta": " 캐시", "elapsed_sec": float(i)}))
+                ws.receive_text()
+        # 끊긴 뒤 남은 스냅샷까지 저장됨(연결 종료 후 백그라운드에서 마무리)
+        for _ in range(100):
+            if metric_buffer.stats()["flushed_rows"] - before["flushed_rows"] >= 30:
+                break
+            time.sleep(0.02)
+        full = client.get(f"/api/sessions/{s.id}/metrics/timeline").json()
+        sampled = client.get(f"/api/sessions/{s.id}/metrics/timeline?max_points=10").json()
+
+    stats = metric_buffer.stats()
+    assert stats["flushed_rows"] - before["flushed_rows"] == 30
+    assert stats["flushes"] - before["flushes"] >= 5  # 7개씩 묶음 + 종료 시 나머지
+    assert len(full["questions"]) == 1
+    q = full["questions"][0]
+    assert q["question_id"] == qs[0].id and q["points"] == q["returned"] == 30
+    assert [p["elapsed_sec"] for p in q["timeline"]] == [float(i) for i in range(1, 31)]
+    ds = sampled["questions"][0]
+    assert ds["points"] == 30 and ds["returned"] <= 10
+    # 구간 폭 29/9 초, 내림으로 나눈 구간마다 마지막 점
+    assert [p["elapsed_sec"] for p in ds["timeline"]] == [4.0, 7.0, 10.0, 13.0, 17.0, 20.0, 23.0, 26.0, 29.0, 30.0]
+    assert ds["timeline"][-1]["elapsed_sec"] == 30.0 and "wpm" in ds["timeline"][0]
@@ -0,0 +1,140 @@
+import asyncio
+import json
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+from app.core.auth import make_tokens
+from app.db import models as m
+from app.services.realtime_bus import MemoryBroker, RedisBroker
+
+class FakeRedis:
+    """PUBLISH/SUBSCRIBE 만 흉내 내는 로컬 가짜 서버(클라이언트 여럿이 공유 = 워커 여럿)"""
+
+    def __init__(self):
+        self.channels = {}
+
+    def client(self):
+        server = self
+
+        class Client:
+            async def publish(self, channel, data):
+                subs = server.channels.get(channel, set())
+                for ps in subs:
+                    ps.inbox.put_nowait({"type": "message", "channel": channel.encode(), "data": data.encode()})
+                return len(subs)
+
+            def pubsub(self):
+                return PubSub()
+
+        class PubSub:
+            def __init__(self):
+                self.inbox = asyncio.Queue()
+
+            async def subscribe(self, channel):
+                server.channels.setdefault(channel, set()).add(self)
+
+            async def unsubscribe(self, channel):
+                server.channels.get(channel, set()).discard(self)
+
+            async def get_message(self, ignore_subscribe_messages=True, timeout=1.0):
+                try:
+                    return await asyncio.wait_for(self.inbox.get(), timeout)
+                except asyncio.TimeoutError:
+                    return None
+
+            async def aclose(self):
+                pass
+
+        return Client()
+
+def test_slow_subscriber_keeps_latest():
+    async def main():
+        b = MemoryBroker(queue_size=3)
+        async with b.subscribe("session:1") as sub:
+            for i in range(10):
+                await b.publish("session:1", {"i": i})
+            got = [(await sub.get())["i"] for _ in range(3)]
+            return got, sub.dropped, b.stats()
+
+    got, dropped, stats = asyncio.run(main())
+    assert got == [7, 8, 9] and dropped == 7
+    assert stats["dropped"] == 7 and stats["subscribers"] == 1
+
+def test_redis_broker_fans_out_across_workers():
+    async def main():
+        server = FakeRedis()
+        a, b = RedisBroker("", client=server.client()), RedisBroker("", client=server.client())
+        try:
+            async with b.subscribe("session:7") as on_b, a.subscribe("session:7") as on_a:
+                await a.publish("session:7", {"wpm": 120.0})
+                got = await asyncio.wait_for(on_b.get(), 2), await asyncio.wait_for(on_a.get(), 2)
+            left = dict(server.channels)
+        finally:
+            await a.close(); await b.close()
+        return got, left
+
+    got, left = asyncio.run(main())
+    assert got == ({"wpm": 120.0}, {"wpm": 120.0})
+    assert all(not subs for subs in left.values())  # 마지막 구독자가 나가면 채널 구독 해제
+
+def test_publish_nowait_never_waits_on_slow_redis(monkeypatch):
+    from app.services import realtime_bus
+    monkeypatch.setattr(realtime_bus.settings, "REALTIME_PUBLISH_TIMEOUT_SEC", 0.05)
+
+    async def main():
+        server = FakeRedis()
+        slow = server.client()
+        fast_publish = slow.publish
+
+        async def stalled(channel, data):
+            await asyncio.sleep(10)
+
+        b = RedisBroker("", client=slow)
+        try:
+            t0 = time.perf_counter()
+            slow.publish = stalled
+            for i in range(5):
+                b.publish_nowait("session:9", {"i": i})
+            enqueue_sec = time.perf_counter() - t0
+            await asyncio.sleep(0.4)  # 전송 태스크가 타임아웃으로 하나씩 포기
+            errors = b.stats()["errors"]
+
+            slow.publish = fast_publish  # 수신자 0 → 잠시 건너뜀
+            b.publish_nowait("session:9", {"i": 5})
+            await asyncio.sleep(0.05)
+            b.publish_nowait("session:9", {"i": 6})
+            return enqueue_sec, errors, b.stats()
+        finally:
+            await b.close()
+
+    enqueue_sec, errors, stats = asyncio.run(main())
+    assert enqueue_sec < 0.05 and errors == 5
+    assert stats["skipped"] == 1
+
+def test_observer_follows_candidate(db, make_session):
+    owner = m.User(email="watch-owner@example.com", password_hash="x")
+    stranger = m.User(email="watch-other@example.com", password_hash="x")
+    db.add_all([owner, stranger]); db.commit()
+    s, qs = make_session(1)
+    s.user_id = owner.id; db.commit()
+
+    from app.main import app
+    with TestClient(app) as client:
+        for token in (None, make_tokens(stranger.id)[0]):  # 비로그인/다른 사용자는 구독 불가
+            client.cookies.clear()
+            if token:
+                client.cookies.set("access_token", token)
+            with pytest.raises(WebSocketDisconnect):
+                with client.websocket_connect(f"/api/realtime/{s.id}/watch"):
+                    pass
+        client.cookies.set("access_token", make_tokens(owner.id)[0])
+        with client.websocket_connect(f"/api/realtime/{s.id}/watch") as watcher:
+            assert json.loads(watcher.receive_text())["type"] == "subscribed"
+            with client.websocket_connect(f"/api/realtime/{s.id}") as ws:
+                ws.send_text(json.dumps({"question_id": qs[0].id, "text": "캐시 인덱스", "elapsed_sec": 3.0}))
+                mine = json.loads(ws.receive_text())
+            seen = json.loads(watcher.receive_text())
+    assert seen["session_id"] == s.id and seen["metrics"] == mine["metrics"] and seen["tip"] == mine["tip"]
@@ -0,0 +1,38 @@
+import asyncio
+import time
+
+from app.services.report_cache import MemoryCache, ReportCache, SqliteCache, cache_key
+
+PAYLOAD = {
+    "session": {"id": 1, "role": "backend", "job_title": "BE", "level": "junior", "difficulty": "medium",
+                "created_at": "2026-01-01T00:00:00"},
+    "qas": [{"question": "Q", "rubric_keywords": "캐시", "missing_keywords": [], "answer": "캐시",
+             "analytics": {"wpm": 120.000001, "clarity_score": 4.0}}],
+}
+
+def test_key_is_content_addressed():
+    other = {**PAYLOAD, "session": {**PAYLOAD["session"], "id": 2, "created_at": "2026-02-02T00:00:00"}}
+    k = cache_key(PAYLOAD, "m", "v1")
+    assert k == cache_key(other, "m", "v1")
+    assert k != cache_key(PAYLOAD, "m2", "v1")
+    assert k != cache_key(PAYLOAD, "m", "v2")
+    changed = {**PAYLOAD, "qas": [{**PAYLOAD["qas"][0], "answer": "인덱스"}]}
+    assert k != cache_key(changed, "m", "v1")
+
+def test_memory_lru_and_ttl(monkeypatch):
+    async def run():
+        c = MemoryCache(max_items=2, ttl_sec=10)
+        await c.set("a", {"v": 1}); await c.set("b", {"v": 2})
+        await c.get("a")  # a 최근 사용
+        await c.set("c", {"v": 3})
+        assert await c.get("b") is None and (await c.get("a"))["v"] == 1
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 11)
+        assert await c.get("a") is None
+    asyncio.run(run())
+    assert ReportCache(MemoryCache(2, 10)).stats()["backend"] == "MemoryCache"  # 비어 있어도(len 0) 백엔드 있음
+
+def test_sqlite_persists_across_instances(tmp_path):
+    path = str(tmp_path / "cache.db")
+    asyncio.run(SqliteCache(path, 60).set("k", {"summary_md": "요약"}))
+    assert asyncio.run(SqliteCache(path, 60).get("k")) == {"summary_md": "요약"}
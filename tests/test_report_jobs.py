@@ -0,0 +1,155 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.db import models as m
+from app.services import llm_client, report_llm
+from app.services.report_cache import MemoryCache, ReportCache
+
+REPORT = {"total_score": 87.5, "summary_md": "## 요약\n- stub", "suggestions_md": "## 다음 연습 질문\n- stub"}
+
+class _Stub(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    script: list = []  # 응답 상태 코드 순서(비면 200)
+    seen: list = []    # (client port, path)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        _Stub.seen.append((self.client_address[1], self.path))
+        status = _Stub.script.pop(0) if _Stub.script else 200
+        body = json.dumps({"choices": [{"message": {"content": json.dumps(REPORT)}}]} if status == 200 else {}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_):
+        pass
+
+@pytest.fixture
+def stub(monkeypatch):
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _Stub)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    _Stub.script, _Stub.seen = [], []
+    monkeypatch.setattr(settings, "OPENAI_BASE_URL", f"http://127.0.0.1:{srv.server_port}/v1")
+    monkeypatch.setattr(settings, "LLM_PROVIDER", "openai")
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test")
+    monkeypatch.setattr(llm_client, "BACKOFF_BASE_SEC", 0.01)
+    monkeypatch.setattr(llm_client, "breaker", llm_client.CircuitBreaker(3, 60))
+    monkeypatch.setattr(report_llm, "report_cache", ReportCache(MemoryCache(16, 60)))
+    llm_client._client = None
+    yield _Stub
+    srv.shutdown()
+    llm_client._client = None
+
+async def _calls(n):
+    try:
+        return [await llm_client.post_json("/chat/completions", {}) for _ in range(n)]
+    finally:
+        await llm_client.close_client()
+
+def test_retry_then_success_reuses_connection(stub):
+    stub.script = [503, 502]
+    out = asyncio.run(_calls(3))
+    assert len(out) == 3 and len(stub.seen) == 5  # 재시도 2 + 성공 3
+    assert len({port for port, _ in stub.seen}) == 1  # keep-alive 커넥션 재사용
+    assert stub.seen[0][1] == "/v1/chat/completions"
+
+def test_cancelled_trial_call_releases_half_open(stub):
+    llm_client.breaker.opened_at = time.monotonic() - 61  # half-open
+
+    async def go():
+        t = asyncio.create_task(llm_client.post_json("/chat/completions", {}))
+        await asyncio.sleep(0)  # allow() 로 시험 슬롯을 잡은 뒤
+        t.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await t
+        await llm_client.close_client()
+        return llm_client.breaker.allow()
+
+    assert asyncio.run(go())  # 취소된 시험 호출 뒤에도 다음 호출이 다시 시험
+
+def test_circuit_opens_and_report_falls_back(stub, monkeypatch, db, make_session):
+    monkeypatch.setattr(settings, "LLM_MAX_RETRIES", 0)
+    stub.script = [500] * 10
+    for _ in range(3):
+        with pytest.raises(llm_client.LLMUnavailable):
+            asyncio.run(_calls(1))
+    assert llm_client.breaker.state == "open"
+    with pytest.raises(llm_client.LLMUnavailable, match="circuit open"):
+        asyncio.run(_calls(1))
+    assert len(stub.seen) == 3  # 열린 뒤에는 서버를 두드리지 않음
+
+    s, qs = make_session(1)
+    db.add(m.Answer(question_id=qs[0].id, type="text", transcript="캐시", duration_sec=5)); db.commit()
+    from app.main import app
+    with TestClient(app) as client:
+        job = _run_report_job(client, s.id)
+        rep = client.get(f"/api/sessions/{s.id}/report").json()
+    assert job["status"] == "done"
+    assert "stub" not in rep["summary_md"]  # 규칙기반 폴백
+    assert len(stub.seen) == 3
+
+def test_report_job_uses_llm(stub, db, make_session):
+    s, qs = make_session(2)
+    db.add_all([m.Answer(question_id=q.id, type="text", transcript="캐시", duration_sec=5) for q in qs]); db.commit()
+    from app.main import app
+    with TestClient(app) as client:
+        assert client.post("/api/sessions/999999/report").status_code == 404
+        job = _run_report_job(client, s.id)
+        rep = client.get(f"/api/sessions/{s.id}/report").json()
+    assert job["status"] == "done" and job["report_id"]
+    assert rep["total_score"] == 87.5 and rep["summary_md"] == REPORT["summary_md"]
+
+def test_unchanged_session_hits_cache(stub, db, make_session):
+    s, qs = make_session(1, rubric="큐")
+    db.add(m.Answer(question_id=qs[0].id, type="text", transcript="메시지 큐", duration_sec=5)); db.commit()
+    from app.main import app
+    with TestClient(app) as client:
+        _run_report_job(client, s.id)
+        _run_report_job(client, s.id)
+        assert len(stub.seen) == 1
+        db.add(m.Answer(question_id=qs[0].id, type="text", transcript="카프카 큐", duration_sec=5)); db.commit()
+        _run_report_job(client, s.id)  # 답변이 바뀌면 새 키
+    assert len(stub.seen) == 2
+    assert report_llm.report_cache.stats()["hits"] == 1
+
+def test_concurrent_create_job_returns_the_winner(monkeypatch, db, make_session):
+    from app.db.session import AsyncWriteSessionLocal, async_write_engine
+    from app.services import report_jobs
+
+    s, _ = make_session(1)
+    db.add(m.ReportJob(id="a" * 32, session_id=s.id, status="running", error="")); db.commit()
+
+    async def not_seen_yet(db, session_id):  # 다른 요청의 INSERT 가 조회 뒤에 커밋된 상황
+        return None
+    monkeypatch.setattr(report_jobs, "_active_job", not_seen_yet)
+    monkeypatch.setattr(report_jobs, "enqueue", lambda job_id: pytest.fail("loser must not enqueue"))
+
+    async def main():
+        try:
+            async with AsyncWriteSessionLocal() as wdb:
+                return (await report_jobs.create_job(wdb, s.id)).id
+        finally:
+            await async_write_engine.dispose()
+
+    assert asyncio.run(main()) == "a" * 32
+    assert db.query(m.ReportJob).filter_by(session_id=s.id).count() == 1
+
+def _run_report_job(client, session_id):
+    r = client.post(f"/api/sessions/{session_id}/report")
+    assert r.status_code == 202
+    job_id = r.json()["job_id"]
+    for _ in range(100):
+        job = client.get(f"/api/reports/jobs/{job_id}").json()
+        if job["status"] in ("done", "failed"):
+            return job
+        time.sleep(0.05)
+    raise AssertionError("report job did not finish")
@@ -0,0 +1,123 @@
+import asyncio
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.db import models as m
+from app.services import llm_client, report_llm
+from app.services.json_stream import JsonFieldStream
+from app.services.report_cache import MemoryCache, ReportCache
+
+def _report(n_lines):
+    return {
+        "total_score": 72.0,
+        "summary_md": "## 요약\n" + "".join(f'- 항목 {i} "인용" \\ 끝\n' for i in range(n_lines)),
+        "suggestions_md": "## 다음 연습 질문\n- 😀 STAR\t정리",
+    }
+
+class _FakeStreamingProvider(BaseHTTPRequestHandler):
+    """chat.completions stream=True 흉내: content 를 몇 글자씩 data: 줄로, 청크 사이 지연"""
+    report: dict = {}
+    delay = 0.0
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        assert body["stream"] is True
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        text = json.dumps(self.report)
+        for i in range(0, len(text), 7):
+            chunk = {"choices": [{"delta": {"content": text[i:i + 7]}}]}
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode()); self.wfile.flush()
+            time.sleep(self.delay)
+        self.wfile.write(b"data: [DONE]\n\n")
+
+    def log_message(self, *_):
+        pass
+
+@pytest.fixture
+def provider(monkeypatch):
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), _FakeStreamingProvider)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    monkeypatch.setattr(settings, "OPENAI_BASE_URL", f"http://127.0.0.1:{srv.server_port}/v1")
+    monkeypatch.setattr(settings, "LLM_PROVIDER", "openai")
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "test")
+    monkeypatch.setattr(llm_client, "breaker", llm_client.CircuitBreaker(3, 60))
+    monkeypatch.setattr(report_llm, "report_cache", ReportCache(MemoryCache(16, 60)))
+    llm_client._client = None
+    yield _FakeStreamingProvider
+    srv.shutdown()
+    llm_client._client = None
+
+def test_closed_stream_releases_half_open(provider):
+    provider.report, provider.delay = _report(20), 0.0
+    llm_client.breaker.opened_at = time.monotonic() - 61  # half-open
+
+    async def go():
+        gen = llm_client.stream_events("/chat/completions", {"stream": True})
+        await gen.__anext__()
+        await gen.aclose()  # SSE 소비자가 시험 호출 도중 끊김
+        await llm_client.close_client()
+        return llm_client.breaker.allow()
+
+    assert asyncio.run(go())
+
+def test_field_stream_any_chunking():
+    text = json.dumps(_report(3))
+    for seed in range(50):
+        rnd, parser, got, i = random.Random(seed), JsonFieldStream(["summary_md", "suggestions_md"]), {}, 0
+        while i < len(text):
+            j = i + rnd.randint(1, 6)
+            for field, piece in parser.feed(text[i:j]):
+                got[field] = got.get(field, "") + piece
+            i = j
+        assert got == {k: v for k, v in _report(3).items() if k != "total_score"}
+
+async def _first_delta_and_total(payload):
+    started, first, events = time.perf_counter(), None, []
+    try:
+        async for ev in report_llm.stream_report(payload):
+            if first is None and ev[0] == "delta":
+                first = time.perf_counter() - started
+            events.append(ev)
+    finally:
+        await llm_client.close_client()
+    return first, time.perf_counter() - started, events
+
+def test_time_to_first_delta_independent_of_length(provider):
+    provider.delay = 0.002
+    payload = {"session": {}, "qas": []}
+    ttfb = {}
+    for n in (1, 40):
+        provider.report = _report(n)
+        first, total, events = asyncio.run(_first_delta_and_total({**payload, "qas": [{"answer": str(n)}]}))
+        assert events[-1] == ("done", {**_report(n), "source": "llm"})
+        ttfb[n] = first
+        if n == 40:
+            assert total > 5 * first
+    assert ttfb[40] < ttfb[1] * 3 + 0.05
+
+def test_stream_endpoint_persists_report(provider, db, make_session):
+    provider.report = _report(5)
+    s, qs = make_session(1)
+    db.add(m.Answer(question_id=qs[0].id, type="text", transcript="스트리밍 캐시", duration_sec=5)); db.commit()
+    from app.main import app
+    with TestClient(app) as client:
+        with client.stream("GET", f"/api/sessions/{s.id}/report/stream") as resp:
+            body = "".join(resp.iter_text())
+        rep = client.get(f"/api/sessions/{s.id}/report").json()
+    events = [(b.split("\n")[0][7:], json.loads(b.split("\n")[1][6:])) for b in body.strip().split("\n\n")]
+    deltas = [d for e, d in events if e == "delta"]
+    assert len(deltas) > 2
+    assert "".join(d["text"] for d in deltas if d["field"] == "summary_md") == provider.report["summary_md"]
+    name, done = events[-1]
+    assert name == "done" and done["source"] == "llm" and done["report_id"]
+    assert rep["summary_md"] == provider.report["summary_md"] and rep["total_score"] == 72.0
@@ -0,0 +1,49 @@
+import asyncio
+from contextlib import contextmanager
+
+from sqlalchemy import event
+
+from app.api.routes.reports import _collect_session_payload
+from app.db import models as m
+from app.db.session import AsyncSessionLocal, async_engine
+
+@contextmanager
+def count_queries(engine):
+    counter = {"n": 0}
+
+    def _before(*_):
+        counter["n"] += 1
+
+    event.listen(engine, "before_cursor_execute", _before)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", _before)
+
+def _answer_all(db, qs):
+    for q in qs:
+        old = m.Answer(question_id=q.id, type="text", transcript="이전 답변", duration_sec=10)
+        new = m.Answer(question_id=q.id, type="text", transcript=f"{q.text} 캐시 답변", duration_sec=20)
+        db.add_all([old, new]); db.flush()
+        db.add(m.Analytics(answer_id=new.id, filler_ratio=0.0, wpm=120.0, sentiment="neu",
+                           keyword_hit_rate=0.5, clarity_score=4.0, coherence_score=3.5))
+    db.commit()
+
+async def _payload(session_id):
+    async with AsyncSessionLocal() as adb:
+        return await _collect_session_payload(adb, session_id)
+
+def test_payload_query_count_is_constant(db, make_session):
+    counts = {}
+    for n in (5, 50):
+        s, qs = make_session(n)
+        _answer_all(db, qs)
+        with count_queries(async_engine.sync_engine) as c:
+            payload = asyncio.run(_payload(s.id))
+        counts[n] = c["n"]
+        assert len(payload["qas"]) == n
+        qa = payload["qas"][0]
+        assert qa["answer"] == "Q0 캐시 답변"  # 질문별 최신 답변
+        assert qa["analytics"]["clarity_score"] == 4.0
+        assert qa["missing_keywords"] == ["인덱스"]
+    assert counts[5] == counts[50] <= 2
@@ -0,0 +1,35 @@
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.db.session import async_engine, async_write_engine
+from app.services.rubric_cache import rubric_cache
+
+def test_answer_hot_path_skips_question_lookup(db, make_session):
+    _, qs = make_session(1, rubric="캐시,인덱스")
+    statements = []
+
+    def _record(_conn, _cursor, statement, *_):
+        statements.append(statement)
+
+    from app.main import app
+    with TestClient(app) as client:
+        body = {"question_id": qs[0].id, "transcript": "캐시를 적용했습니다", "duration_sec": 5}
+        assert client.post("/api/answers", json=body).status_code == 200  # 첫 요청: 캐시 채움
+        before = rubric_cache.stats()
+        for e in {async_engine.sync_engine, async_write_engine.sync_engine}:
+            event.listen(e, "before_cursor_execute", _record)
+        try:
+            r = client.post("/api/answers", json=body)
+        finally:
+            for e in {async_engine.sync_engine, async_write_engine.sync_engine}:
+                event.remove(e, "before_cursor_execute", _record)
+        assert r.json()["analytics"]["keyword_hit_rate"] == 0.5
+        assert not [s for s in statements if "FROM questions" in s]
+        assert rubric_cache.stats()["hits"] == before["hits"] + 1
+
+        # ORM 으로 질문을 수정하면 무효화 → 다음 조회는 새 루브릭
+        qs[0].rubric_keywords = "캐시"
+        db.commit()
+        assert rubric_cache.peek(qs[0].id) is None
+        assert client.post("/api/answers", json=body).json()["analytics"]["keyword_hit_rate"] == 1.0
+        assert client.post("/api/answers", json={**body, "question_id": 10**9}).status_code == 404
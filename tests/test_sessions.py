@@ -0,0 +1,68 @@
+from datetime import datetime, timedelta
+
+from fastapi.testclient import TestClient
+
+from app.core.auth import make_tokens
+from app.db import models as m
+
+def test_list_my_sessions_keyset_pages(db):
+    u = m.User(email="pager@example.com", password_hash="x")
+    db.add(u); db.flush()
+    t0 = datetime(2025, 1, 1)
+    # 같은 created_at 이 섞여 있어도 (created_at, id) 기준으로 빠짐/중복 없이 넘겨야 함
+    sessions = [
+        m.Session(role="be", job_title="BE", level="junior", difficulty="medium", user_id=u.id,
+                  company="Kakao" if i % 2 else "Naver", created_at=t0 + timedelta(minutes=i // 3))
+        for i in range(25)
+    ]
+    db.add_all(sessions); db.flush()
+    db.add(m.Question(session_id=sessions[-1].id, text="Q", rubric_keywords="", difficulty="medium"))
+    db.commit()
+
+    from app.main import app
+    client = TestClient(app)
+    client.cookies.set("access_token", make_tokens(u.id)[0])
+
+    seen, cursor = [], None
+    while True:
+        params = {"limit": 10, **({"cursor": cursor} if cursor else {})}
+        page = client.get("/api/sessions/mine", params=params).json()
+        seen += [it["id"] for it in page["items"]]
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    expected = [s.id for s in sorted(sessions, key=lambda s: (s.created_at, s.id), reverse=True)]
+    assert seen == expected
+
+    page = client.get("/api/sessions/mine", params={"limit": 1, "with_counts": True}).json()
+    assert page["items"][0]["question_count"] == 1
+    assert page["items"][0]["answered_count"] == 0
+
+    kakao = client.get("/api/sessions/mine", params={"company": "Kakao", "limit": 100}).json()
+    assert len(kakao["items"]) == 12 and kakao["next_cursor"] is None
+    assert client.get("/api/sessions/mine", params={"cursor": "bogus"}).status_code == 400
+
+def test_create_session_returns_question_ids_in_order(db):
+    u = m.User(email="bulk@example.com", password_hash="x")
+    db.add(u); db.commit()
+    from app.main import app
+    with TestClient(app) as client:
+        client.cookies.set("access_token", make_tokens(u.id)[0])
+        r = client.post("/api/sessions", json={"role": "data", "job_title": "DE", "stack": ["spark"]}).json()
+    rows = db.query(m.Question).filter(m.Question.session_id == r["session_id"]).order_by(m.Question.id).all()
+    assert [q["id"] for q in r["questions"]] == [q.id for q in rows]
+    assert [q["text"] for q in r["questions"]] == [q.text for q in rows]
+
+def test_create_session_skips_questions_from_recent_sessions(db, monkeypatch):
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "QUESTION_SEEN_SESSIONS", 1)
+    u = m.User(email="seen@example.com", password_hash="x")
+    db.add(u); db.commit()
+    from app.main import app
+    with TestClient(app) as client:
+        client.cookies.set("access_token", make_tokens(u.id)[0])
+        body = {"role": "backend", "job_title": "BE", "stack": ["redis"]}
+        first, second = (
+            {q["text"] for q in client.post("/api/sessions", json=body).json()["questions"]} for _ in range(2)
+        )
+    assert first and not first & second  # 직전 세션 질문은 다시 나오지 않음
@@ -0,0 +1,111 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import numpy as np
+
+from app.services import stt_long
+from app.services.stt_models import ModelRegistry
+from app.services.stt_pool import SttWorkerPool
+
+SR = stt_long.SR
+
+def _runs(audio):
+    """값이 같은 0 아닌 연속 구간 → (값, start, end) 샘플"""
+    edges = np.flatnonzero(np.diff(audio)) + 1
+    bounds = [0, *edges.tolist(), len(audio)]
+    return [(int(audio[a]), a, b) for a, b in zip(bounds, bounds[1:]) if audio[a] != 0]
+
+class FakeModel:
+    """구간 값 k 를 단어 'w{k}' 로 '인식'"""
+    def transcribe(self, audio, language="ko", vad_filter=True):
+        segs = [SimpleNamespace(text=f" w{k}", start=a / SR, end=b / SR, avg_logprob=-0.1) for k, a, b in _runs(audio)]
+        return iter(segs), SimpleNamespace(duration=len(audio) / SR)
+
+def _fake_regions(audio):
+    return [{"start": a, "end": b} for _, a, b in _runs(audio)]
+
+def _transcribe(audio, monkeypatch):
+    monkeypatch.setattr(stt_long, "_load_audio", lambda path: audio)
+    monkeypatch.setattr(stt_long, "_speech_regions", _fake_regions)
+    pool = SttWorkerPool(workers=3, queue_size=4, registry=ModelRegistry(loader=lambda size: FakeModel(), warmer=None))
+    try:
+        return asyncio.run(stt_long.transcribe_long("x.wav", pool=pool)), pool.stats()["submitted"]
+    finally:
+        pool.shutdown()
+
+def test_chunks_split_on_silence(monkeypatch):
+    # 1초 단어 + 1초 무음 × 100 (200초)
+    audio = np.concatenate([np.r_[np.full(SR, k, np.float32), np.zeros(SR, np.float32)] for k in range(1, 101)])
+    (text, duration), n_chunks = _transcribe(audio, monkeypatch)
+    assert text == " ".join(f"w{k}" for k in range(1, 101))
+    assert duration == 200.0 and n_chunks > 3
+
+def test_continuous_speech_overlap_is_deduplicated(monkeypatch):
+    audio = np.concatenate([np.full(SR, k, np.float32) for k in range(1, 151)])  # 무음 없는 150초
+    (text, _), n_chunks = _transcribe(audio, monkeypatch)
+    assert text == " ".join(f"w{k}" for k in range(1, 151))
+    assert n_chunks > 3
+
+def test_plan_and_merge_timestamps():
+    chunks = stt_long.plan_chunks([{"start": 0, "end": 100 * SR}], target=30 * SR, overlap=SR)
+    assert chunks[0] == (0, 30 * SR) and chunks[1] == (29 * SR, 59 * SR) and chunks[-1][1] == 100 * SR
+    segs = stt_long.transcribe_chunk(np.full(SR, 7, np.float32), 29.0, model=FakeModel())
+    assert segs == [{"text": "w7", "start": 29.0, "end": 30.0, "avg_logprob": -0.1}]
+
+def test_failed_chunk_cancels_the_rest(monkeypatch):
+    class FlakyModel(FakeModel):
+        def transcribe(self, audio, language="ko", vad_filter=True):
+            if audio[0] == 1:
+                raise RuntimeError("boom")
+            time.sleep(0.05)
+            return super().transcribe(audio, language, vad_filter)
+
+    audio = np.concatenate([np.r_[np.full(SR, k, np.float32), np.zeros(SR, np.float32)] for k in range(1, 301)])
+    monkeypatch.setattr(stt_long, "_load_audio", lambda path: audio)
+    monkeypatch.setattr(stt_long, "_speech_regions", _fake_regions)
+    pool = SttWorkerPool(workers=3, queue_size=4, registry=ModelRegistry(loader=lambda size: FlakyModel(), warmer=None))
+
+    async def go():
+        try:
+            await stt_long.transcribe_long("x.wav", pool=pool)
+        except RuntimeError:
+            pass
+        await asyncio.sleep(0.3)  # 남은 청크가 계속 돌았다면 이 사이에 더 제출됨
+        return pool.stats()["submitted"]
+
+    try:
+        assert asyncio.run(go()) <= pool.workers + 1  # 실패 전에 이미 들어간 것만(청크는 20개 이상)
+    finally:
+        pool.shutdown()
+
+def test_on_submit_waits_until_pool_accepts(monkeypatch):
+    import threading
+    monkeypatch.setattr(stt_long, "QUEUE_RETRY_SEC", 0.01)
+    gate = threading.Event()
+    pool = SttWorkerPool(workers=1, queue_size=1, registry=ModelRegistry(loader=lambda size: None, warmer=None))
+    calls = []
+
+    async def on_submit():
+        calls.append(pool.stats()["submitted"])
+
+    async def go():
+        blockers = [pool.submit_nowait(lambda model=None: gate.wait(5))]
+        while pool.stats()["in_flight"] == 0:
+            await asyncio.sleep(0.01)
+        blockers.append(pool.submit_nowait(lambda model=None: None))  # 대기열 가득
+        usage = stt_long.SttUsage(on_submit=on_submit)
+        task = asyncio.create_task(stt_long._submit(pool, lambda model=None: "ok", retry_when_full=True, usage=usage))
+        await asyncio.sleep(0.1)
+        assert calls == []  # 재시도 중에는 아직 아님
+        gate.set()
+        assert await task == "ok"
+        return usage
+
+    try:
+        usage = asyncio.run(go())
+        assert usage.submitted == 1 and calls == [3]
+        assert 0 < usage.run_sec < 0.05  # 대기열에서 기다린 시간(0.1초 이상)은 빠짐
+    finally:
+        gate.set()
+        pool.shutdown()
@@ -0,0 +1,75 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.services.stt_models import ModelRegistry
+from app.services.stt_pool import SttWorkerPool, SttQueueFull
+
+def _registry(**kw):
+    return ModelRegistry(loader=lambda size: f"model-{size}", warmer=None, **kw)
+
+def test_pool_runs_jobs_with_requested_model():
+    pool = SttWorkerPool(workers=2, queue_size=4, registry=_registry())
+
+    def job(x, model=None):
+        return x * 2, model
+
+    async def run():
+        return await asyncio.gather(*(pool.submit(job, i, model_size="tiny" if i % 2 else None) for i in range(4)))
+
+    try:
+        results = asyncio.run(run())
+        with pytest.raises(ValueError):
+            pool.submit_nowait(job, 0, model_size="huge")
+    finally:
+        pool.shutdown()
+    assert results == [(0, "model-small"), (2, "model-tiny"), (4, "model-small"), (6, "model-tiny")]
+    st = pool.stats()
+    assert st["completed"] == 4 and st["queue_depth"] == 0
+    assert st["models"]["loads"] == 2
+
+def test_registry_loads_once_and_evicts_idle_lru():
+    loads = []
+
+    def slow_loader(size):
+        loads.append(size)
+        time.sleep(0.05)
+        return f"model-{size}"
+
+    reg = ModelRegistry(loader=slow_loader, warmer=None, budget_mb=600)  # small(480)+tiny(75) 까지
+    threads = [threading.Thread(target=reg.get, args=("small",)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert loads == ["small"]  # 동시 첫 요청에도 한 번만 로드
+
+    reg.get("tiny")
+    assert reg.stats()["loaded"] == ["small", "tiny"]
+    with reg.use("small"):
+        reg.get("base")  # 초과 → 사용 중인 small 은 두고 가장 오래된 idle(tiny) 부터
+        assert reg.stats()["loaded"] == ["small", "base"]
+    reg.get("medium")  # small/base 모두 idle → 둘 다 내려도 medium 혼자 초과(허용)
+    assert reg.stats()["loaded"] == ["medium"] and reg.stats()["evictions"] == 3
+
+def test_pool_rejects_when_queue_full():
+    pool = SttWorkerPool(workers=1, queue_size=1, registry=_registry())
+    gate = threading.Event()
+    started = threading.Event()
+
+    def block(model=None):
+        started.set()
+        gate.wait(5)
+
+    try:
+        pool.submit_nowait(block)
+        started.wait(5)
+        pool.submit_nowait(block)  # 대기열 1칸 사용
+        with pytest.raises(SttQueueFull):
+            pool.submit_nowait(block)
+        assert pool.stats()["rejected"] == 1
+    finally:
+        gate.set()
+        pool.shutdown()
@@ -0,0 +1,186 @@
+import asyncio
+import io
+import os
+import json
+import time
+
+from fastapi.testclient import TestClient
+
+from app.db import models as m
+from app.services import stt_long, transcription_jobs as tj
+from app.services.stt_pool import stt_pool
+
+def _fake_transcribe(path, language="ko", model=None):
+    return "캐시를 적용해 문제를 해결했습니다", 6.0
+
+def _fake_segments(path, language="ko", model=None):
+    segs = [
+        {"text": "캐시를 적용해", "start": 0.0, "end": 2.5, "avg_logprob": -0.2},
+        {"text": "문제를 해결했습니다", "start": 2.5, "end": 6.0, "avg_logprob": -0.3},
+    ]
+    return iter(segs), 6.0
+
+def _wait_done(client, job_id):
+    for _ in range(100):
+        job = client.get(f"/api/uploads/jobs/{job_id}").json()
+        if job["status"] in tj.TERMINAL:
+            return job
+        time.sleep(0.05)
+    raise AssertionError("job did not finish")
+
+def test_async_upload_and_resume(monkeypatch, db, make_session, tmp_path):
+    monkeypatch.setattr(stt_long, "transcribe_audio", _fake_transcribe)
+    monkeypatch.setattr(stt_pool.registry, "_loader", lambda size: None)
+    from app.api.routes import uploads
+    monkeypatch.setattr(uploads, "UPLOAD_DIR", str(tmp_path))
+    _, qs = make_session(1)
+
+    # 재시작 전에 running 상태로 남은 작업
+    audio = tmp_path / "a.wav"
+    audio.write_bytes(b"RIFF")
+    stale = m.TranscriptionJob(id="stale", question_id=qs[0].id, audio_path=str(audio), language="ko",
+                               status="running", result="", error="")
+    db.add(stale); db.commit()
+
+    from app.main import app
+    with TestClient(app) as client:
+        job = _wait_done(client, stale.id)
+        assert job["status"] == "done"
+        assert job["result"]["analytics"]["keyword_hit_rate"] == 0.5
+
+        r = client.post(
+            "/api/uploads/audio",
+            data={"question_id": qs[0].id, "mode": "async"},
+            files={"file": ("a.wav", io.BytesIO(b"RIFF"), "audio/wav")},
+        )
+        assert r.status_code == 202
+        job_id = r.json()["job_id"]
+        with client.stream("GET", f"/api/uploads/jobs/{job_id}/events") as resp:
+            body = "".join(resp.iter_text())
+        assert '"status": "done"' in body
+        from app.services import transcription_jobs
+        assert job_id not in transcription_jobs._events  # 종료 상태까지 본 SSE 는 이벤트를 남기지 않음
+        answer_id = _wait_done(client, job_id)["answer_id"]
+
+    ans = db.get(m.Answer, answer_id)
+    assert ans.type == "audio" and ans.analytics is not None
+
+def test_stream_upload_ndjson(monkeypatch, db, make_session, tmp_path):
+    from app.api.routes import uploads
+    monkeypatch.setattr(uploads, "transcribe_segments", _fake_segments)
+    monkeypatch.setattr(uploads, "UPLOAD_DIR", str(tmp_path))
+    monkeypatch.setattr(stt_pool.registry, "_loader", lambda size: None)
+    _, qs = make_session(1)
+
+    from app.main import app
+    with TestClient(app) as client:
+        with client.stream(
+            "POST", "/api/uploads/audio/stream",
+            data={"question_id": qs[0].id},
+            files={"file": ("a.wav", io.BytesIO(b"RIFF-stream"), "audio/wav")},  # 다른 테스트와 겹치지 않게(전사 캐시)
+        ) as resp:
+            lines = [json.loads(l) for l in resp.iter_lines() if l]
+
+    assert [l["type"] for l in lines] == ["start", "segment", "segment", "done"]
+    done = lines[-1]
+    assert done["transcript"] == "캐시를 적용해 문제를 해결했습니다"
+    assert db.get(m.Answer, done["answer_id"]).duration_sec == 6.0
+
+def test_raw_upload_single_write_and_size_limit(monkeypatch, db, make_session, tmp_path):
+    from app.api.routes import uploads
+    seen = []
+    monkeypatch.setattr(stt_long, "transcribe_audio", lambda src, language="ko", model=None: (seen.append(src), _fake_transcribe(src))[1])
+    monkeypatch.setattr(stt_pool.registry, "_loader", lambda size: None)
+    monkeypatch.setattr(uploads, "UPLOAD_DIR", str(tmp_path))
+    monkeypatch.setattr(uploads.settings, "UPLOAD_CHUNK_KB", 1)
+    _, qs = make_session(1)
+    body = b"RIFF" + bytes(5000)
+
+    from app.main import app
+    with TestClient(app) as client:
+        r = client.post(
+            f"/api/uploads/audio/raw?question_id={qs[0].id}",
+            content=iter([body[:3000], body[3000:]]), headers={"Content-Type": "audio/webm"},
+        )
+        assert r.status_code == 200
+        assert r.json()["file"].endswith(".webm")
+        assert (tmp_path / r.json()["file"]).read_bytes() == body
+        assert seen == [body]  # 짧은 파일은 디스크를 다시 읽지 않고 메모리에서 디코딩
+        assert db.get(m.Answer, r.json()["answer_id"]).audio_url.endswith(r.json()["file"])
+
+        # 상한은 스트리밍 중(Content-Length 없음)에도 적용, 부분 파일은 남기지 않음
+        monkeypatch.setattr(uploads.settings, "UPLOAD_MAX_MB", 0)
+        r = client.post(f"/api/uploads/audio/raw?question_id={qs[0].id}", content=iter([body]))
+        assert r.status_code == 413
+        assert len(list(tmp_path.iterdir())) == 1
+
+def test_duplicate_upload_reuses_transcript_and_file(monkeypatch, make_session, tmp_path):
+    from app.api.routes import uploads
+    from app.services import transcript_cache
+    calls = []
+    monkeypatch.setattr(stt_long, "transcribe_audio", lambda src, language="ko", model=None: (calls.append(1), _fake_transcribe(src))[1])
+    monkeypatch.setattr(stt_pool.registry, "_loader", lambda size: None)
+    monkeypatch.setattr(uploads, "UPLOAD_DIR", str(tmp_path))
+    _, qs = make_session(2)
+    before = transcript_cache.stats()
+
+    from app.main import app
+    with TestClient(app) as client:
+        outs = [
+            client.post(
+                "/api/uploads/audio",
+                data={"question_id": q.id},
+                files={"file": ("retry.wav", io.BytesIO(b"RIFF-dup"), "audio/wav")},
+            ).json()
+            for q in qs
+        ]
+        stats = client.get("/api/uploads/stt/cache/stats").json()
+
+    assert len(calls) == 1  # 두 번째는 Whisper 를 다시 돌리지 않음
+    assert outs[0]["transcript"] == outs[1]["transcript"] and outs[0]["answer_id"] != outs[1]["answer_id"]
+    assert outs[0]["file"] == outs[1]["file"] and [p.name for p in tmp_path.iterdir()] == [outs[0]["file"]]
+    assert stats["hits"] == before["hits"] + 1 and stats["stt_sec_saved"] >= before["stt_sec_saved"]
+
+def test_finalize_gives_one_owner_per_blob(monkeypatch, tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+    from app.api.routes import uploads
+    monkeypatch.setattr(uploads, "UPLOAD_DIR", str(tmp_path))
+    parts = []
+    for i in range(8):
+        p = tmp_path / f"{i}.part"
+        p.write_bytes(b"same")
+        parts.append(str(p))
+    with ThreadPoolExecutor(8) as ex:
+        results = list(ex.map(lambda p: uploads._finalize(p, "h", ".wav"), parts))
+    assert sum(created for _, _, created in results) == 1  # 동시에 올라와도 새로 만든 요청은 하나
+    assert sorted(os.listdir(tmp_path)) == ["h.wav"]
+
+def test_cache_hits_are_counted_in_batches(db):
+    from app.services import transcript_cache as tc
+
+    async def go():
+        await tc.store("hits-batch", "small", "ko", "캐시", 3.0, 1.5)
+        for _ in range(3):
+            assert await tc.lookup("hits-batch", "small", "ko") == ("캐시", 3.0)
+        before = db.query(m.TranscriptCache).filter_by(audio_hash="hits-batch").one().hits
+        await tc.flush_hits()
+        return before
+
+    assert asyncio.run(go()) == 0  # 적중마다 UPDATE 하지 않음
+    db.expire_all()
+    assert db.query(m.TranscriptCache).filter_by(audio_hash="hits-batch").one().hits == 3
+
+def test_finish_after_question_deleted_fails_the_job(db, make_session):
+    _, qs = make_session(1)
+    qid = qs[0].id
+    job = m.TranscriptionJob(id="orphan", question_id=qid, audio_path="x.wav", language="ko",
+                             status="running", result="", error="")
+    db.add(job); db.commit()
+    db.execute(m.Question.__table__.delete().where(m.Question.id == qid)); db.commit()  # 전사 도중 질문 삭제
+    from app.services.rubric_cache import rubric_cache
+    rubric_cache.invalidate(qid)
+    asyncio.run(tj._finish("orphan", "캐시", 1.0))
+    db.expire_all()
+    job = db.get(m.TranscriptionJob, "orphan")
+    assert job.status == "failed" and job.error == "question not found"  # 재시작 때 다시 전사하지 않음
+    assert db.query(m.Answer).filter_by(question_id=qid).count() == 0